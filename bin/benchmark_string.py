@@ -0,0 +1,66 @@
+#!/bin/env/python
+# -*- coding: utf-8 -*-
+"""
+    benchmark_string.py
+    ~~~~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+
+    compares construction and validation throughput of the native str based String against the newstr based String
+    that is used on Python 2. run from the repository root: ``python bin/benchmark_string.py``
+"""
+import os
+import sys
+import timeit
+
+from future.types.newstr import newstr
+from future.utils import with_metaclass, PY3
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from prestans3.types import ImmutableType  # noqa: E402
+from prestans3.types.string import String, MergingStrMeta  # noqa: E402
+
+
+# noinspection PyAbstractClass
+class NewStrString(with_metaclass(MergingStrMeta, ImmutableType, newstr)):
+    """ the newstr based String, as selected on Python 2 """
+
+    def __init__(self, value=u'', encoding=None):
+        newstr.__init__(value, encoding)
+        super(NewStrString, self).__init__()
+
+
+# share String's property rules with the newstr based class
+for _name, _rule in list(String.property_rules.own_items()):
+    NewStrString.property_rules[_name] = _rule
+
+_config = String.property(min_length=1, max_length=64, format_regex=r'[a-z ]+').rules_config
+_value = u'the quick brown fox'
+
+
+def _bench(label, statement, number):
+    seconds = min(timeit.repeat(statement, number=number, repeat=5))
+    print("{:<40} {:>12,.0f} ops/s".format(label, number / seconds))
+    return seconds
+
+
+def main(number=100000):
+    if not PY3:
+        print("String is newstr based on Python 2, nothing to compare")
+        return
+    for cls in [NewStrString, String]:
+        print(cls.__name__)
+        instance = cls(_value)
+        _bench('  construct', lambda: cls(_value), number)
+        _bench('  validate', lambda: instance.validate(_config), number)
+        _bench('  len', lambda: len(instance), number)
+        _bench('  hash', lambda: hash(instance), number)
+        _bench('  compare', lambda: instance == _value, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/bin/env/python
+# -*- coding: utf-8 -*-
+"""
+    benchmark_temporal.py
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+
+    compares ISO-8601 string coercion of Date, DateTime and Time against :meth:`datetime.datetime.strptime`, and bulk
+    construction against constructing one instance at a time. run from the repository root:
+    ``python bin/benchmark_temporal.py``
+"""
+import os
+import sys
+import timeit
+from datetime import date, datetime
+
+from future.utils import PY3
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from prestans3.types import Array, Date, DateTime, TemporalArray, Time  # noqa: E402
+from prestans3.types.temporal import _parse_iso_date, _parse_iso_datetime, _parse_iso_time  # noqa: E402
+
+
+def _bench(label, statement, number):
+    seconds = min(timeit.repeat(statement, number=number, repeat=5))
+    print("{:<40} {:>12,.0f} ops/s".format(label, number / seconds))
+    return seconds
+
+
+def main(number=100000):
+    print("parsing")
+    _bench('  _parse_iso_date', lambda: _parse_iso_date('2016-08-15'), number)
+    _bench('  _parse_iso_time', lambda: _parse_iso_time('13:45:30'), number)
+    _bench('  _parse_iso_datetime', lambda: _parse_iso_datetime('2016-08-15T13:45:30.123456+10:00'), number)
+    print("coercion, including construction and validation of the instance")
+    _bench('  Date.from_value', lambda: Date.from_value('2016-08-15'), number)
+    _bench('  strptime %Y-%m-%d', lambda: datetime.strptime('2016-08-15', '%Y-%m-%d').date(), number)
+    _bench('  Time.from_value', lambda: Time.from_value('13:45:30'), number)
+    _bench('  strptime %H:%M:%S', lambda: datetime.strptime('13:45:30', '%H:%M:%S').time(), number)
+    _bench('  DateTime.from_value', lambda: DateTime.from_value('2016-08-15T13:45:30'), number)
+    _bench('  strptime %Y-%m-%dT%H:%M:%S', lambda: datetime.strptime('2016-08-15T13:45:30', '%Y-%m-%dT%H:%M:%S'),
+           number)
+    _bench('  DateTime.from_value with offset', lambda: DateTime.from_value('2016-08-15T13:45:30.123456+10:00'),
+           number)
+    # py2to3 remove if, strptime accepts ±HH:MM offsets for %z from python 3.7
+    if PY3 and sys.version_info >= (3, 7):
+        _bench('  strptime %Y-%m-%dT%H:%M:%S.%f%z',
+               lambda: datetime.strptime('2016-08-15T13:45:30.123456+10:00', '%Y-%m-%dT%H:%M:%S.%f%z'), number)
+
+    print("bulk construction of 1,000 instances")
+    ordinals = list(range(736000, 737000))
+    timestamps = [1471268730.5 + offset * 3600 for offset in range(1000)]
+    _bench('  Date.from_ordinals', lambda: Date.from_ordinals(ordinals), number // 1000)
+    _bench('  Date per item', lambda: [Date(*date.fromordinal(o).timetuple()[:3]) for o in ordinals], number // 1000)
+    _bench('  DateTime.from_timestamps', lambda: DateTime.from_timestamps(timestamps), number // 1000)
+    _bench('  DateTime per item', lambda: [DateTime.from_value(datetime.fromtimestamp(t)) for t in timestamps],
+           number // 1000)
+    print("validating after and before element rules of 1,000 dates")
+    rules = {'element_rules': {'after': Date(2000, 1, 1), 'before': Date(2100, 1, 1)}}
+    days = Array(Date, Date.from_ordinals(ordinals))
+    compact_days = TemporalArray(Date, days)
+    _bench('  Array', lambda: days.validate(rules), number // 1000)
+    _bench('  TemporalArray', lambda: compact_days.validate(rules), number // 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -133,6 +133,9 @@ rst_epilog = """
 .. |Temporal|  replace:: :class:`Temporal<.temporal.Temporal>`
 .. |Temporals|  replace:: :class:`Temporals<.temporal.Temporal>`
 
+.. |TemporalArray|  replace:: :class:`TemporalArray<.temporal_array.TemporalArray>`
+.. |TemporalArrays|  replace:: :class:`TemporalArrays<.temporal_array.TemporalArray>`
+
 .. |Date|  replace:: :class:`Date<.p_date.Date>`
 .. |Dates|  replace:: :class:`Dates<.p_date.Date>`
 
@@ -158,6 +161,11 @@ rst_epilog = """
 
 .. |ValidationException| replace:: :class:`ValidationException<.ValidationException>`
 .. |ValidationExceptions| replace:: :class:`ValidationExceptions<.ValidationException>`
+.. |ValidationMessage| replace:: :class:`ValidationMessage<.ValidationMessage>`
+.. |ValidationMessages| replace:: :class:`ValidationMessages<.ValidationMessage>`
+.. |IndexRanges| replace:: :class:`IndexRanges<.IndexRanges>`
+.. |ValidationResult| replace:: :class:`ValidationResult<.ValidationResult>`
+.. |ValidationResults| replace:: :class:`ValidationResults<.ValidationResult>`
 
 .. |AccessError|  replace:: :class:`AccessError`<.AccessError>`
 .. |AccessErrors|  replace:: :class:`AccessErrors`<.AccessError>`
@@ -189,6 +197,11 @@ rst_epilog = """
 .. |ImmutableMergingDictionary|  replace:: :class:`ImmutableMergingDictionary<.ImmutableMergingDictionary>`
 .. |ImmutableMergingDictionaries|  replace:: :class:`ImmutableMergingDictionaries<.ImmutableMergingDictionary>`
 
+.. |FullMatchRegex|  replace:: :class:`FullMatchRegex<.regex.FullMatchRegex>`
+.. |LinearRegex|  replace:: :class:`LinearRegex<.regex.LinearRegex>`
+
+.. |Choices|  replace:: :class:`Choices<.choices.Choices>`
+
 """
 
 
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+    prestans3.choices
+    ~~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+"""
+import unicodedata
+from bisect import bisect_left
+
+from .utils import is_str
+
+
+class Choices(object):
+    """
+    An indexed configuration of the ``choices`` rule, built once when a |_Property| is created. hashable choices are
+    kept in a ``frozenset``, unhashable but orderable choices in a sorted list that is searched by bisection. membership
+    of any other choices is checked by comparing against each choice.
+
+    string choices and the values checked against them may optionally be unicode normalized and case folded, for
+    example to accept ``'au'`` for a choice of ``'AU'``:
+
+    >>> from prestans3.choices import Choices
+    >>> from prestans3.types import String
+    >>> country = String.property(choices=Choices(['AU', 'NZ'], casefold=True))
+    """
+
+    message_limit = 10
+    """ the number of choices listed in a validation message before the remainder are summarised """
+
+    def __init__(self, choices, casefold=False, normalize=None):
+        """
+        :param choices: the valid values
+        :type choices: iterable
+        :param bool casefold: whether ``str`` choices and values are compared case insensitively
+        :param str normalize: a :func:`unicodedata.normalize` form (e.g. ``'NFC'``) applied to ``str`` choices and
+                              values before they are compared
+        """
+        self.choices = tuple(choices)
+        self.casefold = casefold
+        self.normalize = normalize
+        keys = [self._key(choice) for choice in self.choices]
+        self._hashed = None
+        self._sorted = None
+        try:
+            self._hashed = frozenset(keys)
+        except TypeError:
+            try:
+                self._sorted = sorted(keys)
+            except TypeError:
+                self._keys = keys
+        else:
+            self._keys = None
+
+    @classmethod
+    def from_config(cls, config):
+        """ returns `config` if it is already a |Choices| index, otherwise indexes the iterable `config` """
+        return config if isinstance(config, Choices) else cls(config)
+
+    @property
+    def transforms(self):
+        """ ``True`` if ``str`` values are normalized or case folded before they are compared """
+        return self.casefold or self.normalize is not None
+
+    def _key(self, value):
+        # py2to3 replace is_str with isinstance(x, str)
+        if not self.transforms or not is_str(value):
+            return value
+        if self.normalize is not None:
+            value = unicodedata.normalize(self.normalize, value)
+        if self.casefold:
+            value = value.casefold() if hasattr(value, 'casefold') else value.lower()
+        return value
+
+    def __contains__(self, value):
+        key = self._key(value)
+        if self._hashed is not None:
+            try:
+                return key in self._hashed
+            except TypeError:
+                return any(key == choice for choice in self._hashed)
+        elif self._sorted is not None:
+            try:
+                index = bisect_left(self._sorted, key)
+                return index < len(self._sorted) and self._sorted[index] == key
+            except TypeError:
+                return any(key == choice for choice in self._sorted)
+        return any(key == choice for choice in self._keys)
+
+    def contains_all(self, values):
+        """ ``True`` if every value in `values` is one of the choices """
+        if self._hashed is not None:
+            try:
+                if self.transforms:
+                    return self._hashed.issuperset(map(self._key, values))
+                return self._hashed.issuperset(values)
+            except TypeError:
+                pass
+        return all(value in self for value in values)
+
+    def __iter__(self):
+        return iter(self.choices)
+
+    def __len__(self):
+        return len(self.choices)
+
+    def __eq__(self, other):
+        if isinstance(other, Choices):
+            return (self.choices, self.casefold, self.normalize) == (other.choices, other.casefold, other.normalize)
+        return list(self.choices) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def format(self, limit=None):
+        """
+        lists the choices for a validation message, summarising any beyond `limit`
+
+        :param int limit: the number of choices to list, defaults to :attr:`message_limit`
+        :rtype: str
+        """
+        if limit is None:
+            limit = self.message_limit
+        listed = ", ".join(str(choice) for choice in self.choices[:limit])
+        if len(self.choices) > limit:
+            listed += ", ... ({} more)".format(len(self.choices) - limit)
+        return listed
+
+    def __str__(self):
+        return self.format()
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self.format())
@@ -8,23 +8,187 @@
     :copyright: (c) 2016 Anomaly Software
     :license: Apache 2.0, see LICENSE for more details.
 """
-import re
+from bisect import bisect_right
+
+from future.utils import integer_types, string_types
+
+
+class IndexRanges(tuple):
+    """
+    a compressed set of array indices, used as the location of the elements of an |Array| that failed validation in
+    the same way. a sorted tuple of inclusive ``(first, last)`` ranges that renders as ``0-4,7``
+
+    >>> from prestans3.errors import IndexRanges
+    >>> ranges = IndexRanges.from_indices([0, 1, 2, 3, 4, 7])
+    >>> str(ranges), ranges.count
+    ('0-4,7', 6)
+    """
+
+    @classmethod
+    def from_indices(cls, indices):
+        """
+        :param indices: the indices, in ascending order
+        :type indices: iterable[int]
+        """
+        ranges = []
+        for index in indices:
+            if ranges and ranges[-1][1] == index - 1:
+                ranges[-1][1] = index
+            else:
+                ranges.append([index, index])
+        return tuple.__new__(cls, (tuple(each) for each in ranges))
+
+    def indices(self):
+        """ :yields: each index, in ascending order """
+        for first, last in self:
+            for index in range(first, last + 1):
+                yield index
+
+    @property
+    def count(self):
+        """ :return: the number of indices """
+        return sum(last - first + 1 for first, last in self)
+
+    def __str__(self):
+        return ','.join(str(first) if first == last else '{}-{}'.format(first, last) for first, last in self)
+
+
+def _dotted_name(type_name, path):
+    """
+    :return: the fully qualified name of the location `path` within the |type| named `type_name`, attribute names are
+             joined with dots and array indices are subscripted, for example ``MyModel.some_array[3].some_string``
+    """
+    # py2to3 replace integer_types with int
+    return type_name + ''.join('[{}]'.format(segment) if isinstance(segment, (IndexRanges,) + integer_types)
+                               else '.{}'.format(segment) for segment in path)
+
+
+def json_pointer(path):
+    """
+    renders a location within a validation tree as a `JSON Pointer <https://tools.ietf.org/html/rfc6901>`_
+
+    >>> from prestans3.errors import json_pointer
+    >>> json_pointer(('some_array', 3, 'some/string'))
+    '/some_array/3/some~1string'
+
+    :param path: the attribute names and array indices leading to the location
+    :type path: tuple[str or int]
+    :rtype: str
+    """
+    return ''.join('/' + str(segment).replace('~', '~0').replace('/', '~1') for segment in path)
+
+
+class ValidationMessage(object):
+    """
+    a validation message kept as the id and template of its message and the arguments to format it with, so that it
+    is only rendered when it is converted to a ``str``\ , as the summaries and messages of a |ValidationException|
+    are. each argument is truncated to :attr:`argument_limit` characters when rendered, so that large values do not
+    produce large messages
+
+    >>> from prestans3.errors import ValidationMessage
+    >>> message = ValidationMessage('string.max_length', 'len("{}") is more than {}', ('spam' * 100, 10))
+    >>> len(str(message)) < 400
+    True
+
+    a message compares equal to its rendered ``str``
+    """
+    __slots__ = ('template_id', 'template', 'args', '_rendered')
+
+    argument_limit = 200
+    """ the number of characters of each argument included in the rendered message, ``None`` for no limit """
+
+    def __init__(self, template_id, template, args=()):
+        """
+        :param str template_id: identifies the template, for clients that present their own messages
+        :param str template: the message, a :meth:`str.format` template of positional fields
+        :param tuple args: the arguments the template is formatted with
+        """
+        self.template_id = template_id
+        self.template = template
+        self.args = args
+        self._rendered = None
+
+    def __str__(self):
+        if self._rendered is None:
+            self._rendered = self.template.format(*[self._render_argument(arg) for arg in self.args])
+        return self._rendered
+
+    def _render_argument(self, arg):
+        text = '{}'.format(arg)
+        limit = self.argument_limit
+        if limit is not None and len(text) > limit:
+            return '{}... ({} more characters)'.format(text[:limit], len(text) - limit)
+        return text
+
+    def __eq__(self, other):
+        if isinstance(other, ValidationMessage):
+            return str(self) == str(other)
+        # py2to3 replace string_types with str
+        elif isinstance(other, string_types):
+            return str(self) == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __repr__(self):
+        return "{}({!r}, {!r})".format(self.__class__.__name__, self.template_id, str(self))
+
+
+def _rendered(message):
+    """ :return: `message` as a ``str``\ , rendering a |ValidationMessage| """
+    # py2to3 replace string_types with str
+    return message if isinstance(message, string_types) else str(message)
 
 
 class ValidationExceptionSummary(tuple):
     """
     Returned when iterating through a |ValidationException|. Each ValidationExceptionSummary is a
-    (``str``, list[str]) which represents a fully qualified name and its list of exception messages
+    (``str``, list[str]) which represents a fully qualified name and its list of exception messages. the location is
+    also kept as :attr:`path`, a tuple of attribute names and array indices, so that it is only formatted once
     """
 
     # noinspection PyInitNewSignature
-    def __new__(cls, fqn, messages):
+    def __new__(cls, fqn, messages, path=None):
         """
         :param str fqn: the fully qualified name of the class or property with an exception
         :param messages: The exception detailing the leaf property and it's validation message
         :type messages: list[str]
+        :param path: the attribute names and array indices leading from the root |type| to the property, if known
+        :type path: tuple[str or int]
+        """
+        summary = tuple.__new__(cls, (fqn, messages))
+        summary.path = path
+        return summary
+
+    @classmethod
+    def from_path(cls, type_name, path, messages):
+        """
+        :param str type_name: the name of the root |type| of the validation tree
+        :param path: the attribute names and array indices leading from the root |type| to the property
+        :type path: tuple[str or int]
+        :param messages: the validation messages of the property, rendered to ``str``
+        :type messages: list[str or |ValidationMessage|\ ]
         """
-        return tuple.__new__(cls, (fqn, messages))
+        return cls(_dotted_name(type_name, path), [_rendered(message) for message in messages], path)
+
+    @property
+    def pointer(self):
+        """
+        :return: the location of this summary as a JSON Pointer, see :func:`~prestans3.errors.json_pointer`
+        :raises ValueError: if the location is unknown, or is that of many grouped |Array| elements, which no single
+                            JSON Pointer refers to. ``expand()`` the |ArrayValidationException| first
+        """
+        if self.path is None:
+            raise ValueError("the location of {} is unknown".format(self[0]))
+        if any(isinstance(segment, IndexRanges) for segment in self.path):
+            raise ValueError("{} locates many grouped array elements, which have no single JSON Pointer. expand() the "
+                             "validation exception first".format(self[0]))
+        return json_pointer(self.path)
 
     def __str__(self):
         """
@@ -44,6 +208,9 @@ class ValidationExceptionSummary(tuple):
 class ValidationException(Exception):
     """
     leaf of the validation tree. represents a validation failure of a scalar type
+
+    the summaries of a validation tree are indexed, so that ``len()``, :attr:`head` and random access do not produce the
+    summaries before the one requested, and iteration produces them one at a time.
     """
 
     def __init__(self, of_type, message=None):
@@ -57,6 +224,7 @@ class ValidationException(Exception):
             raise TypeError('validation exceptions are only valid for subclasses of {}, received type {}'.format(
                 ImmutableType.__name__, of_type.__name__))
         self._of_type = of_type
+        self._parents = []
         super(ValidationException, self).__init__([])
         if message is not None:
             self.add_validation_message(message)
@@ -67,10 +235,71 @@ class ValidationException(Exception):
         :return: the head of the list of summaries
                  see :func:`~prestans3.errors.ValidationException.__iter__`
         """
-        return list(self.__iter__())[0]
+        return self[0]
+
+    def __len__(self):
+        """ :return: the number of summaries produced by :func:`~prestans3.errors.ValidationException.__iter__` """
+        own_count, _keys, ends = self._summary_index()
+        return ends[-1] if ends else own_count
 
     def __getitem__(self, item):
-        return list(self.__iter__())[item]
+        if isinstance(item, slice):
+            return [self._summary(index) for index in range(*item.indices(len(self)))]
+        length = len(self)
+        index = item + length if item < 0 else item
+        if not 0 <= index < length:
+            raise IndexError("validation summary index {} out of range".format(item))
+        return self._summary(index)
+
+    def __bool__(self):
+        # a validation exception is truthy even when it has no summaries, despite defining __len__
+        return True
+
+    # py2to3 remove
+    __nonzero__ = __bool__
+
+    def _summary(self, index):
+        """ :return: the summary at `index`, which is within range """
+        path, messages = self._location(index)
+        return ValidationExceptionSummary.from_path(self.property_type.__name__, path, messages)
+
+    def _summary_index(self):
+        """
+        :return: the number of own summaries, the keys of the dependant exceptions and the cumulative number of
+                 summaries up to and including each of them
+        """
+        return 1 if self.message_templates else 0, (), ()
+
+    def _dependants(self):
+        """ :return: the (key, |ValidationException|\ ) pairs of the exceptions contained in this one """
+        return ()
+
+    def _location(self, index):
+        """ :return: the path and messages of the summary at `index`, descending through the summary indices """
+        exception = self
+        path = []
+        while True:
+            own_count, keys, ends = exception._summary_index()
+            if index < own_count:
+                return tuple(path), exception.message_templates
+            position = bisect_right(ends, index)
+            index -= ends[position - 1] if position else own_count
+            path.append(keys[position])
+            exception = exception.validation_exceptions[keys[position]]
+
+    def _locations(self):
+        """ yields the path and messages of each summary in order, without recursing """
+        stack = [((), self)]
+        while stack:
+            path, exception = stack.pop()
+            if exception.message_templates:
+                yield path, exception.message_templates
+            stack.extend((path + (key,), dependant) for key, dependant in reversed(exception._dependants()))
+
+    def _invalidate(self):
+        """ discards the summary indices of the exceptions containing this one, after its summaries have changed """
+        for parent in self._parents:
+            parent._invalidate()
 
     def __iter__(self):
         """
@@ -78,10 +307,9 @@ class ValidationException(Exception):
 
         :yields: the next summarised exception (|ValidationExceptionSummaries|)
         """
-        if self.messages:
-            yield ValidationExceptionSummary(self.property_type.__name__, self.messages)
-        else:
-            return
+        type_name = self.property_type.__name__
+        for path, messages in self._locations():
+            yield ValidationExceptionSummary.from_path(type_name, path, messages)
 
     def _default_message(self):
         return "validation exception for type {}".format(self.property_type.__name__)
@@ -89,6 +317,8 @@ class ValidationException(Exception):
     def add_validation_message(self, message):
         """ adds a validation message regarding this current |type| (not one of its |attributes|\ ) """
         self.args[0].append(message)
+        if len(self.args[0]) == 1:
+            self._invalidate()
 
     def add_validation_messages(self, iterable):
         """ adds a list of messages regarding this current |type| (not one of its |attributes|\ ) """
@@ -100,6 +330,12 @@ class ValidationException(Exception):
 
     @property
     def messages(self):
+        """ :return: the validation messages of this |type| itself, rendered to ``str`` """
+        return [_rendered(message) for message in self.args[0]]
+
+    @property
+    def message_templates(self):
+        """ :return: the validation messages of this |type| itself as added, |ValidationMessages| unrendered """
         return self.args[0]
 
     @property
@@ -107,6 +343,58 @@ class ValidationException(Exception):
         return self._of_type
 
 
+class ValidationResult(object):
+    """
+    the outcome of :func:`~prestans3.types.ImmutableType.validate_result` or
+    :func:`~prestans3.types.ImmutableType.try_from_value`\ , for callers that expect some values to be invalid and carry
+    on. the |ValidationException| describing an invalid value is created but never raised, so no traceback is built
+
+    >>> from prestans3.types import String
+    >>> result = String.try_from_value('spam', {'max_length': 3})
+    >>> result.ok
+    False
+    >>> [summary[0] for summary in result.errors]
+    ['String']
+    >>> print(result.errors.messages[0])
+    String max_length config is 3 however len("spam") == 4
+    """
+    __slots__ = ('value', 'errors')
+
+    def __init__(self, value=None, errors=None):
+        """
+        :param value: the valid or invalid instance, ``None`` if the value could not be coerced to the |type|
+        :param errors: the reasons `value` is invalid, ``None`` if it is valid
+        :type errors: |ValidationException|
+        """
+        self.value = value
+        self.errors = errors
+
+    @property
+    def ok(self):
+        """ :return: ``True`` if the value is valid """
+        return self.errors is None
+
+    def __bool__(self):
+        return self.errors is None
+
+    # py2to3 remove
+    __nonzero__ = __bool__
+
+    def unwrap(self):
+        """
+        :return: the valid value
+        :raises |ValidationException|\ : if the value is invalid
+        """
+        if self.errors is not None:
+            raise self.errors
+        return self.value
+
+    def __repr__(self):
+        if self.errors is None:
+            return "{}(value={!r})".format(self.__class__.__name__, self.value)
+        return "{}(value={!r}, errors={!r})".format(self.__class__.__name__, self.value, self.errors)
+
+
 class InvalidMethodUseError(Exception):
     def __init__(self, method, message=None):
         self._method = method
@@ -140,6 +428,7 @@ class ContainerValidationException(ValidationException):
         """
         from .utils import is_str
         self.validation_exceptions = {}
+        self._index = None
         if isinstance(message_or_key_exception_tuple, tuple):
             super(ContainerValidationException, self).__init__(of_type)
             self.add_validation_exception(message_or_key_exception_tuple[0],
@@ -150,23 +439,42 @@ class ContainerValidationException(ValidationException):
         else:
             super(ContainerValidationException, self).__init__(of_type)
 
-    def __iter__(self):
-        """ iterate through the summaries for this exception """
-        # py2to3 unwrap all 3 iters here
-        for summary in list(super(ContainerValidationException, self).__iter__()):
-            yield summary
-        for key, validation_exception in list(self.validation_exceptions.items()):  # type: (str, ValidationException)
-            for summary in list(validation_exception):
-                yield ContainerValidationExceptionSummary(self.property_type.__name__, key, summary)
+    def _dependants(self):
+        # py2to3 unwrap .items()
+        return list(self.validation_exceptions.items())
+
+    def _summary_index(self):
+        # built when first needed, and discarded whenever a summary in this tree changes
+        if self._index is None:
+            own_count = super(ContainerValidationException, self)._summary_index()[0]
+            keys = []
+            ends = []
+            total = own_count
+            for key, validation_exception in self._dependants():
+                total += len(validation_exception)
+                keys.append(key)
+                ends.append(total)
+            self._index = (own_count, keys, ends)
+        return self._index
+
+    def _invalidate(self):
+        self._index = None
+        super(ContainerValidationException, self)._invalidate()
 
     def add_validation_exception(self, key, validation_exception):
         """
-        :param str key: the attribute name whose validation failed. This name must be a configured attribute property of
-                    this tree's ``self._of_type``
+        :param key: the attribute name whose validation failed. This name must be a configured attribute property of
+                    this tree's ``self._of_type``. for arrays, the index of the invalid element
+        :type key: str or int
         :param |ValidationException| validation_exception: the validation_exception to add to this |ValidationException|\ 's list of exceptions
         """
         self.check_validation_exception(key, validation_exception)
+        replaced = self.validation_exceptions.get(key)
+        if replaced is not None and self in replaced._parents:
+            replaced._parents.remove(self)
         self.validation_exceptions.update({key: validation_exception})
+        validation_exception._parents.append(self)
+        self._invalidate()
 
     def check_validation_exception(self, key, validation_exception):
         from prestans3.types import Container
@@ -194,9 +502,12 @@ class ContainerValidationExceptionSummary(ValidationExceptionSummary):
         :param str attribute_name: the name of the configured |attribute| on the owning |type|
         :param |ValidationExceptionSummary| summary: the summary of one of this containers validation exceptions
         """
-        _replace_regex = r'^[^.]*'
-        return super(ContainerValidationExceptionSummary, cls).__new__(cls,
-                                                                       re.sub(_replace_regex, "{}.{}".format(class_name,
-                                                                                                             attribute_name),
-                                                                              summary[0]),
-                                                                       summary[1])
+        path = getattr(summary, 'path', None)
+        if path is not None:
+            path = (attribute_name,) + path
+            return super(ContainerValidationExceptionSummary, cls).__new__(
+                cls, _dotted_name(class_name, path), summary[1], path)
+        # the location of the summary is unknown, replace the type name leading its fully qualified name
+        fqn = summary[0]
+        return super(ContainerValidationExceptionSummary, cls).__new__(
+            cls, "{}.{}{}".format(class_name, attribute_name, fqn[len(fqn.split('.', 1)[0]):]), summary[1])
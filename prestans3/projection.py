@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+    prestans3.projection
+    ~~~~~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+"""
+from collections import OrderedDict
+
+from .utils import is_str
+
+
+class Projection(dict):
+    """
+    A compiled sparse fieldset. maps each selected |attribute| name to either ``None`` (serialize the whole value) or a
+    nested |Projection| applied to the sub |Model| (or to each element of a sub |Array|\ ).
+
+    >>> from prestans3.projection import compile_projection
+    >>> projection = compile_projection("id,name,owner(id,name)")
+    >>> sorted(projection.keys())
+    ['id', 'name', 'owner']
+    >>> sorted(projection['owner'].keys())
+    ['id', 'name']
+    """
+
+    def __init__(self, expression, fields):
+        """
+        :param str expression: the normalized field expression this projection was compiled from
+        :param fields: the selected attribute names and their sub projections
+        :type fields: list[(str, |Projection| or None)]
+        """
+        super(Projection, self).__init__(fields)
+        self.expression = expression
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.expression)
+
+
+projection_cache_size = 1024
+""" the number of most recently used field expressions whose compiled |Projection| is kept """
+
+_projection_cache = OrderedDict()
+
+
+def compile_projection(expression):
+    """
+    compiles a field expression such as ``"id,name,owner(id,name)"`` into a |Projection|. compiled projections are
+    cached by their expression, so repeated requests for the same fieldset are only parsed once. only the
+    :data:`projection_cache_size` most recently used expressions are kept, as expressions usually come from clients.
+
+    :param str expression: comma separated attribute names, nested selections are enclosed in parentheses
+    :raises ValueError: if the expression is malformed
+    :rtype: |Projection|
+    """
+    try:
+        projection = _projection_cache.pop(expression)
+    except KeyError:
+        pass
+    else:
+        # reinserted as the most recently used
+        _projection_cache[expression] = projection
+        return projection
+    # py2to3 replace is_str with isinstance(x, str)
+    if not is_str(expression):
+        raise TypeError("field expression must be a str, received {} of type {}".format(expression,
+                                                                                     expression.__class__.__name__))
+    projection, position = _parse_fields(expression, 0)
+    if position != len(expression):
+        raise ValueError("unexpected '{}' at position {} in field expression '{}'".format(expression[position],
+                                                                                          position, expression))
+    _projection_cache[expression] = projection
+    while len(_projection_cache) > projection_cache_size:
+        _projection_cache.popitem(last=False)
+    return projection
+
+
+def _parse_fields(expression, position):
+    """
+    parses a comma separated list of fields starting at `position` until the end of the expression or an unmatched
+    closing parenthesis
+
+    :return: the parsed |Projection| and the position following the last parsed field
+    :rtype: (|Projection|, int)
+    """
+    fields = []
+    seen = set()
+    length = len(expression)
+    while True:
+        name_start = position
+        while position < length and expression[position] not in ',()':
+            position += 1
+        name = expression[name_start:position].strip()
+        if not name:
+            raise ValueError("expected a field name at position {} in field expression '{}'".format(name_start,
+                                                                                                   expression))
+        if name in seen:
+            raise ValueError("field '{}' is selected more than once in field expression '{}'".format(name,
+                                                                                                     expression))
+        seen.add(name)
+        sub_projection = None
+        if position < length and expression[position] == '(':
+            sub_projection, position = _parse_fields(expression, position + 1)
+            if position >= length or expression[position] != ')':
+                raise ValueError("unclosed '(' for field '{}' in field expression '{}'".format(name, expression))
+            position += 1
+            while position < length and expression[position].isspace():
+                position += 1
+        fields.append((name, sub_projection))
+        if position < length and expression[position] == ',':
+            position += 1
+            continue
+        break
+    normalized = ",".join(name if sub is None else "{}({})".format(name, sub.expression) for name, sub in fields)
+    return Projection(normalized, fields), position
+
+
+def serialize(value, fields=None):
+    """
+    produces the native value of a |type|\ , restricted to the attributes selected by `fields`. only the selected
+    |attributes| are visited, the native value of an excluded attribute is never computed. a projection applied to an
+    |Array| is applied to each of its elements.
+
+    >>> from prestans3.types import Model, String, Integer
+    >>> from prestans3.projection import serialize
+    >>> class Person(Model):
+    ...     id = Integer.property()
+    ...     name = String.property()
+    ...     bio = String.property(required=False)
+    ...
+    >>> person = Person(initial_values={'id': 1, 'name': 'jum', 'bio': 'long'})
+    >>> serialize(person, fields="id,name") == {'id': 1, 'name': 'jum'}
+    True
+
+    :param value: the |Model|\ , |Array| or scalar |type| to serialize
+    :type value: T <= |ImmutableType|
+    :param fields: a field expression (see :func:`compile_projection`) or an already compiled |Projection|. if
+                   ``None``, the full native value is returned
+    :type fields: str or |Projection| or None
+    :raises ValueError: if a selected field is not a configured |attribute| or a projection is applied to a scalar
+    """
+    if fields is None:
+        return value.native_value
+    if not isinstance(fields, Projection):
+        fields = compile_projection(fields)
+    return _serialize(value, fields)
+
+
+def _serialize(value, projection):
+    if projection is None:
+        return value.native_value
+    from .types import Model, Array
+    from .types.model import _create_attributes
+    if isinstance(value, Array):
+        return [_serialize(element, projection) for element in value]
+    elif isinstance(value, Model):
+        attributes = _create_attributes(value, list(projection.keys()))
+        is_prestans_attribute = value.__class__.is_prestans_attribute
+        result = {}
+        # py2to3 unwrap .items()
+        for name, sub_projection in list(projection.items()):
+            try:
+                attribute = attributes[name]
+            except KeyError:
+                if not is_prestans_attribute(name):
+                    raise ValueError("'{}' is not a configured prestans attribute of {}".format(
+                        name, value.__class__.__name__))
+                continue
+            result[name] = _serialize(attribute, sub_projection)
+        return result
+    else:
+        raise ValueError("cannot apply projection '{}' to scalar type {}".format(projection.expression,
+                                                                               value.__class__.__name__))
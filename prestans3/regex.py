@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""
+    prestans3.regex
+    ~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+"""
+import re
+
+from future.utils import text_type
+
+from .utils import is_str
+
+
+class FullMatchRegex(object):
+    """
+    A regular expression, compiled with :mod:`re`, that must match the whole of a string. This is the default matcher
+    of the :func:`format_regex<prestans3.types.string._format_regex>` rule.
+    """
+
+    def __init__(self, pattern, flags=0):
+        """
+        :param str pattern: the regular expression
+        :param int flags: :mod:`re` flags
+        """
+        self.pattern = pattern
+        self._regex = re.compile(pattern, flags)
+        # py2to3 replace with self.fullmatch = self._regex.fullmatch
+        if hasattr(self._regex, 'fullmatch'):
+            self.fullmatch = self._regex.fullmatch
+        else:
+            self._full_regex = re.compile(_anchored(pattern, flags), flags)
+
+    def fullmatch(self, string):
+        """ :return: a match object if the whole of `string` matches, otherwise ``None`` """
+        # only reached on python 2, whose patterns have no fullmatch
+        return self._full_regex.match(string)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.pattern)
+
+
+_inline_flags = re.compile(r'(?:\(\?[aiLmsux]+\))*')
+
+
+def _anchored(pattern, flags=0):
+    """
+    :return: `pattern` wrapped so that its ``match`` only succeeds for the whole of a string, as ``fullmatch`` does.
+             leading inline flags are kept in front, where they apply to the whole pattern
+    """
+    start = _inline_flags.match(pattern).end()
+    # a comment at the end of a verbose pattern would otherwise swallow the closing parenthesis
+    verbose = flags & re.VERBOSE or 'x' in pattern[:start]
+    return pattern[:start] + '(?:' + pattern[start:] + ('\n)\\Z' if verbose else ')\\Z')
+
+
+class LinearRegex(object):
+    """
+    A regular expression matched by simulating a Thompson NFA, in time linear to the length of the string. unlike
+    :mod:`re`, a pathological pattern such as ``(a+)+b`` can not backtrack catastrophically. Only a subset of the
+    :mod:`re` syntax is supported:
+
+    - literals, ``.`` and escaped metacharacters
+    - character classes (``[a-z_]``, ``[^0-9]``) and ``\\d \\D \\w \\W \\s \\S``
+    - groups (``(...)``, ``(?:...)``, ``(?P<name>...)``) and alternation (``|``)
+    - quantifiers ``* + ? {m} {m,} {m,n}`` and their lazy forms
+    - ``^`` and ``$`` anchors
+
+    like :class:`FullMatchRegex`, the pattern must match the whole string.
+
+    >>> from prestans3.types import String
+    >>> from prestans3.regex import LinearRegex
+    >>> code = String.property(format_regex=LinearRegex(r'[A-Z]{2}(-[0-9]+)*'))
+    """
+
+    max_repeat = 1000
+    """ the largest bound accepted in a ``{m,n}`` quantifier """
+
+    def __init__(self, pattern):
+        """
+        :param str pattern: the regular expression
+        :raises ValueError: if the pattern is malformed or uses unsupported syntax
+        """
+        self.pattern = pattern
+        self._program = _Compiler(pattern, self.max_repeat).compile()
+
+    def fullmatch(self, string):
+        """ :return: ``True`` if the whole of `string` matches, otherwise ``False`` """
+        if string.__class__ is not text_type:
+            string = text_type(string)
+        program = self._program
+        length = len(string)
+        marks = [-1] * len(program)
+        threads = _add_thread(program, [], marks, 0, 0, 0, length)
+        for position, char in enumerate(string):
+            next_threads = []
+            next_position = position + 1
+            for pc in threads:
+                op = program[pc]
+                if op[0] == _CHAR and op[1](char):
+                    _add_thread(program, next_threads, marks, next_position, pc + 1, next_position, length)
+            if not next_threads:
+                return False
+            threads = next_threads
+        return any(program[pc][0] == _MATCH for pc in threads)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.pattern)
+
+
+_format_regex_cache = dict()
+
+
+def compile_format_regex(config):
+    """
+    compiles a format_regex rule configuration. a ``str`` pattern or a compiled :mod:`re` pattern becomes a
+    |FullMatchRegex|, cached by pattern. a |FullMatchRegex| or |LinearRegex| is returned as is.
+
+    :param config: the regular expression
+    :type config: str or re.Pattern or FullMatchRegex or LinearRegex
+    :rtype: FullMatchRegex or LinearRegex
+    """
+    if isinstance(config, (FullMatchRegex, LinearRegex)):
+        return config
+    # py2to3 replace is_str with isinstance(x, str)
+    if is_str(config):
+        key = config
+        try:
+            return _format_regex_cache[key]
+        except KeyError:
+            compiled = FullMatchRegex(config)
+    elif hasattr(config, 'pattern') and hasattr(config, 'flags'):
+        key = (config.pattern, config.flags)
+        try:
+            return _format_regex_cache[key]
+        except KeyError:
+            compiled = FullMatchRegex(config.pattern, config.flags)
+    else:
+        raise TypeError("format_regex config must be a str or compiled regular expression, received {} of type {}"
+                        .format(config, config.__class__.__name__))
+    _format_regex_cache[key] = compiled
+    return compiled
+
+
+_CHAR, _SPLIT, _JMP, _BOL, _EOL, _MATCH = range(6)
+
+
+def _add_thread(program, threads, marks, generation, pc, position, length):
+    """ adds `pc` and every instruction reachable from it without consuming a character to `threads` """
+    stack = [pc]
+    while stack:
+        pc = stack.pop()
+        if marks[pc] == generation:
+            continue
+        marks[pc] = generation
+        op = program[pc]
+        kind = op[0]
+        if kind == _JMP:
+            stack.append(op[1])
+        elif kind == _SPLIT:
+            stack.append(op[2])
+            stack.append(op[1])
+        elif kind == _BOL:
+            if position == 0:
+                stack.append(pc + 1)
+        elif kind == _EOL:
+            if position == length:
+                stack.append(pc + 1)
+        else:
+            threads.append(pc)
+    return threads
+
+
+def _is_word(char):
+    return char.isalnum() or char == u'_'
+
+
+def _is_digit(char):
+    return char.isdecimal() if hasattr(char, 'isdecimal') else char.isdigit()
+
+
+def _is_space(char):
+    return char.isspace()
+
+
+def _negate(func):
+    return lambda char: not func(char)
+
+
+_categories = {
+    'd': _is_digit,
+    'D': _negate(_is_digit),
+    'w': _is_word,
+    'W': _negate(_is_word),
+    's': _is_space,
+    'S': _negate(_is_space),
+}
+
+_quantifiers = {u'*': (0, None), u'+': (1, None), u'?': (0, 1)}
+
+_bound_regex = re.compile(r'^(\d+(,\d*)?|,\d+)$')
+
+_escapes = {'t': u'\t', 'n': u'\n', 'r': u'\r', 'f': u'\f', 'v': u'\v', '0': u'\0'}
+
+
+def _any_but_newline(char):
+    return char != u'\n'
+
+
+def _char_class(chars, ranges, categories, negated):
+    """ builds a single character predicate for a ``[...]`` class """
+    chars = frozenset(chars)
+
+    def _matches(char):
+        found = char in chars or any(low <= char <= high for low, high in ranges) or \
+                any(category(char) for category in categories)
+        return found is not negated
+
+    return _matches
+
+
+class _Compiler(object):
+    """ recursive descent parser that emits a pike vm program for a :class:`LinearRegex` pattern """
+
+    def __init__(self, pattern, max_repeat):
+        self._pattern = text_type(pattern)
+        self._position = 0
+        self._max_repeat = max_repeat
+
+    def compile(self):
+        node = self._alternation()
+        if self._position < len(self._pattern):
+            self._error("unbalanced parenthesis")
+        program = []
+        self._emit(node, program)
+        program.append((_MATCH,))
+        return program
+
+    def _error(self, message):
+        raise ValueError("{} at position {} in pattern {!r}".format(message, self._position, self._pattern))
+
+    def _peek(self):
+        return self._pattern[self._position] if self._position < len(self._pattern) else None
+
+    def _next(self):
+        char = self._peek()
+        if char is None:
+            self._error("unexpected end of pattern")
+        self._position += 1
+        return char
+
+    # ast nodes are tuples: ('char', predicate), ('cat', [nodes]), ('alt', [nodes]), ('repeat', node, min, max),
+    # ('bol',) and ('eol',)
+
+    def _alternation(self):
+        branches = [self._concatenation()]
+        while self._peek() == u'|':
+            self._position += 1
+            branches.append(self._concatenation())
+        return branches[0] if len(branches) == 1 else ('alt', branches)
+
+    def _concatenation(self):
+        nodes = []
+        while self._peek() is not None and self._peek() not in u'|)':
+            nodes.append(self._quantified())
+        return ('cat', nodes)
+
+    def _quantified(self):
+        node = self._atom()
+        while True:
+            char = self._peek()
+            if char == u'{' and self._is_bound():
+                minimum, maximum = self._bound()
+            elif char is not None and char in _quantifiers:
+                minimum, maximum = _quantifiers[char]
+                self._position += 1
+            else:
+                return node
+            if node[0] in ('bol', 'eol'):
+                self._error("nothing to repeat")
+            if self._peek() == u'?':
+                # lazy and greedy quantifiers accept the same strings when the whole string must match
+                self._position += 1
+            node = ('repeat', node, minimum, maximum)
+
+    def _is_bound(self):
+        end = self._pattern.find(u'}', self._position)
+        return end > -1 and _bound_regex.match(self._pattern[self._position + 1:end]) is not None
+
+    def _bound(self):
+        end = self._pattern.find(u'}', self._position)
+        body = self._pattern[self._position + 1:end]
+        self._position = end + 1
+        if u',' in body:
+            low, high = body.split(u',')
+            minimum = int(low) if low else 0
+            maximum = int(high) if high else None
+        else:
+            minimum = maximum = int(body)
+        if (maximum if maximum is not None else minimum) > self._max_repeat:
+            self._error("repeat bound greater than {}".format(self._max_repeat))
+        if maximum is not None and minimum > maximum:
+            self._error("min repeat greater than max repeat")
+        return minimum, maximum
+
+    def _atom(self):
+        char = self._next()
+        if char == u'(':
+            if self._peek() == u'?':
+                self._position += 1
+                kind = self._next()
+                if kind == u'P' and self._peek() == u'<':
+                    end = self._pattern.find(u'>', self._position)
+                    if end < 0:
+                        self._error("unterminated group name")
+                    self._position = end + 1
+                elif kind != u':':
+                    self._error("unsupported group syntax '(?{}'".format(kind))
+            node = self._alternation()
+            if self._peek() != u')':
+                self._error("missing )")
+            self._position += 1
+            return node
+        elif char == u')':
+            self._error("unbalanced parenthesis")
+        elif char == u'[':
+            return ('char', self._class())
+        elif char == u'.':
+            return ('char', _any_but_newline)
+        elif char == u'^':
+            return ('bol',)
+        elif char == u'$':
+            return ('eol',)
+        elif char in u'*+?':
+            self._error("nothing to repeat")
+        elif char == u'\\':
+            return ('char', self._escape(in_class=False))
+        return ('char', char.__eq__)
+
+    def _escape(self, in_class):
+        char = self._next()
+        if char in _categories:
+            return _categories[char]
+        elif char in _escapes:
+            return _escapes[char] if in_class else _escapes[char].__eq__
+        elif char.isalnum():
+            self._error("unsupported escape '\\{}'".format(char))
+        return char if in_class else char.__eq__
+
+    def _class(self):
+        negated = self._peek() == u'^'
+        if negated:
+            self._position += 1
+        chars, ranges, categories = [], [], []
+        first = True
+        while True:
+            char = self._next()
+            if char == u']' and not first:
+                break
+            first = False
+            if char == u'\\':
+                escaped = self._escape(in_class=True)
+                if callable(escaped):
+                    categories.append(escaped)
+                    continue
+                char = escaped
+            if self._peek() == u'-' and self._position + 1 < len(self._pattern) and \
+                    self._pattern[self._position + 1] != u']':
+                self._position += 1
+                high = self._next()
+                if high == u'\\':
+                    high = self._escape(in_class=True)
+                    if callable(high):
+                        self._error("bad character range")
+                if high < char:
+                    self._error("bad character range {}-{}".format(char, high))
+                ranges.append((char, high))
+            else:
+                chars.append(char)
+        return _char_class(chars, ranges, categories, negated)
+
+    def _emit(self, node, program):
+        kind = node[0]
+        if kind == 'char':
+            program.append((_CHAR, node[1]))
+        elif kind == 'bol':
+            program.append((_BOL,))
+        elif kind == 'eol':
+            program.append((_EOL,))
+        elif kind == 'cat':
+            for child in node[1]:
+                self._emit(child, program)
+        elif kind == 'alt':
+            jumps = []
+            for branch in node[1][:-1]:
+                split = len(program)
+                program.append(None)
+                self._emit(branch, program)
+                jumps.append(len(program))
+                program.append(None)
+                program[split] = (_SPLIT, split + 1, len(program))
+            self._emit(node[1][-1], program)
+            for jump in jumps:
+                program[jump] = (_JMP, len(program))
+        else:
+            _kind, child, minimum, maximum = node
+            for _ in range(minimum):
+                self._emit(child, program)
+            if maximum is None:
+                split = len(program)
+                program.append(None)
+                self._emit(child, program)
+                program.append((_JMP, split))
+                program[split] = (_SPLIT, split + 1, len(program))
+            else:
+                splits = []
+                for _ in range(maximum - minimum):
+                    splits.append(len(program))
+                    program.append(None)
+                    self._emit(child, program)
+                for split in splits:
+                    program[split] = (_SPLIT, split + 1, len(program))
@@ -14,6 +14,8 @@ from copy import copy
 from future.utils import with_metaclass
 
 from .meta import PrestansTypeMeta
+from ..choices import Choices
+from ..errors import ValidationException, ValidationMessage, ValidationResult
 from ..utils import MergingProxyDictionary, LazyOneWayGraph, ImmutableMergingDictionary, is_str
 
 
@@ -44,6 +46,12 @@ class ImmutableType(with_metaclass(PrestansTypeMeta)):
 
     is_scalar = True
 
+    _native_type = None
+    """
+    the native class wrapped by this |type|\ , whose instances behave as instances of this |type| for its |rules|\ .
+    :func:`validate_native` checks them without creating an instance of this |type|
+    """
+
     def __init__(self, validate_immediately=True):
         """
         NOTE: call this method after setting values if validating immediately in order for validation to work!
@@ -55,13 +63,37 @@ class ImmutableType(with_metaclass(PrestansTypeMeta)):
                                           user or prestans3 REST api process
         :raises |ValidationException|\ : on invalid state when validate_immediately is True
         """
-        if validate_immediately:
+        if validate_immediately and _validates_on_construction(self.__class__):
             self.validate()
 
     @property
     def native_value(self):
         return copy(self)
 
+    def to_builtin(self):
+        """
+        converts this |type| to a plain python builtin (e.g. ``int``, ``float``, ``str``, ``bool``, ``datetime``) using
+        the converter registered for its class (see :func:`register_builtin_converter`). unlike :attr:`native_value`,
+        the result is never an instance of a prestans |type|\ . falls back to :attr:`native_value` if no converter is
+        registered.
+        """
+        return _builtin_converter(self.__class__)(self)
+
+    @classmethod
+    def register_builtin_converter(cls, converter):
+        """
+        register the single argument function used by :func:`to_builtin` to convert instances of this |type| and its
+        subclasses to a plain python builtin
+
+        >>> Integer.register_builtin_converter(int)
+
+        :param converter: converts an instance of this |type| to a builtin
+        :type converter: (T <= ImmutableType) -> any
+        """
+        _builtin_converters[cls] = converter
+        _builtin_converter_cache.clear()
+        _specialised_builtin_converter_cache.clear()
+
     @classmethod
     def property(cls, **kwargs):
         """
@@ -78,24 +110,91 @@ class ImmutableType(with_metaclass(PrestansTypeMeta)):
 
         :raises |ValidationException|\ : on invalid state
         """
+        exception = self._validation_errors(config)
+        if exception is not None:
+            raise exception
+
+    def validate_result(self, config=None):
+        """
+        validates like :func:`validate` but returns the outcome instead of raising it
+
+        :rtype: |ValidationResult|
+        """
+        return ValidationResult(self, _collect_validation_errors(self, config))
+
+    def _validation_errors(self, config):
+        """
+        the validation performed by :func:`validate`\ , subclasses override this method rather than :func:`validate` so
+        that containers can collect the errors of their contents without raising and catching them at every level
+
+        :return: the |ValidationException| describing why this instance is invalid, or ``None`` if it is valid
+        """
+        return _rule_errors(self, self._configured_rules(config))
+
+    @classmethod
+    def validate_native(cls, value, config=None):
+        """
+        validates a native value as if it were coerced with :func:`from_value` and validated against `config`\ ,
+        creating an instance of this |type| only where the |rules| can not be checked against `value` itself. the
+        result's value is `value`\ , pass it to :func:`from_value` for an instance
+
+        >>> String.validate_native('spam', {'max_length': 3}).ok
+        False
+
+        :rtype: |ValidationResult|
+        """
+        return ValidationResult(value, cls._native_errors(value, config))
+
+    @classmethod
+    def _native_errors(cls, value, config, coerce=None):
+        """
+        :param coerce: creates an instance of this |type| from `value`\ , defaults to :func:`from_value`
+        :return: the |ValidationException| of validating the native `value` against `config`\ , or ``None``
+        """
+        return cls._native_validator(config, coerce)(value)
+
+    @classmethod
+    def _native_validator(cls, config, coerce=None):
+        """
+        resolves the |rules| configured by `config` once for validating many native values, see :func:`_native_errors`
+
+        :return: a function returning the |ValidationException| of a native value, or ``None``
+        """
+        rules = cls._configured_rules(config) if _validates_with_rules(cls) else None
+        native_type = cls._native_type
+        create = cls if coerce is None else coerce
+        if coerce is None:
+            coerce = cls.from_value
+
+        def _validate(value):
+            if rules is not None and value.__class__ is cls:
+                return _rule_errors(value, rules)
+            elif isinstance(value, cls):
+                return _collect_validation_errors(value, config)
+            elif rules is not None and value.__class__ is native_type:
+                return _native_rule_errors(value, rules, lambda: create(value))
+            try:
+                instance = coerce(value)
+            except ValidationException as exception:
+                return exception
+            except (TypeError, ValueError) as error:
+                return ValidationException(cls, _error_message(error))
+            return _collect_validation_errors(instance, config)
+
+        return _validate
+
+    @classmethod
+    def _configured_rules(cls, config):
+        """
+        :return: the (|rule|\ , configuration) pairs configured by `config` and the default configurations, in the order
+                 they are checked. may be resolved once and checked against many instances, see :func:`_rule_errors`
+        """
         if config is None:
             config = {}
-        config = ImmutableMergingDictionary(config, self.default_rules_config())
-        exception_messages = None
+        config = ImmutableMergingDictionary(config, cls.default_rules_config())
         # py2to3 unwrap .items()
-        for rule_name, rule in list(self.__class__.property_rules.items()):
-            from ..errors import ValidationException
-            try:
-                if rule_name in config:
-                    rule(self, config[rule_name])
-            except ValidationException as ex:
-                if exception_messages is None:
-                    exception_messages = []
-                exception_messages += ex.messages
-            if exception_messages:
-                exception = ValidationException(self.__class__)
-                exception.add_validation_messages(exception_messages)
-                raise exception
+        return [(rule, config[rule_name]) for rule_name, rule in list(cls.property_rules.items())
+                if rule_name in config]
 
     @classmethod
     def from_value(cls, value):
@@ -113,16 +212,73 @@ class ImmutableType(with_metaclass(PrestansTypeMeta)):
         >>> my_class = MyClass.mutable()
         >>> my_class.name = "jum"
 
+        the conversion is looked up by the |type| and the class of `value` among the converters registered with
+        :func:`register_coercer`, along the mro of both. the lookup is cached, so no exceptions are raised or caught
+        for values that are coercible.
+
         :param value: an acceptable value according to the |type|\ 's subclass
-        :raises NotImplementedError: if called on a subclass that does not override this method
+        :raises NotImplementedError: if no converter is registered for `value`, subclasses raise a more specific error
         """
         if isinstance(value, cls):
             return value
+        converter = _coercer_cache.get((cls, value.__class__), _missing)
+        if converter is _missing:
+            converter = _coercer(cls, value.__class__)
+        if converter is _construct:
+            return cls(value)
+        elif converter is not None:
+            instance = converter(cls, value)
+            if instance is not None:
+                return instance
+        return cls._not_coercible(value)
+
+    @classmethod
+    def _not_coercible(cls, value):
+        """ raises the error of :func:`from_value` for a `value` that is not coercible to this |type| """
         raise NotImplementedError
 
+    @classmethod
+    def try_from_value(cls, value, config=None):
+        """
+        coerces `value` with :func:`from_value` and validates it against `config`\ , returning the outcome instead of
+        raising it. a value that is not coercible is reported as invalid with the message of the coercion error
+
+        >>> Integer.try_from_value('7').ok
+        False
+
+        :rtype: |ValidationResult|
+        """
+        try:
+            instance = cls.from_value(value)
+        except ValidationException as exception:
+            return ValidationResult(errors=exception)
+        except (TypeError, ValueError) as error:
+            return ValidationResult(errors=ValidationException(cls, _error_message(error)))
+        return instance.validate_result(config)
+
+    @classmethod
+    def register_coercer(cls, source_type, converter):
+        """
+        register the function used by :func:`from_value` to coerce values of `source_type` and its subclasses to this
+        |type| and its subclasses. the converter is called with the |type| being coerced to, which may be a subclass
+        of this |type|\ , and the value. it returns ``None`` if the value is not coercible after all
+
+        >>> from decimal import Decimal
+        >>> Float.register_coercer(Decimal, lambda of_type, value: of_type(float(value)))
+
+        :param source_type: the class, or tuple of classes, of the values to coerce
+        :param converter: converts a value to an instance of the |type|
+        :type converter: (of_type: class<T <= ImmutableType>, value: any) -> T or None
+        """
+        for source in source_type if isinstance(source_type, tuple) else (source_type,):
+            _coercers[(cls, source)] = converter
+        for cache in _coercion_caches:
+            cache.clear()
+
     # noinspection PyUnusedLocal,PyAbstractClass
     @classmethod
-    def register_property_rule(cls, property_rule, name=None, default=None, configurable=True):
+    def register_property_rule(cls, property_rule, name=None, default=None, configurable=True, prepare_config=None,
+                               batch=None):
         """
         Register a |rule| with all instances and subclasses of this |type|
 
@@ -131,6 +287,16 @@ class ImmutableType(with_metaclass(PrestansTypeMeta)):
         :param str name: name of the |rule| as will appear in configuring the property:
         :param object default: the default configuration to apply to this |rule| if none is specified
         :param bool configurable: when ``False``, adding a rule configuration for this property will throw an error
+        :param prepare_config: single argument function applied once to a configuration of this |rule| when a
+                               |_Property| is created, e.g. to compile it. the |rule| should still accept the
+                               unprepared configuration when called directly through
+                               :func:`validate()<prestans3.types.ImmutableType.validate>`
+        :type prepare_config: (any) -> any
+        :param batch: optional variant of the |rule| that checks many instances of this |type| at once, used when
+                      validating the elements of an |Array|\ . it returns the indices of the failing instances, or
+                      ``None`` if the configuration can not be checked in bulk. `cache` is a dictionary shared by the
+                      batch rules of one validation pass, for reusing derived values such as lengths
+        :type batch: (instances: list[ImmutableType], config: any, cache: dict) -> list[int] or None
 
         >>> import prestans3.types as types
         >>> class MyClass(Model):
@@ -159,9 +325,13 @@ class ImmutableType(with_metaclass(PrestansTypeMeta)):
 
         wrapped_pr.default_config = default
         wrapped_pr.configurable = configurable
+        wrapped_pr.prepare_config = prepare_config
+        wrapped_pr.batch = batch
         if name is None:
             name = wrapped_pr.__name__
         cls.property_rules[name] = wrapped_pr
+        _default_rules_cache.clear()
+        _native_validators.clear()
 
     @classmethod
     def register_config_check(cls, config_check, name=None):
@@ -195,11 +365,182 @@ class ImmutableType(with_metaclass(PrestansTypeMeta)):
                 for rule_name, rule in list(cls.property_rules.items()) if rule.default_config}
 
     @classmethod
-    def register_prepare_function(cls, func, name=None):
-        """ register a single argument function to be available for specifying pre-validation data massaging """
+    def register_prepare_function(cls, func, name=None, idempotent=False, supersedes=None):
+        """
+        register a single argument function to be available for specifying pre-validation data massaging. the optional
+        hints allow a |_Property|\ 's prepare pipeline to drop redundant steps when it is composed.
+
+        :param func: the prepare function
+        :type func: (T <= ImmutableType) -> T
+        :param str name: name of the prepare function as will appear in configuring the property
+        :param bool idempotent: ``True`` if applying `func` twice in a row has the same result as applying it once
+        :param supersedes: names of the prepare functions of this |type| whose effect `func` already includes, a step
+                           immediately followed by `func` is dropped from the pipeline
+        :type supersedes: list[str]
+        """
+        if name is None:
+            name = func.__name__
         cls.prepare_functions[name] = func
+        if idempotent or supersedes:
+            _prepare_function_hints[func] = (idempotent, frozenset(supersedes or []))
 
 
+_prepare_function_hints = dict()
+_builtin_converters = dict()
+_builtin_converter_cache = dict()
+_specialised_builtin_converter_cache = dict()
+_default_rules_cache = dict()
+_native_validators = dict()
+""" the native validator of each |_Property|\ , cleared whenever a |rule| is registered """
+_coercers = dict()
+_coercer_cache = dict()
+_coercion_caches = [_coercer_cache]
+""" caches derived from the registered coercers, cleared whenever a coercer is registered """
+_missing = object()
+
+
+def _coercer(of_type, source_type):
+    """
+    resolves the registered coercer of values of `source_type` to `of_type` along the mro of both, preferring the most
+    specific `of_type`. results are cached per pair of classes
+
+    :return: the coercer, or ``None`` if none is registered
+    """
+    key = (of_type, source_type)
+    converter = _coercer_cache.get(key, _missing)
+    if converter is _missing:
+        converter = next((_coercers[(target, source)] for target in of_type.__mro__ for source in source_type.__mro__
+                          if (target, source) in _coercers), None)
+        _coercer_cache[key] = converter
+    return converter
+
+
+def _construct(of_type, value):
+    """ coercer that passes the value to the constructor of the |type| """
+    return of_type(value)
+
+
+def _validates_on_construction(of_type):
+    """
+    whether validating a new instance of `of_type` without configuration can fail, i.e. it overrides
+    :func:`validate()<prestans3.types.ImmutableType.validate>` or has a |rule| with a default configuration. the
+    latter is cached per |type| until another |rule| is registered
+    """
+    if not _validates_with_rules(of_type):
+        return True
+    try:
+        return _default_rules_cache[of_type]
+    except KeyError:
+        # py2to3 unwrap .items()
+        has_defaults = any(rule.default_config for _, rule in list(of_type.property_rules.items()))
+        _default_rules_cache[of_type] = has_defaults
+        return has_defaults
+
+
+def _native_value(instance):
+    return instance.native_value
+
+
+def _builtin_converter(of_type):
+    """ resolves the registered builtin converter of `of_type` along its mro, results are cached per |type| """
+    try:
+        return _builtin_converter_cache[of_type]
+    except KeyError:
+        converter = next((_builtin_converters[base] for base in of_type.__mro__ if base in _builtin_converters),
+                         _native_value)
+        _builtin_converter_cache[of_type] = converter
+        return converter
+
+
+def _has_specialised_builtin_converter(of_type):
+    """ whether a subclass of `of_type` registers a different builtin converter than `of_type` itself """
+    try:
+        return _specialised_builtin_converter_cache[of_type]
+    except KeyError:
+        converter = _builtin_converter(of_type)
+        # py2to3 unwrap .items()
+        specialised = any(issubclass(registered_type, of_type) and registered_converter is not converter
+                          for registered_type, registered_converter in list(_builtin_converters.items()))
+        _specialised_builtin_converter_cache[of_type] = specialised
+        return specialised
+
+
+def _validates_with_rules(of_type):
+    """
+    whether `of_type` is validated by checking its |rules| alone, i.e. it overrides neither
+    :func:`validate()<prestans3.types.ImmutableType.validate>` nor ``_validation_errors``
+    """
+    # py2to3 replace getattr(..., '__func__', ...) with of_type.validate and of_type._validation_errors
+    return getattr(of_type.validate, '__func__', of_type.validate) is _immutable_type_validate and \
+        getattr(of_type._validation_errors, '__func__', of_type._validation_errors) is _immutable_type_errors
+
+
+def _rule_errors(instance, rules):
+    """
+    checks `instance` against resolved |rules|\ , see :func:`ImmutableType._configured_rules`
+
+    :return: the |ValidationException| of the first failing |rule|\ , or ``None``
+    """
+    for rule, config in rules:
+        try:
+            rule(instance, config)
+        except ValidationException as error:
+            if error.__class__ is ValidationException and error.property_type is instance.__class__ and \
+                    not error._parents:
+                return error
+            exception = ValidationException(instance.__class__)
+            exception.add_validation_messages(error.message_templates)
+            return exception
+    return None
+
+
+def _native_rule_errors(value, rules, create):
+    """
+    checks resolved |rules| against a native `value`\ . if a |rule| fails, or can not check a native value because it
+    raises ``AttributeError`` or ``TypeError``\ , the instance is created with `create` and checked again to produce the
+    |ValidationException|\ . any other error of a |rule| is raised
+
+    :return: the |ValidationException| of the first failing |rule|\ , or ``None``
+    """
+    try:
+        for rule, config in rules:
+            rule(value, config)
+        return None
+    # the rule may fail only because value is not an instance of the type, e.g. when creating its message
+    except (ValidationException, AttributeError, TypeError):
+        pass
+    try:
+        instance = create()
+    except ValidationException as exception:
+        return exception
+    return _rule_errors(instance, rules)
+
+
+def _collect_validation_errors(instance, config):
+    """
+    :return: the |ValidationException| describing why `instance` is invalid according to `config`\ , or ``None``.
+             only raises and catches the exception if the |type| of `instance` overrides
+             :func:`validate()<prestans3.types.ImmutableType.validate>`
+    """
+    validate = instance.__class__.validate
+    # py2to3 replace getattr(..., '__func__', ...) with validate
+    if getattr(validate, '__func__', validate) is _immutable_type_validate:
+        return instance._validation_errors(config)
+    try:
+        instance.validate(config)
+    except ValidationException as exception:
+        return exception
+    return None
+
+
+def _error_message(error):
+    """ :return: the message of a coercion error, which some |types| raise with the |type| as the first argument """
+    return str(error.args[-1]) if error.args else error.__class__.__name__
+
+
+_immutable_type_validate = ImmutableType.__dict__['validate']
+_immutable_type_errors = ImmutableType.__dict__['_validation_errors']
+
 PrestansTypeMeta._property_rule_graph = LazyOneWayGraph(ImmutableType)
 PrestansTypeMeta._config_check_graph = LazyOneWayGraph(ImmutableType)
 PrestansTypeMeta._prepare_functions_graph = LazyOneWayGraph(ImmutableType)
@@ -210,18 +551,25 @@ def _choices(instance, config):
     Property rule to check whether the instance is equal to a member of the provided list
 
     :param |ImmutableType| instance: the instance to check
-    :param config: a list of |ImmutableTypes| or equivalent natives to equate against
+    :param config: a list of |ImmutableTypes| or equivalent natives to equate against, or a |Choices| index
     :raises |ValidationException|\ : if the `instance not in config`
     """
-    if instance not in config:
-        from ..errors import ValidationException
-        raise ValidationException(instance.__class__,
-                                  "{} property is {}, valid choices are [{}]"
-                                  .format(instance.__class__.__name__, instance,
-                                          ", ".join([str(item) for item in config])))
+    choices = Choices.from_config(config)
+    if instance not in choices:
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'choices', "{} property is {}, valid choices are [{}]", (instance.__class__.__name__, instance, choices)))
 
 
-ImmutableType.register_property_rule(_choices, name="choices")
+def _batch_choices(instances, config, cache):
+    """ batch variant of the choices rule, checks membership of all instances against the |Choices| index """
+    choices = Choices.from_config(config)
+    if choices.contains_all(instances):
+        return []
+    return [index for index, instance in enumerate(instances) if instance not in choices]
+
+
+ImmutableType.register_property_rule(_choices, name="choices", prepare_config=Choices.from_config,
+                                     batch=_batch_choices)
 
 
 class _Property(object):
@@ -242,6 +590,7 @@ class _Property(object):
         self.required = required
         self.default = default
         self.prepare = prepare if prepare is not None else []
+        self._prepare_process_function = self._compose_prepare_functions(self.prepare)
 
     def __set__(self, instance, value):
         """
@@ -254,11 +603,39 @@ class _Property(object):
         :type value: T <= G
         """
         # if value is a ImmutableType then set it otherwise construct it from variable
-        prepared_value = self.prepare_process_function(value[1])
+        prepare = self._prepare_process_function
+        prepared_value = value[1] if prepare is None else prepare(value[1])
         if isinstance(value[1], self._of_type):
             instance[value[0]] = prepared_value
         else:
-            instance[value[0]] = self._of_type.from_value(prepared_value)
+            instance[value[0]] = self._coerce(prepared_value)
+
+    def _coerce(self, value):
+        """ coerces a value that is not an instance of this |_Property|\ 's |type| when it is set """
+        return self._of_type.from_value(value)
+
+    def _native_errors(self, value):
+        """
+        validates a native value as if it were set on this |_Property| and then validated, see
+        :func:`ImmutableType.validate_native`
+
+        :return: the |ValidationException| of `value`\ , or ``None``
+        """
+        prepare = self._prepare_process_function
+        if prepare is not None:
+            value = prepare(value)
+        try:
+            validate = _native_validators[self]
+        except KeyError:
+            validate = _native_validators[self] = self._native_validator()
+        return validate(value)
+
+    def _native_validator(self):
+        """
+        :return: the native validator of the |type| of this |_Property| for its configured |rules|\ , see
+                 :func:`ImmutableType._native_validator`. cached until another |rule| is registered
+        """
+        return self._of_type._native_validator(self._rules_config, self._coerce)
 
     # noinspection PyUnusedLocal
     def __get__(self, instance, owner):
@@ -308,6 +685,8 @@ class _Property(object):
                                       "{} is a non-configurable rule in class {}, (see {}.{}()))"
                                       .format(key, self.property_type.__name__, ImmutableType.__name__,
                                               ImmutableType.register_property_rule.__name__))
+        if _rule.prepare_config is not None:
+            config = _rule.prepare_config(config)
         return key, config
 
     def get_rule_config(self, key):
@@ -341,26 +720,52 @@ class _Property(object):
         """
         Return the aggregated process chain function that will iterate through configured prepare parameter from the
         init function. it will honour the order of arguments in the list and produce a resulting object that must be of
-        the same type as its input, otherwise an error will be raised
+        the same type as its input, otherwise an error will be raised. The chain is resolved and composed once, when
+        this |_Property| is created.
 
         :return: a function that will process the string
         """
+        if self._prepare_process_function is None:
+            return _identity
+        return self._prepare_process_function
+
+    def _compose_prepare_functions(self, prepare):
+        """
+        resolves the configured prepare functions and composes them into a single callable, dropping steps made
+        redundant by the next step (see :func:`~prestans3.types.ImmutableType.register_prepare_function`)
 
+        :return: the composed function, or ``None`` if there are no prepare functions
+        """
         # py2to3 replace is_str with isinstance(x, str)
-        if not is_str(self.prepare) and hasattr(self.prepare, '__iter__') and hasattr(self.prepare, '__len__'):
-            return self._aggregate_prepare_functions(self.prepare)
+        if not is_str(prepare) and hasattr(prepare, '__iter__') and hasattr(prepare, '__len__'):
+            steps = [self._resolve_prepare_function(step) for step in prepare]
         else:
-            return self._resolve_prepare_function(self.prepare)
-
-    def _aggregate_prepare_functions(self, rest):
-        """ recursively calls each function in the order defined and returns the output """
-
-        def _all(x, tail):
-            if len(tail) < 1:
-                return x
-            return _all(self._resolve_prepare_function(tail[0])(x), tail[1:])
-
-        return lambda x: _all(x, rest)
+            steps = [self._resolve_prepare_function(prepare)]
+        steps = self._fuse_prepare_functions(steps)
+        if not steps:
+            return None
+        elif len(steps) == 1:
+            return steps[0]
+        steps = tuple(steps)
+
+        def _pipeline(x):
+            for step in steps:
+                x = step(x)
+            return x
+
+        return _pipeline
+
+    def _fuse_prepare_functions(self, steps):
+        """ removes repeated idempotent steps and steps whose effect is included in the step that follows """
+        prepare_functions = self.property_type.prepare_functions
+        fused = []
+        for step in steps:
+            idempotent, supersedes = _prepare_function_hints.get(step, (False, frozenset()))
+            while fused and ((idempotent and fused[-1] is step) or
+                             any(prepare_functions.get(name) is fused[-1] for name in supersedes)):
+                fused.pop()
+            fused.append(step)
+        return fused
 
     def _resolve_prepare_function(self, str_or_func):
         """
@@ -397,6 +802,13 @@ class _Property(object):
                             "received: {} of type {}".format(str_or_func, str_or_func.__class__.__name__))
 
 
+def _identity(x):
+    return x
+
+
+_property_set = _Property.__dict__['__set__']
+
+
 # noinspection PyAbstractClass
 class Container(ImmutableType):
     """ subclass of all |types| with containable |attributes| """
@@ -423,3 +835,4 @@ from .array import Array as Array
 from .p_date import Date as Date
 from .p_datetime import DateTime as DateTime
 from .p_time import Time as Time
+from .temporal_array import TemporalArray as TemporalArray
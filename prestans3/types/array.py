@@ -8,12 +8,14 @@
     :copyright: (c) 2016 Anomaly Software
     :license: Apache 2.0, see LICENSE for more details.
 """
-from collections import Iterable
-from copy import copy
+import functools
 
-from ..errors import ValidationException, AccessError, ContainerValidationException
-from ..types import Container, ImmutableType, _Property
-from ..utils import inject_class, MergingProxyDictionary
+from ..errors import ValidationException, ValidationMessage, AccessError, ContainerValidationException, \
+    ValidationResult, IndexRanges
+from ..types import Container, ImmutableType, _Property, _builtin_converter, _has_specialised_builtin_converter, \
+    _collect_validation_errors, _error_message, _rule_errors, _validates_with_rules, _native_rule_errors, \
+    _immutable_type_validate
+from ..utils import inject_class, MergingProxyDictionary, ImmutableMergingDictionary
 
 # py2to3 remove try, prefer builtins
 try:
@@ -21,10 +23,18 @@ try:
 except ImportError:
     from builtins import property as prop
 
+FIRST_FAILURE = 'first'
+""" element failure mode that stops validating the elements of an |Array| at the first invalid element """
+ALL_FAILURES = 'all'
+""" element failure mode that validates every element of an |Array|\ , grouping elements that fail in the same way """
+
+element_failure_modes = (FIRST_FAILURE, ALL_FAILURES)
+
 
 def find_first(array, func):
     """
-    return the index of the first occurence of item in array that fulfils func
+    return the index of the first occurence of item in array that fulfils func. no longer used by |Array| itself, it is
+    kept only as public API
 
     :param iterable array: iterable to check for condition
     :param func: a function that accepts an element of the array and returns a true when condition is met
@@ -43,53 +53,66 @@ class Array(Container):
     Prestans 3 Array type. Wraps a native python list and delegates most operations to it. Provides Prestans 3
     functionality such as serialization and validation.
 
-    Note: Validation will stop at the first error by default.
+    Note: Validation will stop at the first error by default. configure ``element_failures`` as :data:`ALL_FAILURES`
+    to report every invalid element, elements failing the same |rules| are reported together under their
+    |IndexRanges|\ .
+
+    >>> from prestans3.types import Array, String
+    >>> words = Array(String, ['spam', 'ham', 'eggs', 'toast', 'jam'])
+    >>> result = words.validate_result({'element_rules': {'max_length': 3}, 'element_failures': ALL_FAILURES})
+    >>> [summary[0] for summary in result.errors]
+    ['Array[0,2-3]']
     """
 
-    def __init__(self, of_type, iterable=None, **kwargs):
-        if iterable is None:
-            iterable = []
+    def __init__(self, of_type, iterable=None, copy_list=True, **kwargs):
+        """
+        coerces each element of `iterable` to `of_type` in a single pass. a ``list`` whose elements are all instances of
+        `of_type` already is copied as it is, or kept as the storage of this |Array| when `copy_list` is ``False``
+
+        :param of_type: the |type| of the elements
+        :param iterable: the elements, or values coercible to `of_type`
+        :param bool copy_list: ``False`` hands a ``list`` `iterable` over to this |Array|\ , it must not be changed by
+                               the caller afterwards
+        :param dict kwargs: additional values to pass to the next super call (see :class:`~prestans3.types.Container`)
+        """
         if not isinstance(of_type, type):
             raise TypeError("of_type must be a subclass of {} type object, received {}".format(ImmutableType.__name__,
                                                                                                of_type.__class__.__name__))
         elif not issubclass(of_type, ImmutableType):
             raise TypeError("of_type must be a subclass of {} type object, received {}".format(ImmutableType.__name__,
                                                                                                of_type.__name__))
-        if not isinstance(iterable, Iterable):
-            raise TypeError(
-                "iterable argument of type {} is not an iterable object".format(iterable.__class__.__name__))
         self._of_type = of_type
-        if isinstance(iterable, self.__class__):
-            if not issubclass(iterable._of_type, self._of_type):
-                raise TypeError("element type '{}' of iterable is not a subclass of element type '{}' of self".format(
-                    iterable._of_type.__name__, self._of_type.__name__))
-        coerced_iterable = []
-
-        def _check_and_store(item):
+        if iterable is None:
+            self._values = []
+        elif iterable.__class__ is list and all(issubclass(element_type, of_type)
+                                                for element_type in set(map(type, iterable))):
+            self._values = list(iterable) if copy_list else iterable
+        else:
+            if isinstance(iterable, self.__class__):
+                if not issubclass(iterable._of_type, self._of_type):
+                    raise TypeError("element type '{}' of iterable is not a subclass of element type '{}' of "
+                                    "self".format(iterable._of_type.__name__, self._of_type.__name__))
             try:
-                coerced_iterable.append(of_type.from_value(item))
-                return True
+                elements = enumerate(iterable)
             except TypeError:
-                return False
-
-        iterable = list(iterable)
-        first_error_index = find_first(iterable, _check_and_store)
-        if first_error_index > -1:
-            raise ValueError(self.__class__, 'in Array.__init__, iterable[{}] is {} of type {}, '
-                                             'but the declared type of this array is {}'.format(
-                first_error_index, iterable[first_error_index], iterable[first_error_index].__class__.__name__,
-                of_type.__name__))
-        self._values = list(coerced_iterable)
+                raise TypeError(
+                    "iterable argument of type {} is not an iterable object".format(iterable.__class__.__name__))
+            self._values = values = []
+            from_value = of_type.from_value
+            for index, item in elements:
+                try:
+                    values.append(from_value(item))
+                except TypeError:
+                    raise ValueError(self.__class__, 'in Array.__init__, iterable[{}] is {} of type {}, but the '
+                                                     'declared type of this array is {}'.format(
+                        index, item, item.__class__.__name__, of_type.__name__))
         super(Array, self).__init__(**kwargs)
 
     @classmethod
-    def from_value(cls, value):
-        try:
-            return super(Array, cls).from_value(value)
-        except NotImplementedError:
-            raise NotImplementedError(
-                '{class_name} must declare an explicit element type, create an array from an existing native ' +
-                'array using the constructor: {class_name}(<type>, native_array)'.format(class_name=cls.__name__))
+    def _not_coercible(cls, value):
+        raise NotImplementedError(
+            '{class_name} must declare an explicit element type, create an array from an existing native ' +
+            'array using the constructor: {class_name}(<type>, native_array)'.format(class_name=cls.__name__))
 
     @classmethod
     def mutable(cls, of_type, iterable=None, **kwargs):
@@ -103,47 +126,139 @@ class Array(Container):
     @classmethod
     def property(cls, element_type, element_rules=None, **kwargs):
         """
+        the ``element_failures`` keyword argument, one of :data:`element_failure_modes`\ , configures whether validation
+        stops at the first invalid element
+
         :return: configured |_Property| Class
         :rtype: |_Property|
         """
         return _ArrayProperty(of_type=cls, element_type=element_type, element_rules=element_rules, **kwargs)
 
-    def validate(self, config=None):
+    @classmethod
+    def construct_trusted(cls, of_type, iterable=None, check=False):
+        """
+        creates an |Array| of `of_type` holding the elements of `iterable` as they are, for elements that are known to
+        be valid already. unlike ``cls(of_type, iterable)``\ , the elements are not coerced, no validation is performed
+        and ``__init__`` is not called
+
+        :param of_type: the |type| of the elements
+        :param iterable: the elements, each an instance of `of_type`
+        :param bool check: whether to assert that each element is an instance of `of_type`\ , the assertions are
+                           skipped when python runs with ``-O``
+        :rtype: |Array|
+        """
+        instance = cls.__new__(cls)
+        instance._of_type = of_type
+        instance._values = [] if iterable is None else list(iterable)
+        if check:
+            _check_trusted_elements(of_type, instance._values)
+        return instance
+
+    @classmethod
+    def try_from_value(cls, of_type, value, config=None):
+        """
+        as :func:`ImmutableType.try_from_value()<prestans3.types.ImmutableType.try_from_value>` for an |Array| of
+        `of_type` created from the iterable `value`\ , which is validated once after the |Array| is created
+
+        :rtype: |ValidationResult|
+        """
+        try:
+            instance = cls(of_type, value, validate_immediately=False)
+        except ValidationException as exception:
+            return ValidationResult(errors=exception)
+        except (TypeError, ValueError) as error:
+            return ValidationResult(errors=ValidationException(cls, _error_message(error)))
+        return instance.validate_result(config)
+
+    def _validation_errors(self, config):
         """
         this validate will check all of it's elements, then check the global element rule config set on the array, then
         check any validation on the array itself. by default, the first element in this array to have a validation error
-        will stop the validation checks on elements and return with a message.
+        will stop the validation checks on elements and return with a message, unless the ``element_failures`` config is
+        :data:`ALL_FAILURES`\ .
 
         :param config: the rule configuration for this array and its elements
-        :raises ValidationException: if there are invalid contents or the array itself is invalid according to the given
-                                     config
+        :return: the |ValidationException| if there are invalid contents or the array itself is invalid according to the
+                 given config, otherwise ``None``
         """
-        validation_exception = None
-        _index = 0
-        element_rules = {}
-        if config is None:
-            array_rules = {}
+        array_rules, element_rules, element_failures = _split_config(config)
+        failing_indices = self._batch_validate_elements(element_rules)
+        if failing_indices is None:
+            elements_to_validate = enumerate(self)
         else:
-            # py2to3 unwrap .items()
-            array_rules = {key: config for key, config in list(config.items()) if key != 'element_rules'}
-            if 'element_rules' in config:
-                element_rules = config['element_rules']
-        try:
-            for index, element in enumerate(self._values):  # type: ImmutableType
-                _index = index
-                element.validate(element_rules)
-        except ValidationException as exception:
-            if not validation_exception:
-                validation_exception = ArrayValidationException(self.__class__)
-            validation_exception.add_validation_exception('{}[{}]'.format(self.__class__.__name__, _index), exception)
-        try:
-            super(Array, self).validate(array_rules)
-        except ValidationException as exception:
-            if not validation_exception:
-                validation_exception = ArrayValidationException(self.__class__)
-            validation_exception.add_validation_messages(exception.messages)
-        if validation_exception:
-            raise validation_exception
+            # the batch rules found the failing elements, only these are validated to build the error messages
+            elements_to_validate = ((index, self[index]) for index in failing_indices)
+        validate_element = _element_validator(self._of_type, element_rules)
+        validation_exception = _element_errors(self.__class__, elements_to_validate, validate_element, element_failures,
+                                               functools.partial(_element_exception, self, validate_element))
+        return _with_array_errors(self.__class__, validation_exception,
+                                  super(Array, self)._validation_errors(array_rules))
+
+    @classmethod
+    def validate_native(cls, value, element_type, config=None):
+        """
+        validates a native ``list`` as if an |Array| of `element_type` were created from it and validated against
+        `config`\ , without creating the |Array| or its elements where the |rules| can be checked against the native
+        values, see :func:`ImmutableType.validate_native()<prestans3.types.ImmutableType.validate_native>`
+
+        >>> from prestans3.types import Array, String
+        >>> Array.validate_native(['spam', 'ham'], String, {'element_rules': {'max_length': 3}}).ok
+        False
+
+        :rtype: |ValidationResult|
+        """
+        return ValidationResult(value, cls._native_array_errors(element_type, value, config))
+
+    @classmethod
+    def _native_array_errors(cls, element_type, value, config):
+        """ :return: the |ValidationException| of validating the native ``list`` `value`\ , or ``None`` """
+        return cls._native_array_validator(element_type, config)(value)
+
+    @classmethod
+    def _native_array_validator(cls, element_type, config):
+        """
+        resolves the |rules| of the array and its elements once for validating many native ``lists``\ . native
+        scalar elements are checked in bulk by the batch |rules| where possible, then with :data:`ALL_FAILURES` an
+        element is only created for the first element failing each |rule|
+
+        :return: a function returning the |ValidationException| of a native ``list``\ , or ``None``
+        """
+        array_rules, element_rules, element_failures = _split_config(config)
+        validate_element = element_type._native_validator(element_rules)
+        rules = cls._configured_rules(array_rules)
+        validates_natively = _validates_natively(cls)
+        native_type = element_type._native_type if _validates_with_rules(element_type) else None
+
+        def _validate(value):
+            if isinstance(value, Array):
+                return _collect_validation_errors(value, config)
+            elif not isinstance(value, (list, tuple)) or not validates_natively:
+                return cls.try_from_value(element_type, value, config).errors
+
+            def _create():
+                try:
+                    return cls(element_type, value, validate_immediately=False)
+                except (TypeError, ValueError, ValidationException):
+                    # the invalid elements are reported already, the array itself is checked with its native elements
+                    return cls.construct_trusted(element_type, value)
+
+            first_failures = None
+            if native_type is not None:
+                first_failures = _batch_first_failures(element_type, value, element_rules, native_type)
+            if first_failures is None:
+                elements_to_validate = enumerate(value)
+            else:
+                elements_to_validate = ((index, value[index]) for index in sorted(first_failures))
+            validation_exception = _element_errors(cls, elements_to_validate, validate_element, element_failures,
+                                                   functools.partial(_element_exception, value, validate_element),
+                                                   first_failures)
+            return _with_array_errors(cls, validation_exception, _native_rule_errors(value, rules, _create))
+
+        return _validate
+
+    def _batch_validate_elements(self, element_rules):
+        """ :return: the sorted indices of the elements failing `element_rules`, or ``None`` if unknown """
+        return _batch_validate(self._of_type, self._values, element_rules)
 
     @prop
     def native_value(self):
@@ -195,11 +310,11 @@ class Array(Container):
 
     def tail(self):
         """ get all elements after the first """
-        return Array(self._of_type, self._values[1:], validate_immediately=False)
+        return Array(self._of_type, self._values[1:], copy_list=False, validate_immediately=False)
 
     def init(self):
         """ get elements up to the last """
-        return Array(self._of_type, self._values[:-1], validate_immediately=False)
+        return Array(self._of_type, self._values[:-1], copy_list=False, validate_immediately=False)
 
     def last(self):
         """ get last element """
@@ -207,49 +322,260 @@ class Array(Container):
 
     def drop(self, n):
         """ get all elements except first n """
-        return Array(self._of_type, self._values[n:], validate_immediately=False)
+        return Array(self._of_type, self._values[n:], copy_list=False, validate_immediately=False)
 
     def take(self, n):
         """ get first n elements """
-        return Array(self._of_type, self._values[:n], validate_immediately=False)
+        return Array(self._of_type, self._values[:n], copy_list=False, validate_immediately=False)
 
     def copy(self):
         """ create a copy of the array """
-        return Array(self._of_type, copy(self._values), validate_immediately=False)
+        return Array(self._of_type, self._values, validate_immediately=False)
+
+
+def _check_trusted_elements(of_type, elements):
+    """ asserts that each of the `elements` given to ``construct_trusted`` is an instance of `of_type` """
+    for index, element in enumerate(elements):
+        assert isinstance(element, of_type), "iterable[{}] is {} of type {}, but the declared type of this array is " \
+                                             "{}".format(index, element, element.__class__.__name__, of_type.__name__)
+
+
+def _split_config(config):
+    """ :return: the |rules| configuration of an |Array| itself, that of its elements and its element failure mode """
+    if config is None:
+        return {}, {}, FIRST_FAILURE
+    # py2to3 unwrap .items()
+    array_rules = {key: config for key, config in list(config.items())
+                   if key != 'element_rules' and key != 'element_failures'}
+    element_rules = config.get('element_rules')
+    element_failures = config.get('element_failures')
+    return array_rules, element_rules or {}, element_failures or FIRST_FAILURE
+
+
+def _element_errors(array_type, elements_to_validate, validate_element, element_failures, expand,
+                    failure_keys=None):
+    """
+    validates the (index, element) pairs `elements_to_validate` with `validate_element`\ . all of them are validated
+    for :data:`ALL_FAILURES`\ , where elements of a scalar |type| failing with the same message templates are grouped
+    into one entry keyed by their |IndexRanges|
+
+    :param expand: the expander of the grouped failures, see :func:`ArrayValidationException.add_element_failures`
+    :param failure_keys: how the element at each index fails, e.g. the first |rule| it fails. only the first element
+                         with each key is validated for :data:`ALL_FAILURES`\ , the others are grouped with it
+    :type failure_keys: dict[int, any]
+    :return: the |ArrayValidationException| of the failing elements, or ``None`` if all are valid
+    """
+    if element_failures != ALL_FAILURES:
+        for index, element in elements_to_validate:  # type: ImmutableType
+            exception = validate_element(element)
+            if exception is not None:
+                return ArrayValidationException(array_type, (index, exception))
+        return None
+    groups = {}
+    # the groups and the elements that are never grouped, in order of their first failing index
+    failures = []
+    keyed_groups = {}
+    for index, element in elements_to_validate:  # type: ImmutableType
+        key = None if failure_keys is None else failure_keys.get(index)
+        if key is not None and key in keyed_groups:
+            keyed_groups[key][0].append(index)
+            continue
+        exception = validate_element(element)
+        if exception is None:
+            continue
+        signature = _failure_signature(exception)
+        if signature is None:
+            failures.append(([index], exception))
+            continue
+        if signature in groups:
+            groups[signature][0].append(index)
+        else:
+            groups[signature] = ([index], exception)
+            failures.append(groups[signature])
+        if key is not None:
+            keyed_groups[key] = groups[signature]
+    if not failures:
+        return None
+    validation_exception = ArrayValidationException(array_type)
+    for indices, exception in failures:
+        validation_exception.add_element_failures(indices, exception, expand)
+    return validation_exception
+
+
+def _with_array_errors(array_type, validation_exception, array_exception):
+    """ :return: `validation_exception` with the messages of `array_exception`\ , the failures of the array itself """
+    if array_exception is None:
+        return validation_exception
+    if validation_exception is None:
+        validation_exception = ArrayValidationException(array_type)
+    validation_exception.add_validation_messages(array_exception.message_templates)
+    return validation_exception
+
+
+def _failure_signature(exception):
+    """
+    :return: what identifies the way an element failed its |rules|\ , the template ids of its messages, or ``None`` if
+             the element has dependant exceptions and is never grouped
+    """
+    if isinstance(exception, ContainerValidationException):
+        return None
+    return tuple(message.template_id if isinstance(message, ValidationMessage) else message
+                 for message in exception.message_templates)
+
+
+def _element_validator(of_type, element_rules):
+    """
+    :return: a function returning the |ValidationException| of an element validated against `element_rules`\ , or
+             ``None``. the configured |rules| are resolved once for all elements exactly of type `of_type`
+    """
+    if not _validates_with_rules(of_type):
+        return lambda element: _collect_validation_errors(element, element_rules)
+    rules = of_type._configured_rules(element_rules)
+
+    def _validate(element):
+        if element.__class__ is of_type:
+            return _rule_errors(element, rules)
+        return _collect_validation_errors(element, element_rules)
+
+    return _validate
+
+
+def _element_exception(array, validate_element, index):
+    """ :return: the |ValidationException| of the element at `index`, used to expand grouped element failures """
+    return validate_element(array[index])
+
+
+def _validates_natively(of_type):
+    """
+    whether an |Array| of `of_type` is created and validated as :class:`Array` itself, so that native ``lists`` can be
+    validated without creating it
+    """
+    # py2to3 replace getattr(..., '__func__', ...) with of_type.__init__, of_type.validate and ._validation_errors
+    return getattr(of_type.__init__, '__func__', of_type.__init__) is _array_init and \
+        getattr(of_type.validate, '__func__', of_type.validate) is _immutable_type_validate and \
+        getattr(of_type._validation_errors, '__func__', of_type._validation_errors) is _array_validation_errors
+
+
+def _batch_validate(of_type, elements, element_rules):
+    """
+    checks all elements at once with the batch variants of the configured element |rules|\ .
+
+    :return: the sorted indices of the failing elements, or ``None`` if the elements can not be checked in bulk because
+             they are not all exactly of type `of_type`, `of_type` is not a scalar |type| or a configured |rule| has no
+             batch variant
+    """
+    first_failures = _batch_first_failures(of_type, elements, element_rules)
+    return None if first_failures is None else sorted(first_failures)
+
+
+def _batch_first_failures(of_type, elements, element_rules, element_class=None):
+    """
+    as :func:`_batch_validate`\ , for elements that are all exactly of `element_class`\ , `of_type` by default or its
+    native type for native elements
+
+    :return: the first |rule| each failing element fails, by index, or ``None`` if the elements can not be checked in
+             bulk
+    :rtype: dict[int, function]
+    """
+    if not elements or not of_type.is_scalar or set(map(type, elements)) != {element_class or of_type}:
+        return None
+    rule_failures = _batch_rule_failures(of_type, elements, element_rules, {})
+    if rule_failures is None:
+        return None
+    first_failures = {}
+    for rule, indices in rule_failures:
+        for index in indices:
+            first_failures.setdefault(index, rule)
+    return first_failures
+
+
+def _run_batch_rules(of_type, elements, element_rules, cache):
+    """
+    runs the batch variants of the configured element |rules| over `elements`, which must all be exactly of type
+    `of_type`. `cache` is shared by the batch rules and may be seeded with derived values.
+
+    :return: the sorted indices of the failing elements, or ``None`` if a configured |rule| has no batch variant or
+             can not check its configuration in bulk
+    """
+    rule_failures = _batch_rule_failures(of_type, elements, element_rules, cache)
+    if rule_failures is None:
+        return None
+    return sorted(set(index for _, indices in rule_failures for index in indices))
+
+
+def _batch_rule_failures(of_type, elements, element_rules, cache):
+    """
+    :return: each configured element |rule| paired with the indices of the elements failing its batch variant, in
+             the order the |rules| are checked, or ``None`` if one of them can not be checked in bulk
+    """
+    config = ImmutableMergingDictionary(element_rules, of_type.default_rules_config())
+    rule_failures = []
+    # py2to3 unwrap .items()
+    for rule_name, rule in list(of_type.property_rules.items()):
+        if rule_name in config:
+            if rule.batch is None:
+                return None
+            indices = rule.batch(elements, config[rule_name], cache)
+            if indices is None:
+                return None
+            rule_failures.append((rule, indices))
+    return rule_failures
 
 
 def _min_length(instance, config):
     length = len(instance)
     if length < config:
-        raise ValidationException(instance.__class__,
-                                  "{} instance length is {}, the minimum configured length is {}".format(
-                                      instance.__class__.__name__, length, config))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'array.min_length', "{} instance length is {}, the minimum configured length is {}",
+            (instance.__class__.__name__, length, config)))
 
 
 def _max_length(instance, config):
     length = len(instance)
     if length > config:
-        raise ValidationException(instance.__class__,
-                                  "{} instance length is {}, the maximum configured length is {}".format(
-                                      instance.__class__.__name__, length, config))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'array.max_length', "{} instance length is {}, the maximum configured length is {}",
+            (instance.__class__.__name__, length, config)))
+
 
+_array_init = Array.__dict__['__init__']
+_array_validation_errors = Array.__dict__['_validation_errors']
 
 Array.register_property_rule(_min_length, name="min_length")
 Array.register_property_rule(_max_length, name="max_length")
 
 
+def _to_list(instance):
+    """
+    converts all elements of an |Array| to builtins in one pass, using the builtin converter of the element type unless
+    a subclass of the element type registers its own converter
+    """
+    if _has_specialised_builtin_converter(instance._of_type):
+        return [value.to_builtin() for value in instance._values]
+    return list(map(_builtin_converter(instance._of_type), instance._values))
+
+
+Array.register_builtin_converter(_to_list)
+
+
 class _ArrayProperty(_Property):
     """
     allows for property rule configuration that checks all elements
     """
 
-    def __init__(self, of_type, element_type, element_rules=None, **kwargs):
+    def __init__(self, of_type, element_type, element_rules=None, element_failures=None, **kwargs):
         # py2to3 unwrap .items()
         super(_ArrayProperty, self).__init__(of_type, **{key: config for key, config in list(kwargs.items()) if
                                                          key in ['required', 'default']})
+        if element_failures is not None and element_failures not in element_failure_modes:
+            raise ValueError("element_failures of {} property must be one of {}, received {}".format(
+                of_type.__name__, ", ".join(element_failure_modes), element_failures))
         self._element_type = element_type
+        if element_rules is not None:
+            element_rules = self._prepare_element_rules_config(element_rules)
         self._element_rules_config = element_rules if element_rules is not None else {}
-        self._rules_config = MergingProxyDictionary({'element_rules': element_rules},
+        self._rules_config = MergingProxyDictionary({'element_rules': element_rules,
+                                                     'element_failures': element_failures},
                                                     self._get_and_check_rules_config(kwargs),
                                                     of_type.default_rules_config())
 
@@ -264,7 +590,21 @@ class _ArrayProperty(_Property):
         if isinstance(value[1], self._of_type):
             super(_ArrayProperty, self).__set__(instance, value)
         elif hasattr(value, '__getitem__'):
-            super(_ArrayProperty, self).__set__(instance, (value[0], Array(self._element_type, value[1])))
+            super(_ArrayProperty, self).__set__(instance, (value[0], self._of_type(self._element_type, value[1])))
+
+    def _native_validator(self):
+        return self._of_type._native_array_validator(self._element_type, self._rules_config)
+
+    def _prepare_element_rules_config(self, element_rules):
+        """ applies the prepare_config function of each configured element |rule|\ , if it has one """
+        prepared = {}
+        # py2to3 unwrap .items()
+        for key, config in list(element_rules.items()):
+            rule = self._element_type.property_rules.get(key)
+            if rule is not None and rule.prepare_config is not None:
+                config = rule.prepare_config(config)
+            prepared[key] = config
+        return prepared
 
     def _get_and_check_rule_config(self, key, config):
         try:
@@ -303,5 +643,48 @@ class _MutableArray(Array):
 
 
 class ArrayValidationException(ContainerValidationException):
+    """
+    the validation exception of an |Array|\ . invalid elements are keyed by their index, or by an |IndexRanges| when
+    many elements failed in the same way, see :func:`expand`
+    """
+
+    def __init__(self, of_type, message_or_key_exception_tuple=None):
+        self._expanders = {}
+        super(ArrayValidationException, self).__init__(of_type, message_or_key_exception_tuple)
+
+    def add_element_failures(self, indices, validation_exception, expand=None):
+        """
+        adds one validation exception for the elements at `indices`, which all failed validation in the same way
+
+        :param list[int] indices: the indices of the failing elements, in ascending order
+        :param |ValidationException| validation_exception: the validation exception of the first failing element
+        :param expand: creates the validation exception of the element at an index, see :func:`expand`
+        :type expand: (int) -> |ValidationException|
+        """
+        if len(indices) == 1:
+            self.add_validation_exception(indices[0], validation_exception)
+            return
+        key = IndexRanges.from_indices(indices)
+        self.add_validation_exception(key, validation_exception)
+        if expand is not None:
+            self._expanders[key] = expand
+
+    def expand(self):
+        """
+        :return: a copy of this exception with an entry for each element, in place of the grouped element failures. the
+                 exceptions of the grouped elements are created again, or shared if they can not be
+        :rtype: |ArrayValidationException|
+        """
+        expanded = self.__class__(self._of_type)
+        expanded.add_validation_messages(self.message_templates)
+        for key, validation_exception in self._dependants():
+            if not isinstance(key, IndexRanges):
+                expanded.add_validation_exception(key, validation_exception)
+                continue
+            expand = self._expanders.get(key)
+            for index in key.indices():
+                expanded.add_validation_exception(index, validation_exception if expand is None else expand(index))
+        return expanded
+
     def check_validation_exception(self, key, validation_exception):
         super(ArrayValidationException, self).check_validation_exception(key, validation_exception)
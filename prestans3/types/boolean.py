@@ -9,7 +9,7 @@
     :license: Apache 2.0, see LICENSE for more details.
 """
 
-from . import ImmutableType
+from . import ImmutableType, _construct
 
 
 # http://stackoverflow.com/questions/2172189/why-i-cant-extend-bool-in-python
@@ -20,14 +20,8 @@ class Boolean(ImmutableType):
     """
 
     @classmethod
-    def from_value(cls, value):
-        try:
-            return super(Boolean, cls).from_value(value)
-        except NotImplementedError:
-            if value.__class__ is not bool:
-                raise TypeError(
-                    "{} of type {} is not a subclass of {} or a bool".format(value, value.__class__.__name__, cls))
-            return Boolean(value)
+    def _not_coercible(cls, value):
+        raise TypeError("{} of type {} is not a subclass of {} or a bool".format(value, value.__class__.__name__, cls))
 
     def __init__(self, value=False):
         self._value = value
@@ -54,3 +48,7 @@ class Boolean(ImmutableType):
         :return: bool
         """
         return self._value == other_instance._value
+
+
+Boolean.register_coercer(bool, _construct)
+Boolean.register_builtin_converter(bool)
@@ -8,14 +8,20 @@
     :copyright: (c) 2016 Anomaly Software
     :license: Apache 2.0, see LICENSE for more details.
 """
+import binascii
 import codecs
+import hashlib
+import io
 import re
+import tempfile
+from itertools import chain
+
+from future.utils import string_types
 
-import future
 from ..utils import is_str
 
-from ..errors import ValidationException
-from . import ImmutableType
+from ..errors import ValidationException, ValidationMessage, PropertyConfigError
+from . import ImmutableType, _construct
 
 
 class DataURLFile(ImmutableType):
@@ -29,9 +35,25 @@ class DataURLFile(ImmutableType):
 
     regex = re.compile(r'^data:([\w/\-.]+);(\w+),(.*)$')
 
+    spool_threshold = 1024 * 1024
+    """
+    size in bytes above which decoded contents are spooled to a temporary file on disk rather than held in memory. see
+    :func:`from_stream` and :func:`open`
+    """
+
+    stream_chunk_size = 64 * 1024
+    """ number of encoded bytes read and decoded at a time when streaming contents """
+
+    max_header_length = 1024
+    """ the maximum length of the ``data:<mime_type>;<encoding>,`` header accepted by :func:`from_stream` """
+
     @property
     def native_value(self):
-        return self.to_native_value(self.contents, self.encoding, self.mime_type)
+        if self._text is not None:
+            return self._text
+        elif self._buffer is None:
+            return self.to_native_value(self.contents, self.encoding, self.mime_type)
+        return self._buffer.tobytes().decode('utf-8')
 
     @classmethod
     def generate_filename(cls):
@@ -40,15 +62,56 @@ class DataURLFile(ImmutableType):
 
     @classmethod
     def from_value(cls, value):
-        try:
-            return super(DataURLFile, cls).from_value(value)
-        except NotImplementedError:
-            # py2to3 replace is_str(value) with isinstance(value, str)
-            if not is_str(value):
-                raise TypeError("{} of type {} is not coercible to type {}".format(value, value.__class__.__name__,
-                                                                                   cls.__name__))
-            else:
-                return DataURLFile(value)
+        # file-like objects are recognised by their read method rather than their class
+        if hasattr(value, 'read') and not isinstance(value, cls):
+            return cls.from_stream(value)
+        return super(DataURLFile, cls).from_value(value)
+
+    @classmethod
+    def _not_coercible(cls, value):
+        raise TypeError("{} of type {} is not coercible to type {}".format(value, value.__class__.__name__,
+                                                                           cls.__name__))
+
+    @classmethod
+    def from_stream(cls, stream, chunk_size=None):
+        """
+        create a |DataURLFile| by reading a base64 data url from a file-like object. the contents are decoded
+        incrementally into a :class:`tempfile.SpooledTemporaryFile` that rolls over to disk once it grows beyond
+        :attr:`spool_threshold`, so neither the encoded nor the decoded contents are ever held in memory as a whole.
+
+        :param stream: file-like object whose ``read(size)`` returns ``bytes`` or ``str``
+        :param int chunk_size: number of encoded bytes to read at a time, defaults to :attr:`stream_chunk_size`
+        :raises ValueError: if the header is invalid, the encoding is not base64 or the contents are not valid base64
+        :rtype: DataURLFile
+        """
+        if chunk_size is None:
+            chunk_size = cls.stream_chunk_size
+        chunks = _read_chunks(stream, chunk_size)
+        header = b''
+        comma = -1
+        for chunk in chunks:
+            header += chunk
+            comma = header.find(b',')
+            if comma > -1 or len(header) > cls.max_header_length:
+                break
+        match = _header_regex.match(header[:comma + 1]) if -1 < comma < cls.max_header_length else None
+        if not match:
+            raise ValueError("encoded_data was not in the expected format. for an explaination of how to format a "
+                             "data url file, see https://en.wikipedia.org/wiki/Data_URI_scheme")
+        encoding = match.group(2).decode('ascii')
+        if encoding != 'base64':
+            raise ValueError("only base64 encoded data urls may be streamed, received encoding {}".format(encoding))
+        instance = cls.__new__(cls)
+        instance._buffer = None
+        instance._text = None
+        instance._contents = None
+        instance._contents_text = None
+        instance._mime_type = match.group(1).decode('ascii')
+        instance._encoding = encoding
+        instance._decoded_contents = None
+        instance._spool = instance._spool_chunks(_decode_base64_chunks(chain([header[comma + 1:]], chunks)))
+        super(DataURLFile, instance).__init__()
+        return instance
 
     @classmethod
     def create(cls, contents, mime_type, encoding='base64'):
@@ -75,18 +138,73 @@ class DataURLFile(ImmutableType):
                                                                contents=contents)
 
     def __init__(self, encoded_data):
-        self._encoded_data = encoded_data
-        match = self.regex.match(encoded_data)
-        if match:
-            [a, b, c] = match.groups()
-            self._mime_type = a
-            self._encoding = b
-            self._contents = c
+        """
+        only the header of `encoded_data` is parsed. the contents are kept as a ``memoryview`` over the original buffer
+        and are only decoded when :attr:`decoded_contents` is first accessed. a ``str`` data url is kept as it is and
+        only encoded when its encoded contents are first needed, e.g. by :attr:`contents_view` or :func:`open`.
+
+        :param encoded_data: the data url. ``bytes``\ , ``bytearray`` and ``memoryview`` values are referenced without
+                             copying, a ``bytearray`` must not be changed afterwards
+        :type encoded_data: str or bytes or bytearray or memoryview
+        """
+        # py2to3 replace `is_str(encoded_data) and not isinstance(encoded_data, bytes)` with isinstance(x, str)
+        if is_str(encoded_data) and not isinstance(encoded_data, bytes):
+            self._text = encoded_data
+            self._buffer = None
+            match = _text_header_regex.match(encoded_data)
         else:
+            self._text = None
+            self._buffer = self._as_buffer(encoded_data)
+            match = _header_regex.match(self._buffer)
+        if not match:
             raise ValueError("encoded_data was not in the expected format. for an explaination of how to format a "
                              "data url file, see https://en.wikipedia.org/wiki/Data_URI_scheme")
+        if self._text is not None:
+            self._mime_type = match.group(1)
+            self._encoding = match.group(2)
+            self._contents = None
+            self._text_start = match.end()
+        else:
+            self._mime_type = match.group(1).decode('ascii')
+            self._encoding = match.group(2).decode('ascii')
+            self._contents = self._buffer[match.end():]
+        self._contents_text = None
+        self._decoded_contents = None
+        self._spool = None
         super(DataURLFile, self).__init__()
 
+    @staticmethod
+    def _as_buffer(encoded_data):
+        """ returns a read-only byte ``memoryview`` of the data url, copying only a non contiguous ``memoryview`` """
+        if isinstance(encoded_data, memoryview):
+            if encoded_data.format != 'B' or not encoded_data.c_contiguous:
+                return memoryview(encoded_data.tobytes())
+            view = encoded_data
+        elif isinstance(encoded_data, (bytes, bytearray)):
+            view = memoryview(encoded_data)
+        else:
+            raise TypeError("encoded_data of type {} is not a str or bytes-like object".format(
+                encoded_data.__class__.__name__))
+        # py2to3 replace with view.toreadonly(), available from python 3.8
+        if not view.readonly and hasattr(view, 'toreadonly'):
+            return view.toreadonly()
+        return view
+
+    def _contents_buffer(self):
+        """
+        the encoded contents as a ``memoryview``\ , ``None`` for a streamed |DataURLFile|\ . the contents of a ``str``
+        data url are encoded on first call
+
+        :raises ValueError: if this |DataURLFile| was streamed and is closed
+        """
+        if self._contents is None:
+            if self._text is not None:
+                self._contents = memoryview(self._text[self._text_start:].encode('utf-8'))
+            elif self._spool is None:
+                raise ValueError("the contents of a streamed {} are discarded once it is closed".format(
+                    self.__class__.__name__))
+        return self._contents
+
     @property
     def mime_type(self):
         """
@@ -101,25 +219,125 @@ class DataURLFile(ImmutableType):
 
     @property
     def contents(self):
-        """ the encoded contents of this media type """
-        return self._contents
+        """ the encoded contents of this media type. created only once, on first access """
+        if self._contents_text is None:
+            if self._text is not None:
+                self._contents_text = self._text[self._text_start:]
+            elif self._contents is None:
+                # the contents of a streamed data url are not kept in memory
+                return self.contents_view.tobytes().decode('utf-8')
+            else:
+                self._contents_text = self._contents.tobytes().decode('utf-8')
+        return self._contents_text
+
+    @property
+    def contents_view(self):
+        """
+        the encoded contents of this media type as a read-only ``memoryview`` over the original buffer. for a streamed
+        |DataURLFile| the contents are re-encoded from the spooled file on each access
+        """
+        contents = self._contents_buffer()
+        if contents is None:
+            return memoryview(binascii.b2a_base64(self.decoded_contents).rstrip(b'\n'))
+        return contents
 
     @property
     def decoded_contents(self):
-        """ attempts to decode the contents according to the configured encoding """
-        # py2to3 remove else statement and PY3 check
-        if future.utils.PY3:
-            contents_ = bytes(self.contents, encoding='utf-8')
+        """
+        decodes the contents according to the configured encoding. decoded only once, on first access. for a streamed
+        |DataURLFile| the spooled file is read in full on each access, prefer :func:`open`
+        """
+        contents = self._contents_buffer()
+        if contents is None:
+            with self.open() as decoded_file:
+                return decoded_file.read()
+        if self._decoded_contents is None:
+            if self.encoding == 'base64':
+                self._decoded_contents = binascii.a2b_base64(contents)
+            else:
+                self._decoded_contents = codecs.lookup(self.encoding).decode(contents.tobytes())[0]
+        return self._decoded_contents
+
+    def open(self):
+        """
+        open the decoded contents for reading. base64 contents larger than :attr:`spool_threshold` are decoded
+        incrementally into a spooled temporary file on first call, which is shared by subsequent calls. each returned
+        file-like object keeps its own position, closing it does not discard the spooled contents (see :func:`close`).
+
+        :rtype: io.BufferedIOBase
+        """
+        if self._spool is None:
+            contents = self._contents_buffer()
+            if self.encoding != 'base64' or len(contents) <= self.spool_threshold:
+                return io.BytesIO(self.decoded_contents)
+            self._spool = self._spool_chunks(_decode_base64_chunks(_view_chunks(contents, self.stream_chunk_size)))
+        return io.BufferedReader(_SpoolReader(self._spool))
+
+    def close(self):
+        """
+        discards the spooled contents of this |DataURLFile|\ , if any. in-memory contents are spooled again when next
+        opened, the contents of a streamed |DataURLFile| can no longer be read
+        """
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    @property
+    def decoded_size(self):
+        """
+        the length in bytes of the decoded contents. for in-memory base64 contents this is calculated from the length of
+        the encoded contents without decoding them
+        """
+        if self._spool is not None:
+            self._spool.seek(0, io.SEEK_END)
+            return self._spool.tell()
+        elif self._decoded_contents is not None or self.encoding != 'base64':
+            return len(self.decoded_contents)
+        contents = self._contents_buffer()
+        length = len(contents)
+        if _base64_whitespace_regex.search(contents):
+            length -= len(_base64_whitespace_regex.findall(contents))
+        tail = contents[-8:].tobytes().translate(None, _base64_whitespace)
+        return (length * 3) // 4 - (len(tail) - len(tail.rstrip(b'=')))
+
+    def hexdigest(self, algorithm='sha256'):
+        """
+        calculates the checksum of the decoded contents. the contents are decoded and hashed incrementally, chunk by
+        chunk, rather than being decoded in full.
+
+        :param str algorithm: name of a :mod:`hashlib` algorithm, e.g. ``sha256`` or ``md5``
+        :rtype: str
+        """
+        digest = hashlib.new(algorithm)
+        for chunk in self._decoded_chunks():
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def _decoded_chunks(self):
+        """ yields the decoded contents in chunks of at most :attr:`stream_chunk_size` encoded bytes """
+        if self._spool is not None:
+            with self.open() as decoded_file:
+                for chunk in iter(lambda: decoded_file.read(self.stream_chunk_size), b''):
+                    yield chunk
+        elif self._decoded_contents is not None or self.encoding != 'base64':
+            yield self.decoded_contents
         else:
-            contents_ = self.contents
-        return codecs.lookup(self.encoding).decode(contents_)[0]
+            for chunk in _decode_base64_chunks(_view_chunks(self._contents_buffer(), self.stream_chunk_size)):
+                yield chunk
+
+    def _spool_chunks(self, chunks):
+        """ writes each decoded chunk into a new spooled temporary file """
+        spool = tempfile.SpooledTemporaryFile(max_size=self.spool_threshold)
+        for chunk in chunks:
+            spool.write(chunk)
+        return spool
 
     def __eq__(self, other):
         if isinstance(other, DataURLFile):
             return (
                 self.mime_type == other.mime_type and
-                self.contents == other.contents and
-                self.encoding == other.encoding
+                self.encoding == other.encoding and
+                self.contents_view == other.contents_view
             )
         # py2to3 replace with isinstance(other, str)
         elif is_str(other):
@@ -131,6 +349,89 @@ class DataURLFile(ImmutableType):
         return not self == other
 
 
+class _SpoolReader(io.RawIOBase):
+    """ reads a shared spooled file from an independent position """
+
+    def __init__(self, spool):
+        super(_SpoolReader, self).__init__()
+        self._spool = spool
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        self._spool.seek(self._position)
+        data = self._spool.read(len(b))
+        length = len(data)
+        b[:length] = data
+        self._position += length
+        return length
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            self._spool.seek(0, io.SEEK_END)
+            offset += self._spool.tell()
+        self._position = offset
+        return offset
+
+    def tell(self):
+        return self._position
+
+
+def _read_chunks(stream, chunk_size):
+    """ yields ``bytes`` chunks read from a binary or text `stream` until it is exhausted """
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        # py2to3 replace is_str with isinstance(x, str)
+        yield chunk.encode('ascii') if is_str(chunk) and not isinstance(chunk, bytes) else chunk
+
+
+def _view_chunks(view, chunk_size):
+    """ yields consecutive slices of a ``memoryview`` without copying """
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+
+_header_regex = re.compile(br'^data:([\w/\-.]+);(\w+),')
+""" matches the header of a bytes data url, the contents start at the end of the match """
+_text_header_regex = re.compile(r'^data:([\w/\-.]+);(\w+),')
+
+_base64_whitespace = b' \t\r\n'
+_base64_whitespace_regex = re.compile(br'[ \t\r\n]')
+
+
+def _decode_base64_chunks(chunks):
+    """
+    incremental base64 decoder. each encoded chunk is decoded up to its last complete 4 character quantum, the remainder
+    is carried over to the next chunk.
+
+    :param chunks: iterable of encoded bytes-like chunks
+    :raises ValueError: if the contents are not valid base64
+    """
+    remainder = b''
+    try:
+        for chunk in chunks:
+            # py2to3 replace with bytes(chunk), python 2 renders a memoryview passed to bytes() as its repr
+            chunk = remainder + (chunk.tobytes() if isinstance(chunk, memoryview) else bytes(chunk)).translate(
+                None, _base64_whitespace)
+            usable = len(chunk) - len(chunk) % 4
+            if usable:
+                yield binascii.a2b_base64(chunk[:usable])
+            remainder = chunk[usable:]
+        if remainder:
+            yield binascii.a2b_base64(remainder)
+    except binascii.Error as error:
+        raise ValueError("contents are not valid base64: {}".format(error))
+
+
 def _allowed_mime_types(instance, config):
     """
     checks whether the |DataURLFile|\ 's mime_type is in the configured list of strings
@@ -140,9 +441,96 @@ def _allowed_mime_types(instance, config):
     :raises ValidationException: if instsance.mime_type isn't in the config
     """
     if instance.mime_type not in config:
-        raise ValidationException(instance.__class__,
-                                  "{} is an invalid mime type, valid types are [{}]".format(instance.mime_type,
-                                                                                            ", ".join(config)))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'data_url_file.allowed_mime_types', "{} is an invalid mime type, valid types are [{}]",
+            (instance.mime_type, ", ".join(config))))
+
+
+def _min_decoded_size(instance, config):
+    """
+    checks whether the decoded contents of the |DataURLFile| are at least `config` bytes long. base64 contents are not
+    decoded to perform this check, see :attr:`DataURLFile.decoded_size`
+
+    :type instance: |DataURLFile|
+    :param int config: the minimum decoded size in bytes
+    :raises ValidationException: if the decoded contents are less than `config` bytes
+    """
+    size = instance.decoded_size
+    if size < config:
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'data_url_file.min_decoded_size', "{} min_decoded_size config is {} however the decoded size is {}",
+            (instance.__class__.__name__, config, size)))
+
+
+def _max_decoded_size(instance, config):
+    """
+    checks whether the decoded contents of the |DataURLFile| are at most `config` bytes long. base64 contents are not
+    decoded to perform this check, see :attr:`DataURLFile.decoded_size`
+
+    :type instance: |DataURLFile|
+    :param int config: the maximum decoded size in bytes
+    :raises ValidationException: if the decoded contents are greater than `config` bytes
+    """
+    size = instance.decoded_size
+    if size > config:
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'data_url_file.max_decoded_size', "{} max_decoded_size config is {} however the decoded size is {}",
+            (instance.__class__.__name__, config, size)))
+
+
+def _checksum(instance, config):
+    """
+    checks whether the checksum of the decoded contents matches the configured hex digest. the contents are hashed
+    incrementally, see :func:`DataURLFile.hexdigest`
+
+    :type instance: |DataURLFile|
+    :param config: a :mod:`hashlib` algorithm name and the expected hex digest, e.g. ``('sha256', 'e3b0c442...')``
+    :type config: (str, str)
+    :raises ValidationException: if the checksum of the decoded contents does not match
+    """
+    algorithm, expected = config
+    actual = instance.hexdigest(algorithm)
+    if actual != expected.lower():
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'data_url_file.checksum', "{} {} checksum is {}, expected {}",
+            (instance.__class__.__name__, algorithm, actual, expected)))
 
 
 DataURLFile.register_property_rule(_allowed_mime_types, name="allowed_mime_types")
+DataURLFile.register_property_rule(_min_decoded_size, name="min_decoded_size")
+DataURLFile.register_property_rule(_max_decoded_size, name="max_decoded_size")
+DataURLFile.register_property_rule(_checksum, name="checksum")
+
+
+def _decoded_size_and_checksum_config_check(configured_type, all_config):
+    """
+    checks that min_decoded_size is not greater than max_decoded_size and that a configured checksum names an available
+    :mod:`hashlib` algorithm
+
+    :param configured_type: subclass of |DataURLFile|
+    :param dict all_config: dictionary of configured rules plus defaults for this |type| subclass
+    :raises |PropertyConfigError|\ : if the configuration is invalid
+    """
+    if all_config is None:
+        return
+    if 'min_decoded_size' in all_config and 'max_decoded_size' in all_config \
+            and all_config['min_decoded_size'] > all_config['max_decoded_size']:
+        raise PropertyConfigError(configured_type, 'min_decoded_size and max_decoded_size',
+                                  'invalid {} property configuration: min_decoded_size config of {} is greater than '
+                                  'max_decoded_size config of {}'.format(configured_type.__name__,
+                                                                         all_config['min_decoded_size'],
+                                                                         all_config['max_decoded_size']))
+    if 'checksum' in all_config:
+        try:
+            algorithm, _expected = all_config['checksum']
+            hashlib.new(algorithm)
+        except (TypeError, ValueError):
+            raise PropertyConfigError(configured_type, 'checksum',
+                                      'invalid {} property configuration: checksum config should be a (algorithm, '
+                                      'hexdigest) pair naming a hashlib algorithm, received {}'.format(
+                                          configured_type.__name__, all_config['checksum']))
+
+
+DataURLFile.register_config_check(_decoded_size_and_checksum_config_check,
+                                  name="decoded_size_and_checksum_config_check")
+DataURLFile.register_coercer(string_types + (bytes, bytearray, memoryview), _construct)
@@ -9,7 +9,8 @@
     :license: Apache 2.0, see LICENSE for more details.
 """
 
-from . import Number
+from . import Number, _construct
+from .number import _float_string_regex
 
 
 class Float(Number, float):
@@ -17,13 +18,9 @@ class Float(Number, float):
     Prestans 3 Float type. Acts as a native :class:`float` with additional Prestans 3 functionality.
     """
 
-    @classmethod
-    def from_value(cls, value):
-        try:
-            # noinspection PyUnresolvedReferences
-            return super(Float, cls).from_value(value)
-        except NotImplementedError:
-            if not isinstance(value, float):
-                raise TypeError(
-                    "{} of type {} not coercible to {}".format(value, value.__class__.__name__, cls.__name__))
-            return Float(value)
+    _native_type = float
+    _string_regex = _float_string_regex
+
+
+Float.register_coercer(float, _construct)
+Float.register_builtin_converter(float)
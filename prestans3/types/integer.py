@@ -9,7 +9,8 @@
     :license: Apache 2.0, see LICENSE for more details.
 """
 
-from . import Number
+from . import Number, _construct
+from .number import _int_string_regex
 
 
 class Integer(Number, int):
@@ -17,15 +18,13 @@ class Integer(Number, int):
     Prestans 3 Integer type. Acts as a native :class:`int` with additional Prestans 3 functionality.
     """
 
-    @classmethod
-    def from_value(cls, value):
-        try:
-            # noinspection PyUnresolvedReferences
-            return super(Integer, cls).from_value(value)
-        except NotImplementedError:
-            if not isinstance(value, int):
-                raise ValueError(value)
-            return Integer(value)
+    _native_type = int
+    _coercion_error = ValueError
+    _string_regex = _int_string_regex
 
     def __init__(self, value, base=10):
         int.__init__(value, base)
+
+
+Integer.register_coercer(int, _construct)
+Integer.register_builtin_converter(int)
@@ -12,8 +12,10 @@ from copy import copy
 
 from future.utils import with_metaclass
 
-from ..errors import ValidationException, AccessError, ContainerValidationException
-from ..types import Container, _Property, new_mutable_type_func_name
+from ..errors import ValidationException, ValidationMessage, AccessError, ContainerValidationException, \
+    ValidationResult
+from ..types import Container, _Property, new_mutable_type_func_name, _collect_validation_errors, _error_message, \
+    _coercer, _immutable_type_validate, _property_set, _validates_on_construction
 from ..types.meta import PrestansTypeMeta
 from ..utils import inject_class, ImmutableMergingDictionary, LazyOneWayGraph
 
@@ -73,6 +75,16 @@ class Model(with_metaclass(_PrestansModelTypeMeta, Container)):
     provided by a |_Property|\ 's `default` argument.
     """
 
+    lazy_containers = False
+    """
+    whether the container |attributes| of this |Model|\ , its |Models| and |Arrays|\ , are created from the ``dict``
+    or ``list`` given for them in `initial_values` only when they are first accessed or this |Model| is validated.
+    validating this |Model| on construction skips them, they raise when they are created as they would have on
+    construction, or are reported under their |attribute| by :func:`validate()`
+    """
+
+    _deferred_attributes = None
+
     def __init__(self, initial_values=None, **kwargs):
         """
         subclasses should call :function:`Model.__init__()` with any initial values passed to its init method in order
@@ -84,14 +96,19 @@ class Model(with_metaclass(_PrestansModelTypeMeta, Container)):
         :param dict kwargs: additional values to pass to the next super call (see :class:`~prestans3.types.Container`)
         """
         self._prestans_attributes = {}
+        deferred = None
         if initial_values is not None:
+            lazy = self.__class__.lazy_containers
             # py2to3 unwrap .items()
             for key, value in list(initial_values.items()):
                 if self.is_prestans_attribute(key):
-                    self.get_prestans_attribute_property(key).__set__(
-                        self._prestans_attributes,
-                        (key, value)
-                    )
+                    p_attr = self.get_prestans_attribute_property(key)
+                    if lazy and _defers(p_attr, value):
+                        if deferred is None:
+                            deferred = {}
+                        deferred[key] = value
+                    else:
+                        p_attr.__set__(self._prestans_attributes, (key, value))
                 else:
                     raise ValueError("Model.__init__ called with an invalid initial_values parameter: "
                                      "{} is not a configured prestans attribute of {}".format(key,
@@ -100,11 +117,24 @@ class Model(with_metaclass(_PrestansModelTypeMeta, Container)):
         # for all the prestans attributes in this class, if they don't yet have a value, then set it
         # py2to3 unwrap .items()
         for key, p_attr in list(self.__class__.prestans_attribute_properties.items()):
-            if p_attr.default is not None and (
-                            key not in self.prestans_attributes or self.prestans_attributes[key] is None):
+            if p_attr.default is not None and self._prestans_attributes.get(key) is None and (
+                            deferred is None or key not in deferred):
                 p_attr.__set__(self._prestans_attributes, (key, copy(p_attr.default)))
 
-        super(Model, self).__init__(**kwargs)
+        if deferred is None:
+            super(Model, self).__init__(**kwargs)
+        else:
+            self._deferred_attributes = deferred
+            validate_immediately = kwargs.pop('validate_immediately', True)
+            super(Model, self).__init__(validate_immediately=False, **kwargs)
+            if validate_immediately and _validates_on_construction(self.__class__):
+                if not _validates_natively(self.__class__):
+                    self.validate()
+                else:
+                    # the deferred attributes are validated when they are created
+                    validation_exception = _model_errors(self, None, None)
+                    if validation_exception is not None:
+                        raise validation_exception
 
     def __setattr__(self, key, value):
 
@@ -148,43 +178,168 @@ class Model(with_metaclass(_PrestansModelTypeMeta, Container)):
         # py2to3 replace `list(self.prestans_attributes.items())` with `self.prestans_attributes.items()`
         return {key: value.native_value for key, value in list(self.prestans_attributes.items())}
 
-    def validate(self, config=None, **kwargs):
-        """ validates all |attributes| before validating itself """
-        validation_exception = None
-        # py2to3 replace `list(self.prestans_attribute_properties.items())` with `self.prestans_attribute_properties.items()`
-        for p_attr_name, p_attr in list(self.prestans_attribute_properties.items()):
+    def _validation_errors(self, config):
+        """ creates any deferred container |attributes|\ , then validates all |attributes| before validating itself """
+        return _model_errors(self, config, _create_deferred(self))
+
+    @classmethod
+    def try_from_value(cls, value, config=None):
+        """
+        as :func:`ImmutableType.try_from_value()<prestans3.types.ImmutableType.try_from_value>`\ , a ``dict`` is
+        validated once after the |Model| and the |Models| and |Arrays| nested in it are created rather than raising
+        from their constructors, so that each error is located from this |Model|
+        """
+        if not isinstance(value, dict):
+            return super(Model, cls).try_from_value(value, config)
+        try:
+            instance = _unvalidated_model(cls, value)
+        except ValidationException as exception:
+            return ValidationResult(errors=exception)
+        except (TypeError, ValueError) as error:
+            return ValidationResult(errors=ValidationException(cls, _error_message(error)))
+        return instance.validate_result(config)
+
+    @classmethod
+    def construct_trusted(cls, initial_values=None, check=False):
+        """
+        creates a |Model| holding `initial_values` as they are, for values that are known to be valid already, such as
+        those read back from storage that was validated when written. unlike ``cls(initial_values=...)``\ , no prepare
+        functions, coercion, defaults or validation are applied and ``__init__`` is not called
+
+        :param dict[str, |ImmutableType|\ ] initial_values: |attribute| values, each an instance of its |type|
+        :param bool check: whether to assert that each value is an instance of its |attribute|\ 's |type|\ , the
+                           assertions are skipped when python runs with ``-O``
+        :rtype: |Model|
+        """
+        storage = {} if initial_values is None else dict(initial_values)
+        if check:
+            # py2to3 unwrap .items()
+            for key, value in list(storage.items()):
+                assert cls.is_prestans_attribute(key), \
+                    "{} is not a configured prestans attribute of {}".format(key, cls.__name__)
+                assert value is None or isinstance(value, cls.get_prestans_attribute_property(key).property_type), \
+                    "{} of type {} is not an instance of the type of {}.{}".format(value, value.__class__.__name__,
+                                                                                   cls.__name__, key)
+        return _from_storage(cls, storage, ())
+
+    @classmethod
+    def from_values(cls, values, validate=True):
+        """
+        creates a |Model| from each ``dict`` of |attribute| values in `values`\ , as ``cls(initial_values=value)``
+        does. how each |attribute| is set is resolved once for all of them, and the |Models| are validated once they
+        are all created
+
+        >>> from prestans3.types import Model, String
+        >>> class Row(Model):
+        ...     name = String.property()
+        ...
+        >>> rows = Row.from_values([{'name': 'spam'}, {'name': 'eggs'}])
+
+        :param values: iterable of dict[str, value]
+        :param bool validate: whether to validate the created |Models|
+        :raises |ArrayValidationException|\ : for the first |Model| that cannot be created or is invalid, keyed by its
+                                         index
+        :rtype: list[|Model|]
+        """
+        setters, defaults = _attribute_setters(cls) if _creates_from_storage(cls) else (None, ())
+        instances = []
+        for index, value in enumerate(values):
+            try:
+                instances.append(_model_from_setters(cls, setters, defaults, value))
+            except (ValidationException, TypeError, ValueError) as error:
+                raise _row_error(cls, index, error)
+        if validate:
+            _validate_all(instances)
+        return instances
+
+    @classmethod
+    def from_rows(cls, rows, columns, validate=True):
+        """
+        creates a |Model| from each tuple of |attribute| values in `rows`\ , see :func:`from_values`. a ``None``
+        value is treated as missing, so that the default of its |_Property| applies
+
+        >>> from prestans3.types import Model, String, Integer
+        >>> class Row(Model):
+        ...     name = String.property()
+        ...     count = Integer.property(required=False)
+        ...
+        >>> rows = Row.from_rows([('spam', 1), ('eggs', None)], columns=('name', 'count'))
+
+        :param rows: iterable of tuples, ordered as `columns`
+        :param columns: the names of the |attributes| of each value in a row
+        :type columns: tuple[str]
+        :param bool validate: whether to validate the created |Models|
+        :raises |ArrayValidationException|\ : for the first |Model| that cannot be created or is invalid, keyed by its
+                                         index
+        :rtype: list[|Model|]
+        """
+        for column in columns:
+            if not cls.is_prestans_attribute(column):
+                raise ValueError("{} is not a configured prestans attribute of {}".format(column, cls.__name__))
+        setters, defaults = _attribute_setters(cls) if _creates_from_storage(cls) else (None, ())
+        instances = []
+        for index, row in enumerate(rows):
             try:
-                attr = self.prestans_attributes[p_attr_name]  # T <= ImmutableType
-                attr.validate(p_attr.rules_config)
-            except KeyError:
-                pass
-            except ValidationException as error:
+                instances.append(_model_from_setters(cls, setters, defaults, {
+                    column: attr for column, attr in zip(columns, row) if attr is not None}))
+            except (ValidationException, TypeError, ValueError) as error:
+                raise _row_error(cls, index, error)
+        if validate:
+            _validate_all(instances)
+        return instances
+
+    @classmethod
+    def _native_validator(cls, config, coerce=None):
+        """
+        validates native ``dicts`` against the |attributes| of this |Model| without creating it, nested ``dicts`` and
+        ``lists`` are validated the same way. the |Model| is only created when |rules| other than the required
+        |attributes| check are configured for it
+        """
+        validate_other = super(Model, cls)._native_validator(config, coerce)
+        if not _validates_natively(cls):
+            return validate_other
+        properties = cls.prestans_attribute_properties
+        required_rule = cls.property_rules['check_required_attributes']
+        rules = cls._configured_rules(config)
+        creates_model = any(rule is not required_rule for rule, _ in rules)
+        checks_required = any(rule_config for rule, rule_config in rules if rule is required_rule)
+
+        def _validate(value):
+            if not isinstance(value, dict) or _coercer(cls, value.__class__) is not _from_dict:
+                return validate_other(value)
+            for key in value:
+                if key not in properties:
+                    return ValidationException(cls, "Model.__init__ called with an invalid initial_values parameter: "
+                                                    "{} is not a configured prestans attribute of {}".format(
+                                                        key, cls.__name__))
+            if creates_model:
+                return cls.try_from_value(value, config).errors
+            validation_exception = None
+            missing = []
+            # py2to3 unwrap .items()
+            for p_attr_name, p_attr in list(properties.items()):
+                attr = value[p_attr_name] if p_attr_name in value else p_attr.default
+                if attr is None:
+                    if p_attr.required:
+                        missing.append(p_attr_name)
+                    continue
+                error = p_attr._native_errors(attr)
+                if error is not None:
+                    if validation_exception is None:
+                        validation_exception = ModelValidationException(cls)
+                    validation_exception.add_validation_exception(p_attr_name, error)
+            if missing and checks_required:
                 if validation_exception is None:
-                    validation_exception = ModelValidationException(self.__class__)
-                validation_exception.add_validation_exception(p_attr_name, error)
-        try:
-            default_rules_config = self.__class__.default_rules_config()
-            if config is None:
-                super(Model, self).validate(default_rules_config)
-            else:
-                super(Model, self).validate(ImmutableMergingDictionary(config, default_rules_config))
-        except ValidationException as error:
-            if validation_exception is None:
-                validation_exception = ModelValidationException(self.__class__)
-            validation_exception.add_validation_messages(error.messages)
-        if validation_exception:
-            raise validation_exception
+                    validation_exception = ModelValidationException(cls)
+                validation_exception.add_validation_messages(_required_messages(cls, missing))
+            return validation_exception
+
+        return _validate
 
     @classmethod
-    def from_value(cls, value):
-        """ create a model from an arbitrarily complex model conforming to the configuration of this subclass """
-        try:
-            return super(Model, cls).from_value(value)
-        except NotImplementedError:
-            if not isinstance(value, dict):
-                raise TypeError(
-                    "{} of type {} is not coercible to type {}".format(value, value.__class__.__name__, cls.__name__))
-            return cls(initial_values=value)
+    def _not_coercible(cls, value):
+        raise TypeError(
+            "{} of type {} is not coercible to type {}".format(value, value.__class__.__name__, cls.__name__))
 
     @classmethod
     def is_prestans_attribute(cls, key):
@@ -205,9 +360,11 @@ class Model(with_metaclass(_PrestansModelTypeMeta, Container)):
         python attribute as normal
         """
         if object.__getattribute__(self, 'is_prestans_attribute')(item):
-            return object.__getattribute__(self, '__class__').__dict__[item].__get__(
-                object.__getattribute__(self, '_prestans_attributes')[item],
-                object.__getattribute__(self, '_prestans_attributes')[item].__class__)
+            attributes = object.__getattribute__(self, '_prestans_attributes')
+            if item not in attributes and object.__getattribute__(self, '_deferred_attributes') is not None:
+                _create_attributes(self, (item,))
+            return object.__getattribute__(self, '__class__').__dict__[item].__get__(attributes[item],
+                                                                                     attributes[item].__class__)
         else:
             return object.__getattribute__(self, item)
 
@@ -218,7 +375,7 @@ class Model(with_metaclass(_PrestansModelTypeMeta, Container)):
 
         :rtype: dict[str -> |ImmutableType|\ ]
         """
-        return ImmutableMergingDictionary(self._prestans_attributes)
+        return ImmutableMergingDictionary(_create_attributes(self))
 
     @classmethod
     def mutable(cls, *args, **kwargs):
@@ -264,27 +421,276 @@ def check_required_attributes(instance, config=True):
     """ iterates through all prestans attributes and checks if required attributes are not None """
     if config:
         p_attrs = instance.__class__.prestans_attribute_properties
+        attributes = instance._prestans_attributes
+        deferred = instance._deferred_attributes or {}
         validation_exception = None
         # py2to3 unwrap .items()
         for p_attr_name, p_attr in list(p_attrs.items()):
             if p_attr.required:
-                try:
-                    instance.prestans_attributes[p_attr_name]
-                except KeyError:
+                if p_attr_name not in attributes and p_attr_name not in deferred:
                     if validation_exception is None:
                         validation_exception = ValidationException(instance.__class__)
-                    validation_exception.add_validation_message(
-                        "required prestans attribute '{}' does not exist on this instance of {}".format(
-                            p_attr_name, instance.__class__.__name__)
-                    )
+                    validation_exception.add_validation_messages(_required_messages(instance.__class__, [p_attr_name]))
         if validation_exception:
             raise validation_exception
 
 
+def _required_messages(of_type, names):
+    """ :return: the messages of the required |attributes| `names` missing from an instance of `of_type` """
+    return [ValidationMessage('model.required',
+                              "required prestans attribute '{}' does not exist on this instance of {}",
+                              (name, of_type.__name__)) for name in names]
+
+
 Model.register_property_rule(check_required_attributes, name="check_required_attributes", configurable=False,
                              default=True)
 
 
+def _to_dict(instance):
+    """ converts each |attribute| of a |Model| to a builtin, producing a plain ``dict`` """
+    # py2to3 unwrap .items()
+    return {key: value.to_builtin() for key, value in list(_create_attributes(instance).items())}
+
+
+Model.register_builtin_converter(_to_dict)
+
+
+def _from_dict(of_type, value):
+    """ create a model from an arbitrarily complex model conforming to the configuration of this subclass """
+    return of_type(initial_values=value)
+
+
+Model.register_coercer(dict, _from_dict)
+
+_model_init = Model.__dict__['__init__']
+_model_validation_errors = Model.__dict__['_validation_errors']
+
+
+def _model_errors(instance, config, validation_exception):
+    """ validates the created |attributes| of a |Model|\ , then the |Model| itself, adding to `validation_exception` """
+    attributes = instance._prestans_attributes
+    # py2to3 replace `list(...items())` with `...items()`
+    for p_attr_name, p_attr in list(instance.__class__.prestans_attribute_properties.items()):
+        attr = attributes.get(p_attr_name)  # T <= ImmutableType
+        if attr is None:
+            continue
+        error = _collect_validation_errors(attr, p_attr.rules_config)
+        if error is not None:
+            if validation_exception is None:
+                validation_exception = ModelValidationException(instance.__class__)
+            validation_exception.add_validation_exception(p_attr_name, error)
+    default_rules_config = instance.__class__.default_rules_config()
+    if config is None:
+        error = super(Model, instance)._validation_errors(default_rules_config)
+    else:
+        error = super(Model, instance)._validation_errors(ImmutableMergingDictionary(config, default_rules_config))
+    if error is not None:
+        if validation_exception is None:
+            validation_exception = ModelValidationException(instance.__class__)
+        validation_exception.add_validation_messages(error.message_templates)
+    return validation_exception
+
+
+def _defers(p_attr, value):
+    """ whether setting `value` on a lazy |Model| is deferred until the |attribute| of `p_attr` is accessed """
+    return value is not None and not p_attr._of_type.is_scalar and not isinstance(value, p_attr._of_type)
+
+
+def _create_attributes(instance, names=None):
+    """
+    creates the deferred container |attributes| `names` of `instance`\ , or all of them, as setting them when it was
+    constructed would have
+
+    :return: the storage of the |attributes| of `instance`
+    """
+    attributes = object.__getattribute__(instance, '_prestans_attributes')
+    deferred = object.__getattribute__(instance, '_deferred_attributes')
+    if deferred is None:
+        return attributes
+    p_attrs = instance.__class__.prestans_attribute_properties
+    for name in list(deferred) if names is None else names:
+        if name in deferred and name not in attributes:
+            p_attrs[name].__set__(attributes, (name, deferred[name]))
+    # py2to3 unwrap .items()
+    remaining = {name: value for name, value in list(deferred.items()) if name not in attributes}
+    object.__setattr__(instance, '_deferred_attributes', remaining or None)
+    return attributes
+
+
+def _create_deferred(instance):
+    """ :return: the |ModelValidationException| of the deferred |attributes| of `instance` failing to be created """
+    validation_exception = None
+    for name in list(instance._deferred_attributes or ()):
+        try:
+            _create_attributes(instance, (name,))
+        except (ValidationException, TypeError, ValueError) as error:
+            if validation_exception is None:
+                validation_exception = ModelValidationException(instance.__class__)
+            validation_exception.add_validation_exception(name, _located_error(
+                instance.__class__.prestans_attribute_properties[name].property_type, error))
+    return validation_exception
+
+
+def _creates_from_storage(of_type):
+    """ whether a |Model| of `of_type` is fully created by :class:`Model`\ 's ``__init__``, and not overridden """
+    # py2to3 replace getattr(..., '__func__', ...) with of_type.__init__
+    return getattr(of_type.__init__, '__func__', of_type.__init__) is _model_init and not of_type.lazy_containers
+
+
+def _attribute_setters(of_type):
+    """
+    resolves once how each |attribute| of `of_type` is set from a value, as its |_Property|\ 's ``__set__`` does
+
+    :return: the setters by |attribute| name, each called with the storage of a |Model| and a value, and the
+             (name, setter, |_Property|\ ) of the |attributes| with a default
+    """
+    setters = {}
+    defaults = []
+    # py2to3 unwrap .items()
+    for name, p_attr in list(of_type.prestans_attribute_properties.items()):
+        setters[name] = _attribute_setter(name, p_attr)
+        if p_attr.default is not None:
+            defaults.append((name, setters[name], p_attr))
+    return setters, defaults
+
+
+def _attribute_setter(name, p_attr):
+    """
+    :return: sets `name` in the storage of a |Model| as ``p_attr.__set__`` does, except that a |Model| or |Array|
+             created from a ``dict`` or ``list`` is not validated
+    """
+    from .array import _ArrayProperty
+    if isinstance(p_attr, _ArrayProperty):
+        array_type = p_attr._of_type
+        element_type = p_attr._element_type
+
+        def _set_array(storage, value):
+            if isinstance(value, (list, tuple)):
+                value = _unvalidated_array(array_type, element_type, value)
+            p_attr.__set__(storage, (name, value))
+
+        return _set_array
+    # py2to3 replace getattr(..., '__func__', ...) with p_attr.__class__.__set__
+    if getattr(p_attr.__class__.__set__, '__func__', p_attr.__class__.__set__) is not _property_set:
+        return lambda storage, value: p_attr.__set__(storage, (name, value))
+    prepare = p_attr._prepare_process_function
+    coerce = p_attr._coerce
+    of_type = p_attr._of_type
+    creates_models = _creates_unvalidated(of_type)
+
+    def _set(storage, value):
+        prepared_value = value if prepare is None else prepare(value)
+        if isinstance(value, of_type):
+            storage[name] = prepared_value
+        elif creates_models and isinstance(prepared_value, dict):
+            storage[name] = _unvalidated_model(of_type, prepared_value)
+        else:
+            storage[name] = coerce(prepared_value)
+
+    return _set
+
+
+def _creates_unvalidated(of_type):
+    """ whether a ``dict`` is coerced to `of_type` by creating a |Model| from it, which may be left unvalidated """
+    return issubclass(of_type, Model) and _coercer(of_type, dict) is _from_dict
+
+
+def _unvalidated_model(of_type, values):
+    """
+    creates a |Model| of `of_type` from the ``dict`` `values` as ``of_type(initial_values=values)`` does, but neither
+    it nor the |Models| and |Arrays| nested in it are validated
+
+    :raises |ModelValidationException|\ : keyed by the |attribute| whose value is not coercible
+    :raises ValueError: if a key of `values` is not an |attribute| of `of_type`
+    """
+    setters, defaults = _attribute_setters(of_type) if _creates_from_storage(of_type) else (None, ())
+    return _model_from_setters(of_type, setters, defaults, values)
+
+
+def _model_from_setters(of_type, setters, defaults, values):
+    """
+    creates a |Model| of `of_type` from the ``dict`` `values` with the resolved :func:`_attribute_setters`\ , or with
+    its own ``__init__`` if `setters` is ``None``
+    """
+    if setters is None:
+        return of_type(initial_values=values, validate_immediately=False)
+    storage = {}
+    # py2to3 unwrap .items()
+    for key, value in list(values.items()):
+        try:
+            setter = setters[key]
+        except KeyError:
+            raise ValueError("Model.__init__ called with an invalid initial_values parameter: "
+                             "{} is not a configured prestans attribute of {}".format(key, of_type.__name__))
+        try:
+            setter(storage, value)
+        except (ValidationException, TypeError, ValueError) as error:
+            raise ModelValidationException(of_type, (key, _located_error(
+                of_type.prestans_attribute_properties[key].property_type, error)))
+    return _from_storage(of_type, storage, defaults)
+
+
+def _unvalidated_array(array_type, element_type, values):
+    """
+    creates an |Array| of `array_type` from the ``list`` `values`\ , creating |Model| elements from ``dict``\ s
+    without validating them
+
+    :raises |ArrayValidationException|\ : keyed by the index of the element that is not coercible
+    """
+    from .array import ArrayValidationException
+    creates_models = _creates_unvalidated(element_type)
+    elements = []
+    for index, element in enumerate(values):
+        try:
+            if creates_models and isinstance(element, dict):
+                element = _unvalidated_model(element_type, element)
+            elif not isinstance(element, element_type):
+                element = element_type.from_value(element)
+        except (ValidationException, TypeError, ValueError) as error:
+            raise ArrayValidationException(array_type, (index, _located_error(element_type, error)))
+        elements.append(element)
+    return array_type(element_type, elements, validate_immediately=False)
+
+
+def _row_error(of_type, index, error):
+    """ :return: the |ArrayValidationException| of the |Model| of `of_type` at `index` failing to be created """
+    from .array import Array, ArrayValidationException
+    return ArrayValidationException(Array, (index, _located_error(of_type, error)))
+
+
+def _located_error(of_type, error):
+    """ :return: `error` as the |ValidationException| of a value of `of_type`\ , to be keyed by its location """
+    if isinstance(error, ValidationException) and error.property_type is of_type:
+        return error
+    return ValidationException(of_type, _error_message(error))
+
+
+def _from_storage(of_type, storage, defaults):
+    """ creates a |Model| of `of_type` holding the |attribute| values of `storage`\ , without validating it """
+    for name, setter, p_attr in defaults:
+        if storage.get(name) is None:
+            setter(storage, copy(p_attr.default))
+    instance = of_type.__new__(of_type)
+    object.__setattr__(instance, '_prestans_attributes', storage)
+    return instance
+
+
+def _validate_all(instances):
+    """ :raises |ArrayValidationException|\ : for the first invalid instance, keyed by its index """
+    from .array import Array, ArrayValidationException
+    for index, instance in enumerate(instances):
+        exception = _collect_validation_errors(instance, None)
+        if exception is not None:
+            raise ArrayValidationException(Array, (index, exception))
+
+
+def _validates_natively(of_type):
+    """ whether validating a |Model| of `of_type` is the validation of :class:`Model` itself, and not overridden """
+    # py2to3 replace getattr(..., '__func__', ...) with of_type.validate and of_type._validation_errors
+    return getattr(of_type.validate, '__func__', of_type.validate) is _immutable_type_validate and \
+        getattr(of_type._validation_errors, '__func__', of_type._validation_errors) is _model_validation_errors
+
+
 # py2to3 replace with_metaclass with metaclass=_PrestansModelTypeMeta
 # noinspection PyAbstractClass
 class _MutableModel(with_metaclass(_PrestansModelTypeMeta, Model)):
@@ -321,4 +727,4 @@ class _MutableModel(with_metaclass(_PrestansModelTypeMeta, Model)):
     @property
     def prestans_attributes(self):
         """ own reference to prestans attributes """
-        return self._prestans_attributes
+        return _create_attributes(self)
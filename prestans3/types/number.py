@@ -8,33 +8,175 @@
     :copyright: (c) 2016 Anomaly Software
     :license: Apache 2.0, see LICENSE for more details.
 """
-from ..errors import ValidationException
+import functools
+import re
 
-from . import ImmutableType
+from future.utils import integer_types, string_types
+
+from ..errors import ValidationException, ValidationMessage
+
+from . import ImmutableType, _Property, _coercer, _coercion_caches, _construct
+
+STRICT = 'strict'
+""" coercion mode accepting only instances of the native type, e.g. ``int`` for |Integer| """
+INT_TO_FLOAT = 'int_to_float'
+""" coercion mode that also accepts ``int`` values for a |Float| """
+LENIENT = 'lenient'
+""" coercion mode that also accepts numeric strings such as ``' 42'`` or ``'1.5e3'``, as well as ``int`` for |Float| """
+
+coercion_modes = (STRICT, INT_TO_FLOAT, LENIENT)
 
 
 # noinspection PyAbstractClass
 class Number(ImmutableType):
+    """
+    Base class of |Integer| and |Float|. :func:`from_value` coerces values according to the class' :attr:`coercion`
+    mode, which a |_Property| may override:
+
+    >>> from prestans3.types import Model, Integer
+    >>> class Row(Model):
+    ...     count = Integer.property(coercion='lenient')
+    ...
+    >>> row = Row.mutable()
+    >>> row.count = '42'
+    """
+
+    coercion = STRICT
+    """ the default coercion mode of :func:`from_value`, one of :data:`coercion_modes` """
+
+    _coercion_error = TypeError
+    _string_regex = None
 
     @classmethod
     def from_value(cls, value):
-        return super(Number, cls).from_value(value)
+        return cls.coerce(value)
+
+    @classmethod
+    def coerce(cls, value, coercion=None):
+        """
+        coerces `value` to this |type| with a dispatch table compiled once per class and coercion mode, so that the
+        common cases do not raise and catch exceptions
+
+        :param value: the value to coerce
+        :param str coercion: one of :data:`coercion_modes`, defaults to the class' :attr:`coercion`
+        :raises TypeError: (or ``ValueError`` for |Integer|\ ) if `value` is not coercible in this mode
+        """
+        if coercion is None:
+            coercion = cls.coercion
+        table = _coercion_table(cls, coercion)
+        value_type = value.__class__
+        try:
+            converter = table[value_type]
+        except KeyError:
+            converter = table[value_type] = _resolve_converter(cls, coercion, value_type)
+        instance = converter(value) if converter is not None else None
+        if instance is None:
+            return cls._not_coercible(value)
+        return instance
+
+    @classmethod
+    def _not_coercible(cls, value):
+        if cls is Number:
+            # only the subclasses of Number coerce values, as documented by ImmutableType.from_value
+            return super(Number, cls)._not_coercible(value)
+        raise cls._coercion_error(
+            "{} of type {} not coercible to {}".format(value, value.__class__.__name__, cls.__name__))
+
+    @classmethod
+    def property(cls, coercion=None, **kwargs):
+        """
+        :param str coercion: one of :data:`coercion_modes`, overrides the class' :attr:`coercion` when setting this
+                             |_Property|
+        :return: configured |_Property| Class
+        :rtype: |_Property|
+        """
+        return _NumberProperty(of_type=cls, coercion=coercion, **kwargs)
+
+
+class _NumberProperty(_Property):
+    """ a |_Property| of a |Number| that may override the coercion mode of its |type| """
+
+    def __init__(self, of_type, coercion=None, **kwargs):
+        if coercion is not None and coercion not in coercion_modes:
+            raise ValueError("coercion of {} property must be one of {}, received {}".format(
+                of_type.__name__, ", ".join(coercion_modes), coercion))
+        super(_NumberProperty, self).__init__(of_type, **kwargs)
+        self.coercion = coercion
+
+    def _coerce(self, value):
+        return self._of_type.coerce(value, self.coercion)
+
+
+_coercion_tables = dict()
+_coercion_caches.append(_coercion_tables)
+
+_int_string_regex = re.compile(r'\s*[+-]?[0-9]+\s*\Z')
+_float_string_regex = re.compile(r'\s*[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?\s*\Z')
+
+
+def _coercion_table(of_type, coercion):
+    """ the dictionary of value classes to converters of `of_type` in `coercion` mode, filled as classes are seen """
+    try:
+        return _coercion_tables[(of_type, coercion)]
+    except KeyError:
+        if coercion not in coercion_modes:
+            raise ValueError("coercion must be one of {}, received {}".format(", ".join(coercion_modes), coercion))
+        table = _coercion_tables[(of_type, coercion)] = dict()
+        return table
+
+
+def _resolve_converter(of_type, coercion, value_type):
+    """
+    :return: the single argument function converting values of `value_type` to `of_type`, or ``None`` if they are not
+             coercible. the function returns ``None`` for values it rejects, such as malformed numeric strings. the
+             coercers registered with :func:`register_coercer<prestans3.types.ImmutableType.register_coercer>` take
+             precedence over those of the coercion mode
+    """
+    registered = _coercer(of_type, value_type)
+    if issubclass(value_type, of_type):
+        return _identity
+    elif registered is _construct:
+        return of_type
+    elif registered is not None:
+        return functools.partial(registered, of_type)
+    elif coercion != STRICT and of_type._native_type is float and issubclass(value_type, integer_types) and \
+            not issubclass(value_type, bool):
+        return of_type
+    elif coercion == LENIENT and of_type._string_regex is not None and issubclass(value_type, string_types):
+        return _string_converter(of_type)
+    return None
+
+
+def _identity(value):
+    return value
+
+
+def _string_converter(of_type):
+    match = of_type._string_regex.match
+    native_type = of_type._native_type
+
+    def _convert(value):
+        if match(value) is None:
+            return None
+        return of_type(native_type(value))
+
+    return _convert
 
 
 def _min(instance, config):
     """ checks the `instance` is at least `config` """
     if instance < config:
-        raise ValidationException(instance.__class__,
-                                  "{} property is {}, however the configured minimum value is {}".format(
-                                      instance.__class__, instance, config))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'number.min', "{} property is {}, however the configured minimum value is {}",
+            (instance.__class__, instance, config)))
 
 
 def _max(instance, config):
     """ checks the `instance` is at most `config` """
     if instance > config:
-        raise ValidationException(instance.__class__,
-                                  "{} property is {}, however the configured maximum value is {}".format(
-                                      instance.__class__, instance, config))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'number.max', "{} property is {}, however the configured maximum value is {}",
+            (instance.__class__, instance, config)))
 
 
 Number.register_property_rule(_min, name="min")
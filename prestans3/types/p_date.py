@@ -10,32 +10,56 @@
 """
 from datetime import date
 
-from ..types.temporal import Temporal
+from future.utils import string_types
+
+from ..types.temporal import Temporal, _iso_coercer, _is_pypy, _parse_iso_date, _validate_constructed
 
 
 class Date(date, Temporal):
     """
     Prestans3 Date Type. Acts as a native python :class:`datetime.date` class with added prestans 3 functionality.
+    :meth:`from_value` also accepts ISO-8601 strings of the form ``YYYY-MM-DD``.
     """
 
     def __init__(self, year, month, day):
-        import platform
         # py2to3 remove if and only perform else
-        if platform.python_implementation() == 'PyPy':
+        if _is_pypy:
             date.__init__(date(year, month, day))
         else:
             date.__init__(year, month, day)
         super(Date, self).__init__()
 
     @classmethod
-    def from_value(cls, value):
-        try:
-            return super(Date, cls).from_value(value)
-        except NotImplementedError:
-            if not isinstance(value, date):
-                raise TypeError(
-                    "{} of type {} is not coercible to type {}".format(value, value.__class__.__name__, cls.__name__))
-            return Date(value.year, value.month, value.day)
+    def from_ordinals(cls, ordinals):
+        """
+        constructs many |Dates| at once from proleptic Gregorian ordinals, see :meth:`datetime.date.fromordinal`
+
+        >>> Date.from_ordinals([736191, 736192])
+        [Date(2016, 8, 15), Date(2016, 8, 16)]
+
+        :param ordinals: iterable of ``int``
+        :rtype: list[|Date|]
+        """
+        new = date.__new__
+        instances = [new(cls, native.year, native.month, native.day) for native in map(date.fromordinal, ordinals)]
+        return _validate_constructed(cls, instances)
 
     def __copy__(self):
         return Date(self.year, self.month, self.day)
+
+
+def _to_date(instance):
+    """ converts a |Date| to a native :class:`datetime.date` """
+    return date(instance.year, instance.month, instance.day)
+
+
+Date.register_builtin_converter(_to_date)
+
+
+def _from_date(of_type, value):
+    """ coerces a native :class:`datetime.date` (or :class:`datetime.datetime`) to a |Date| """
+    return of_type(value.year, value.month, value.day)
+
+
+Date.register_coercer(date, _from_date)
+Date.register_coercer(string_types, _iso_coercer(_parse_iso_date))
@@ -10,32 +10,61 @@
 """
 from datetime import datetime
 
-from ..types.temporal import Temporal
+from future.utils import string_types
+
+from ..types.temporal import Temporal, _iso_coercer, _is_pypy, _parse_iso_datetime, _validate_constructed
 
 
 # noinspection PyAbstractClass
 class DateTime(Temporal, datetime):
     """
     Prestans 3 DateTime type.  Acts as a native python :class:`datetime.datetime` class with added prestans 3
-    functionality.
+    functionality. :meth:`from_value` also accepts ISO-8601 strings of the form
+    ``YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM]``.
     """
 
     def __init__(self, year, month=None, day=None, hour=0, minute=0, second=0, microsecond=0, tzinfo=None):
-        import platform
         # py2to3 remove if and only perform else
-        if platform.python_implementation() == 'PyPy':
+        if _is_pypy:
             datetime.__init__(datetime(year, month, day, hour, minute, second, microsecond, tzinfo))
         else:
             datetime.__init__(year, month, day, hour, minute, second, microsecond, tzinfo)
         super(DateTime, self).__init__()
 
     @classmethod
-    def from_value(cls, value):
-        try:
-            return super(DateTime, cls).from_value(value)
-        except NotImplementedError:
-            if not isinstance(value, datetime):
-                raise TypeError(
-                    "{} of type {} not coercible to type {}".format(value, value.__class__.__name__, cls.__name__))
-        return DateTime(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond,
-                        value.tzinfo)
+    def _not_coercible(cls, value):
+        raise TypeError("{} of type {} not coercible to type {}".format(value, value.__class__.__name__, cls.__name__))
+
+    @classmethod
+    def from_timestamps(cls, timestamps, tz=None):
+        """
+        constructs many |DateTimes| at once from POSIX timestamps, see :meth:`datetime.datetime.fromtimestamp`
+
+        :param timestamps: iterable of ``int`` or ``float``
+        :param datetime.tzinfo tz: the timezone to convert to, local time if ``None``
+        :rtype: list[|DateTime|]
+        """
+        new = datetime.__new__
+        instances = [new(cls, native.year, native.month, native.day, native.hour, native.minute, native.second,
+                         native.microsecond, native.tzinfo)
+                     for native in (datetime.fromtimestamp(timestamp, tz) for timestamp in timestamps)]
+        return _validate_constructed(cls, instances)
+
+
+def _to_datetime(instance):
+    """ converts a |DateTime| to a native :class:`datetime.datetime` """
+    return datetime(instance.year, instance.month, instance.day, instance.hour, instance.minute, instance.second,
+                    instance.microsecond, instance.tzinfo)
+
+
+DateTime.register_builtin_converter(_to_datetime)
+
+
+def _from_datetime(of_type, value):
+    """ coerces a native :class:`datetime.datetime` to a |DateTime| """
+    return of_type(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond,
+                   value.tzinfo)
+
+
+DateTime.register_coercer(datetime, _from_datetime)
+DateTime.register_coercer(string_types, _iso_coercer(_parse_iso_datetime))
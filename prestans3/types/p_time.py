@@ -10,29 +10,38 @@
 """
 from datetime import time
 
-from ..types.temporal import Temporal
+from future.utils import string_types
+
+from ..types.temporal import Temporal, _iso_coercer, _is_pypy, _parse_iso_time
 
 
 class Time(Temporal, time):
     """
     Prestans 3 Time type.  Acts as a native python :class:`datetime.time` class with added prestans 3 functionality.
+    :meth:`from_value` also accepts ISO-8601 strings of the form ``HH:MM:SS[.ffffff][Z|±HH:MM]``.
     """
 
     def __init__(self, hour=0, minute=0, second=0, microsecond=0, tzinfo=None):
-        import platform
         # py2to3 remove if and only perform else
-        if platform.python_implementation() == 'PyPy':
+        if _is_pypy:
             time.__init__(time(hour, minute, second, microsecond, tzinfo))
         else:
             time.__init__(hour, minute, second, microsecond, tzinfo)
         super(Time, self).__init__()
 
-    @classmethod
-    def from_value(cls, value):
-        try:
-            return super(Time, cls).from_value(value)
-        except NotImplementedError:
-            if not isinstance(value, time):
-                raise TypeError(
-                    "{} of type {} is not coercible to type {}".format(value, value.__class__.__name__, cls.__name__))
-        return Time(value.hour, value.minute, value.second, value.microsecond, value.tzinfo)
+
+def _to_time(instance):
+    """ converts a |Time| to a native :class:`datetime.time` """
+    return time(instance.hour, instance.minute, instance.second, instance.microsecond, instance.tzinfo)
+
+
+Time.register_builtin_converter(_to_time)
+
+
+def _from_time(of_type, value):
+    """ coerces a native :class:`datetime.time` to a |Time| """
+    return of_type(value.hour, value.minute, value.second, value.microsecond, value.tzinfo)
+
+
+Time.register_coercer(time, _from_time)
+Time.register_coercer(string_types, _iso_coercer(_parse_iso_time))
@@ -10,44 +10,62 @@
 """
 import re
 from future.types.newstr import BaseNewStr, newstr
-from future.utils import with_metaclass, PYPY
+from future.utils import with_metaclass, PYPY, PY3, string_types, text_type
 
-from ..errors import ValidationException, PropertyConfigError
+from ..errors import ValidationException, ValidationMessage, PropertyConfigError
+from ..regex import compile_format_regex
 from ..types import PrestansTypeMeta
-from . import ImmutableType
-from ..utils import is_str
+from . import ImmutableType, _construct
 
 
 class MergingStrMeta(BaseNewStr, PrestansTypeMeta):
     pass
 
 
-# noinspection PyAbstractClass
-class String(with_metaclass(MergingStrMeta, ImmutableType, newstr)):
-    """
-    Prestans 3 String type. Acts as a native :class:`str` with additional Prestans 3 functionality.
-    """
+# py2to3 remove the newstr based String and the PY3 check
+if PY3:
+    # noinspection PyAbstractClass
+    class String(ImmutableType, str):
+        """
+        Prestans 3 String type. Acts as a native :class:`str` with additional Prestans 3 functionality.
+        """
 
-    if PYPY:
-        def __init__(self, value=u'', encoding=None):
-            newstr.__init__(self, value, encoding)
-            super(String, self).__init__()
+        _native_type = str
+
+        def __new__(cls, value=u'', encoding=None):
+            if encoding is None:
+                return str.__new__(cls, value)
+            return str.__new__(cls, value, encoding)
 
-    else:
         def __init__(self, value=u'', encoding=None):
-            newstr.__init__(value, encoding)
             super(String, self).__init__()
 
-    @classmethod
-    def from_value(cls, value):
-        try:
-            return ImmutableType.from_value(value)
-        except NotImplementedError:
-            # py2to3 replace is_str(value) with isinstance(x, str)
-            if not is_str(value):
-                raise TypeError(
-                    "{} of type {} is not coercible to {}".format(value, value.__class__.__name__, cls.__name__))
-            return String(value)
+        @classmethod
+        def _not_coercible(cls, value):
+            raise TypeError(
+                "{} of type {} is not coercible to {}".format(value, value.__class__.__name__, cls.__name__))
+
+else:
+    # noinspection PyAbstractClass
+    class String(with_metaclass(MergingStrMeta, ImmutableType, newstr)):
+        """
+        Prestans 3 String type. Acts as a native :class:`str` with additional Prestans 3 functionality.
+        """
+
+        if PYPY:
+            def __init__(self, value=u'', encoding=None):
+                newstr.__init__(self, value, encoding)
+                super(String, self).__init__()
+
+        else:
+            def __init__(self, value=u'', encoding=None):
+                newstr.__init__(value, encoding)
+                super(String, self).__init__()
+
+        @classmethod
+        def _not_coercible(cls, value):
+            raise TypeError(
+                "{} of type {} is not coercible to {}".format(value, value.__class__.__name__, cls.__name__))
 
 
 def _min_length(instance, config):
@@ -60,11 +78,9 @@ def _min_length(instance, config):
     """
     length = len(instance)
     if length < config:
-        raise ValidationException(instance.__class__,
-                                  '{} min_length config is {} however len("{}") == {}'.format(
-                                      instance.__class__.__name__,
-                                      config, instance,
-                                      length))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'string.min_length', '{} min_length config is {} however len("{}") == {}',
+            (instance.__class__.__name__, config, instance, length)))
 
 
 def _max_length(instance, config):
@@ -77,29 +93,64 @@ def _max_length(instance, config):
     """
     length = len(instance)
     if length > config:
-        raise ValidationException(instance.__class__,
-                                  '{} max_length config is {} however len("{}") == {}'.format(
-                                      instance.__class__.__name__,
-                                      config, instance,
-                                      length))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'string.max_length', '{} max_length config is {} however len("{}") == {}',
+            (instance.__class__.__name__, config, instance, length)))
 
 
 def _format_regex(instance, config):
     """
-    Property rule that checks whether the instance conforms to the configured regular expression
+    Property rule that checks whether the whole instance matches the configured regular expression. The configuration
+    is compiled once when the |_Property| is created, a |LinearRegex| may be configured to match in linear time.
 
     :param |String| instance: the string to check
-    :param str config: The regular expression to check against
+    :param config: The regular expression to check against
+    :type config: str or FullMatchRegex or LinearRegex
     :raises |ValidationException|\ : if the string does not match the configured regular expression
     """
-    if not re.match(config, instance):
-        raise ValidationException(instance.__class__, '{} does not match the format_regex {}'.format(instance.__class__,
-                                                                                                     config))
+    regex = compile_format_regex(config)
+    if not regex.fullmatch(instance):
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'string.format_regex', '{} does not match the format_regex {}', (instance.__class__, regex.pattern)))
+
+
+def _lengths(instances, cache):
+    """ the lengths of all instances, computed once per batch validation pass """
+    try:
+        return cache['lengths']
+    except KeyError:
+        lengths = cache['lengths'] = list(map(len, instances))
+        return lengths
+
+
+def _batch_min_length(instances, config, cache):
+    """ batch variant of :func:`_min_length` """
+    lengths = _lengths(instances, cache)
+    if min(lengths) >= config:
+        return []
+    return [index for index, length in enumerate(lengths) if length < config]
+
+
+def _batch_max_length(instances, config, cache):
+    """ batch variant of :func:`_max_length` """
+    lengths = _lengths(instances, cache)
+    if max(lengths) <= config:
+        return []
+    return [index for index, length in enumerate(lengths) if length > config]
+
+
+def _batch_format_regex(instances, config, cache):
+    """ batch variant of :func:`_format_regex`, matches every instance with the one compiled regular expression """
+    fullmatch = compile_format_regex(config).fullmatch
+    if all(map(fullmatch, instances)):
+        return []
+    return [index for index, instance in enumerate(instances) if not fullmatch(instance)]
 
 
-String.register_property_rule(_min_length, name="min_length")
-String.register_property_rule(_max_length, name="max_length")
-String.register_property_rule(_format_regex, name="format_regex")
+String.register_property_rule(_min_length, name="min_length", batch=_batch_min_length)
+String.register_property_rule(_max_length, name="max_length", batch=_batch_max_length)
+String.register_property_rule(_format_regex, name="format_regex", prepare_config=compile_format_regex,
+                              batch=_batch_format_regex)
 
 
 def _min_max_string_check_config(configured_type, all_config):
@@ -130,5 +181,8 @@ def _prepare_normalize_whitespace(x):
     return re.sub(r'[ ]{2,}', ' ', _prepare_trim(x))
 
 
-String.register_prepare_function(_prepare_trim, name="trim")
-String.register_prepare_function(_prepare_normalize_whitespace, name="normalize_whitespace")
+String.register_prepare_function(_prepare_trim, name="trim", idempotent=True)
+String.register_prepare_function(_prepare_normalize_whitespace, name="normalize_whitespace", idempotent=True,
+                                 supersedes=["trim"])
+String.register_coercer(string_types, _construct)
+String.register_builtin_converter(text_type)
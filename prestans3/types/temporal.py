@@ -8,8 +8,20 @@
     :copyright: (c) 2016 Anomaly Software
     :license: Apache 2.0, see LICENSE for more details.
 """
-from ..errors import ValidationException, PropertyConfigError
-from ..types import ImmutableType
+import platform
+from datetime import date, datetime, timedelta, tzinfo
+
+from ..errors import ValidationException, ValidationMessage, PropertyConfigError
+from ..types import ImmutableType, _validates_on_construction
+
+# py2to3 remove try/except and import timezone directly
+try:
+    from datetime import timezone
+except ImportError:  # pragma: no cover
+    timezone = None
+
+# py2to3 remove, resolved once rather than on every construction of a |Temporal|
+_is_pypy = platform.python_implementation() == 'PyPy'
 
 
 # noinspection PyAbstractClass
@@ -17,8 +29,176 @@ class Temporal(ImmutableType):
     """ Base class for all time and date style classes """
 
     @classmethod
-    def from_value(cls, value):
-        return super(Temporal, cls).from_value(value)
+    def _not_coercible(cls, value):
+        raise TypeError(
+            "{} of type {} is not coercible to type {}".format(value, value.__class__.__name__, cls.__name__))
+
+
+def _iso_coercer(parse):
+    """ :return: a coercer constructing a |Temporal| from an ISO-8601 string with `parse`, or ``None`` if malformed """
+
+    def _coerce(of_type, value):
+        try:
+            return of_type(*parse(value))
+        except ValueError:
+            return None
+
+    return _coerce
+
+
+def _validate_constructed(of_type, instances):
+    """ validates `instances` created in bulk without calling ``__init__``, if validating them can fail """
+    if _validates_on_construction(of_type):
+        for instance in instances:
+            instance.validate()
+    return instances
+
+
+# noinspection PyAbstractClass
+class _FixedOffset(tzinfo):
+    """ a fixed utc offset, used where :class:`datetime.timezone` is unavailable """
+
+    def __init__(self, minutes):
+        self._offset = timedelta(minutes=minutes)
+        self._name = "UTC{}{:02d}:{:02d}".format('-' if minutes < 0 else '+', abs(minutes) // 60, abs(minutes) % 60)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def tzname(self, dt):
+        return self._name
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, self._name)
+
+
+_tzinfo_cache = dict()
+
+
+def _tzinfo(minutes):
+    """ returns a cached fixed offset :class:`datetime.tzinfo` of `minutes` from utc """
+    try:
+        return _tzinfo_cache[minutes]
+    except KeyError:
+        if timezone is not None:
+            offset = timezone.utc if minutes == 0 else timezone(timedelta(minutes=minutes))
+        else:
+            offset = _FixedOffset(minutes)
+        _tzinfo_cache[minutes] = offset
+        return offset
+
+
+def _parse_iso_date(value):
+    """
+    parses a fixed width ``YYYY-MM-DD`` string by slicing
+
+    :rtype: tuple(int, int, int)
+    :raises ValueError: if `value` is not of that form
+    """
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        raise ValueError("{} is not an ISO-8601 date".format(value))
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    if not (year + month + day).isdigit():
+        raise ValueError("{} is not an ISO-8601 date".format(value))
+    return int(year), int(month), int(day)
+
+
+def _parse_iso_time(value):
+    """
+    parses a fixed width ``HH:MM:SS[.ffffff][Z|±HH:MM]`` string by slicing, one to six fractional digits are accepted
+
+    :return: the hour, minute, second, microsecond and tzinfo (``None`` when no offset is present)
+    :rtype: tuple(int, int, int, int, datetime.tzinfo)
+    :raises ValueError: if `value` is not of that form
+    """
+    length = len(value)
+    if length < 8 or value[2] != ':' or value[5] != ':':
+        raise ValueError("{} is not an ISO-8601 time".format(value))
+    hour, minute, second = value[0:2], value[3:5], value[6:8]
+    if not (hour + minute + second).isdigit():
+        raise ValueError("{} is not an ISO-8601 time".format(value))
+    microsecond = 0
+    position = 8
+    if position < length and value[position] == '.':
+        end = position + 1
+        while end < length and value[end].isdigit():
+            end += 1
+        fraction = value[position + 1:end]
+        if not 0 < len(fraction) <= 6:
+            raise ValueError("{} is not an ISO-8601 time".format(value))
+        microsecond = int(fraction) * 10 ** (6 - len(fraction))
+        position = end
+    offset = None
+    if position < length:
+        zone = value[position:]
+        if zone == 'Z' or zone == 'z':
+            offset = _tzinfo(0)
+        elif len(zone) == 6 and zone[0] in '+-' and zone[3] == ':' and (zone[1:3] + zone[4:6]).isdigit():
+            minutes = int(zone[1:3]) * 60 + int(zone[4:6])
+            offset = _tzinfo(-minutes if zone[0] == '-' else minutes)
+        else:
+            raise ValueError("{} is not an ISO-8601 time".format(value))
+    return int(hour), int(minute), int(second), microsecond, offset
+
+
+def _parse_iso_datetime(value):
+    """
+    parses a fixed width ``YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM]`` string by slicing, a space is also accepted as the
+    separator
+
+    :rtype: tuple(int, int, int, int, int, int, int, datetime.tzinfo)
+    :raises ValueError: if `value` is not of that form
+    """
+    if len(value) < 19 or value[10] not in 'T ':
+        raise ValueError("{} is not an ISO-8601 datetime".format(value))
+    return _parse_iso_date(value[0:10]) + _parse_iso_time(value[11:])
+
+
+_DATE, _NAIVE, _AWARE = 'date', 'naive', 'aware'
+_epoch = datetime(1970, 1, 1)
+_epoch_utc = datetime(1970, 1, 1, tzinfo=_tzinfo(0))
+
+
+def _timedelta_microseconds(delta):
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _temporal_key(value):
+    """
+    encodes a date or datetime as an integer that orders the same way, dates as their proleptic Gregorian ordinal and
+    datetimes as microseconds since the epoch, in utc if timezone aware. keys of different kinds do not compare
+
+    :return: the key and its kind (``'date'``, ``'naive'`` or ``'aware'``), or ``(None, None)`` for other values
+    """
+    if isinstance(value, datetime):
+        if value.utcoffset() is None:
+            return _timedelta_microseconds(value - _epoch), _NAIVE
+        return _timedelta_microseconds(value - _epoch_utc), _AWARE
+    elif isinstance(value, date):
+        return value.toordinal(), _DATE
+    return None, None
+
+
+def _temporal_keys(instances, cache):
+    """
+    the keys of all instances and their common kind, or ``(None, None)`` if they are not all of one kind. cached in the
+    batch rule `cache` under ``'temporal_keys'``, where a |TemporalArray| provides its buffer
+    """
+    try:
+        return cache['temporal_keys']
+    except KeyError:
+        keys = []
+        kinds = set()
+        for instance in instances:
+            key, kind = _temporal_key(instance)
+            keys.append(key)
+            kinds.add(kind)
+        keys = (keys, kinds.pop()) if len(kinds) == 1 and None not in kinds else (None, None)
+        cache['temporal_keys'] = keys
+        return keys
 
 
 def _after(instance, config):
@@ -32,8 +212,8 @@ def _after(instance, config):
     :raises |ValidationException| if the configured temporal is equal or before the instance
     """
     if not instance > config:
-        raise ValidationException(instance.__class__,
-                                  "{} is not after configured temporal {}".format(str(instance), str(config)))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'temporal.after', "{} is not after configured temporal {}", (instance, config)))
 
 
 def _before(instance, config):
@@ -47,8 +227,8 @@ def _before(instance, config):
     :raises |ValidationException| if the configured temporal is equal or after the instance
     """
     if not instance < config:
-        raise ValidationException(instance.__class__,
-                                  "{} is not before configured temporal {}".format(str(instance), str(config)))
+        raise ValidationException(instance.__class__, ValidationMessage(
+            'temporal.before', "{} is not before configured temporal {}", (instance, config)))
 
 
 def _before_after_config_check(configured_type, all_config):
@@ -69,6 +249,24 @@ def _before_after_config_check(configured_type, all_config):
                                       "later than configuration for before '{}'".format(after, before))
 
 
-Temporal.register_property_rule(_after, name="after")
-Temporal.register_property_rule(_before, name="before")
+def _batch_after(instances, config, cache):
+    """ batch variant of the after rule, compares integer keys of the instances with the key of the configuration """
+    keys, kind = _temporal_keys(instances, cache)
+    bound, bound_kind = _temporal_key(config)
+    if keys is None or bound_kind != kind:
+        return None
+    return [index for index, key in enumerate(keys) if not key > bound]
+
+
+def _batch_before(instances, config, cache):
+    """ batch variant of the before rule, compares integer keys of the instances with the key of the configuration """
+    keys, kind = _temporal_keys(instances, cache)
+    bound, bound_kind = _temporal_key(config)
+    if keys is None or bound_kind != kind:
+        return None
+    return [index for index, key in enumerate(keys) if not key < bound]
+
+
+Temporal.register_property_rule(_after, name="after", batch=_batch_after)
+Temporal.register_property_rule(_before, name="before", batch=_batch_before)
 Temporal.register_config_check(_before_after_config_check, name="before_after_config_check")
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+    prestans.types.temporal_array
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+"""
+# py2to3 remove, required so that the standard library array module is not shadowed by prestans3.types.array
+from __future__ import absolute_import
+
+from array import array
+from datetime import date, datetime, timedelta, tzinfo as dt_tzinfo
+
+from .array import Array, _check_trusted_elements, _run_batch_rules
+from .p_date import Date
+from .p_datetime import DateTime
+from .temporal import _DATE, _NAIVE, _AWARE, _epoch, _epoch_utc, _temporal_key
+
+# py2to3 remove try, 'q' is always available
+try:
+    array('q')
+    _typecode = 'q'
+except ValueError:  # pragma: no cover
+    _typecode = 'l'
+
+
+# noinspection PyAbstractClass
+class TemporalArray(Array):
+    """
+    An |Array| of |Dates| or |DateTimes| stored compactly in an :class:`array.array` buffer of integers: dates as
+    proleptic Gregorian ordinals and datetimes as microseconds since the epoch, in utc if timezone aware. elements are
+    only created when accessed, and the ``after`` and ``before`` element |rules| are checked as integer comparisons
+    over the buffer. the datetimes of one array must either all be naive or all share one tzinfo.
+
+    >>> from datetime import date
+    >>> from prestans3.types import Date, TemporalArray
+    >>> days = TemporalArray(Date, ['2016-08-15', date(2016, 8, 16)])
+    >>> days.validate({'element_rules': {'after': Date(2016, 8, 1)}})
+    """
+
+    # noinspection PyUnusedLocal
+    def __init__(self, of_type, iterable=None, copy_list=True, **kwargs):
+        # copy_list is accepted as Array accepts it, the buffer is always encoded afresh
+        if not isinstance(of_type, type) or not issubclass(of_type, (Date, DateTime)):
+            raise TypeError("of_type must be a subclass of {} or {}, received {}".format(
+                Date.__name__, DateTime.__name__, getattr(of_type, '__name__', of_type.__class__.__name__)))
+        self._of_type = of_type
+        self._tzinfo = None
+        if isinstance(iterable, TemporalArray) and issubclass(iterable._of_type, of_type) and \
+                issubclass(of_type, Date) == issubclass(iterable._of_type, Date):
+            self._buffer = array(_typecode, iterable._buffer)
+            self._tzinfo = iterable._tzinfo
+        else:
+            self._buffer = array(_typecode)
+            for index, item in enumerate(iterable if iterable is not None else []):
+                try:
+                    self._buffer.append(self._encode(item))
+                except TypeError:
+                    raise ValueError(self.__class__, 'in {}.__init__, iterable[{}] is {} of type {}, but the declared '
+                                                     'type of this array is {}'.format(
+                        self.__class__.__name__, index, item, item.__class__.__name__, of_type.__name__))
+        # skips Array.__init__, the buffer replaces its list of values
+        super(Array, self).__init__(**kwargs)
+
+    @classmethod
+    def mutable(cls, of_type, iterable=None, **kwargs):
+        return _MutableTemporalArray(of_type, iterable, **kwargs)
+
+    @classmethod
+    def construct_trusted(cls, of_type, iterable=None, check=False):
+        """
+        as :func:`Array.construct_trusted()<prestans3.types.Array.construct_trusted>`\ , the elements are encoded
+        straight into the buffer without being coerced or validated. |DateTimes| are taken to share the tzinfo of the
+        first element
+        """
+        elements = [] if iterable is None else list(iterable)
+        if check:
+            _check_trusted_elements(of_type, elements)
+        instance = cls.__new__(cls)
+        instance._of_type = of_type
+        if issubclass(of_type, Date):
+            instance._tzinfo = None
+            instance._buffer = array(_typecode, [element.toordinal() for element in elements])
+        else:
+            instance._tzinfo = elements[0].tzinfo if elements else None
+            instance._buffer = array(_typecode, [_temporal_key(element)[0] for element in elements])
+        return instance
+
+    def _encode(self, value):
+        """ :return: the integer key of `value`, coercing it to the element type first if necessary """
+        if issubclass(self._of_type, Date):
+            if not isinstance(value, date):
+                value = self._of_type.from_value(value)
+            return value.toordinal()
+        if not isinstance(value, datetime):
+            value = self._of_type.from_value(value)
+        if not self._buffer:
+            self._tzinfo = value.tzinfo
+        elif _tzinfo_differs(value.tzinfo, self._tzinfo):
+            raise ValueError("{} {} has tzinfo {}, the other elements of this {} have tzinfo {}".format(
+                value.__class__.__name__, value, value.tzinfo, self.__class__.__name__, self._tzinfo))
+        return _temporal_key(value)[0]
+
+    def _native(self, key):
+        """ decodes an integer key to a native :class:`datetime.date` or :class:`datetime.datetime` """
+        if issubclass(self._of_type, Date):
+            return date.fromordinal(key)
+        elif self._tzinfo is None:
+            return _epoch + timedelta(microseconds=key)
+        return (_epoch_utc + timedelta(microseconds=key)).astimezone(self._tzinfo)
+
+    def _decode(self, key):
+        """ creates the element of this array for an integer key """
+        native = self._native(key)
+        if issubclass(self._of_type, Date):
+            return date.__new__(self._of_type, native.year, native.month, native.day)
+        return datetime.__new__(self._of_type, native.year, native.month, native.day, native.hour, native.minute,
+                                native.second, native.microsecond, native.tzinfo)
+
+    @property
+    def _kind(self):
+        if issubclass(self._of_type, Date):
+            return _DATE
+        return _NAIVE if self._tzinfo is None else _AWARE
+
+    @property
+    def _values(self):
+        return [self._decode(key) for key in self._buffer]
+
+    def _batch_validate_elements(self, element_rules):
+        if not self._buffer:
+            return None
+        return _run_batch_rules(self._of_type, self, element_rules, {'temporal_keys': (self._buffer, self._kind)})
+
+    def _with_buffer(self, buffer):
+        """ :return: a new immutable |TemporalArray| of the same element type sharing no state with this one """
+        instance = TemporalArray.__new__(TemporalArray)
+        instance._of_type = self._of_type
+        instance._tzinfo = self._tzinfo
+        instance._buffer = buffer
+        return instance
+
+    def to_numpy(self):
+        """
+        :return: the buffer as a NumPy ``datetime64[D]`` array for |Dates| or ``datetime64[us]`` array for |DateTimes|,
+                 in utc if timezone aware. requires NumPy
+        """
+        import numpy
+        if issubclass(self._of_type, Date):
+            return (numpy.array(self._buffer, dtype='int64') - _epoch.toordinal()).astype('datetime64[D]')
+        return numpy.array(self._buffer, dtype='int64').astype('datetime64[us]')
+
+    @classmethod
+    def from_numpy(cls, of_type, values, tzinfo=None):
+        """
+        creates a |TemporalArray| from a NumPy ``datetime64`` array. requires NumPy
+
+        :param of_type: |Date| or |DateTime|
+        :param values: the NumPy array
+        :param datetime.tzinfo tzinfo: for |DateTimes|, the timezone of the elements. `values` are utc if given
+        :raises ValueError: if `tzinfo` is given for |Dates|
+        :raises TypeError: if `tzinfo` is not a :class:`datetime.tzinfo`
+        """
+        import numpy
+        instance = cls(of_type)
+        if tzinfo is not None:
+            if issubclass(of_type, Date):
+                raise ValueError("{} elements have no tzinfo, received tzinfo {}".format(of_type.__name__, tzinfo))
+            elif not isinstance(tzinfo, dt_tzinfo):
+                raise TypeError("tzinfo must be a {}, received {} of type {}".format(
+                    dt_tzinfo.__name__, tzinfo, tzinfo.__class__.__name__))
+        if issubclass(of_type, Date):
+            keys = values.astype('datetime64[D]').astype('int64') + _epoch.toordinal()
+        else:
+            keys = values.astype('datetime64[us]').astype('int64')
+            instance._tzinfo = tzinfo
+        instance._buffer = array(_typecode, numpy.asarray(keys, dtype='int64').tolist())
+        return instance
+
+    #### list like magic methods
+
+    def __eq__(self, other):
+        if isinstance(other, TemporalArray) and self._kind == other._kind:
+            return self._buffer == other._buffer
+        return super(TemporalArray, self).__eq__(other)
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._decode(each) for each in self._buffer[key]]
+        return self._decode(self._buffer[key])
+
+    def __iter__(self):
+        return (self._decode(key) for key in self._buffer)
+
+    def __reversed__(self):
+        return self._with_buffer(self._buffer[::-1])
+
+    def head(self):
+        """ get the first element """
+        return self[0]
+
+    def tail(self):
+        """ get all elements after the first """
+        return self._with_buffer(self._buffer[1:])
+
+    def init(self):
+        """ get elements up to the last """
+        return self._with_buffer(self._buffer[:-1])
+
+    def last(self):
+        """ get last element """
+        return self[-1]
+
+    def drop(self, n):
+        """ get all elements except first n """
+        return self._with_buffer(self._buffer[n:])
+
+    def take(self, n):
+        """ get first n elements """
+        return self._with_buffer(self._buffer[:n])
+
+    def copy(self):
+        """ create a copy of the array """
+        return self._with_buffer(array(_typecode, self._buffer))
+
+
+def _tzinfo_differs(tzinfo, expected):
+    """ whether `tzinfo` is not equal to the `expected` tzinfo shared by the elements of a |TemporalArray| """
+    return tzinfo is not expected and (tzinfo is None or expected is None or tzinfo != expected)
+
+
+def _to_native_list(instance):
+    """ converts the buffer of a |TemporalArray| straight to native dates or datetimes """
+    return [instance._native(key) for key in instance._buffer]
+
+
+TemporalArray.register_builtin_converter(_to_native_list)
+
+
+# noinspection PyAbstractClass
+class _MutableTemporalArray(TemporalArray):
+    """ mutable class of a temporal array """
+
+    def __setitem__(self, key, value):
+        self._buffer[key] = self._encode(value)
+
+    def __delitem__(self, key):
+        del self._buffer[key]
+
+    def append(self, value):
+        try:
+            self._buffer.append(self._encode(value))
+        except TypeError:
+            raise ValueError(
+                "value is not an instance of {}, one of its subclasses or a coercable type: received value type: {}"
+                .format(self._of_type.__name__, value.__class__.__name__))
@@ -51,5 +51,6 @@ setup(
     setup_requires=['pytest-runner'],
     extras_require={
         'SQLAlchemy': ['SQLAlchemy'],
+        'NumPy': ['numpy'],
     }
 )
@@ -8,10 +8,14 @@
     :copyright: (c) 2016 Anomaly Software
     :license: Apache 2.0, see LICENSE for more details.
 """
+import json
+
 import pytest
 
-from prestans3.errors import ValidationException, InvalidMethodUseError, PropertyConfigError
-from prestans3.types import Model, String, ImmutableType
+from prestans3.errors import ValidationException, InvalidMethodUseError, PropertyConfigError, \
+    ContainerValidationException, ValidationExceptionSummary, ContainerValidationExceptionSummary, json_pointer, \
+    ValidationMessage, IndexRanges
+from prestans3.types import Array, Model, String, ImmutableType
 
 exception_1 = ValidationException(String)
 exception_2 = ValidationException(String)
@@ -86,3 +90,106 @@ def test_property_config_error_has_default_message():
     value = String('foo')
     assert 'error whilst configuring the property rule name {} on class {}'.format('foo', _Model.__name__) \
            in str(PropertyConfigError(_Model, value))
+
+
+def _error_tree():
+    root = ContainerValidationException(Model, 'root message')
+    for index in range(3):
+        child = ContainerValidationException(Model)
+        for key in ('first', 'second'):
+            child.add_validation_exception(key, ValidationException(String, '{} {}'.format(index, key)))
+        root.add_validation_exception('child_{}'.format(index), child)
+    return root
+
+
+def test_validation_exception_summaries_are_indexed():
+    root = _error_tree()
+    summaries = list(root)
+    assert len(root) == len(summaries) == 7
+    assert [root[index] for index in range(-7, 7)] == summaries + summaries
+    assert root[2:5] == summaries[2:5]
+    assert root.head == summaries[0]
+    with pytest.raises(IndexError):
+        root[7]
+    with pytest.raises(IndexError):
+        ValidationException(String).head
+
+
+def test_validation_exception_index_does_not_iterate_summaries(mocker):
+    root = _error_tree()
+    iterate = mocker.patch.object(ContainerValidationException, '__iter__')
+    assert str(root[4]) == 'Model.child_1.second is invalid: ["1 second"]'
+    assert not iterate.called
+
+
+def test_validation_exception_index_follows_later_changes():
+    root = _error_tree()
+    assert len(root) == 7
+    child = root.validation_exceptions['child_0']
+    child.add_validation_exception('third', ValidationException(String, '0 third'))
+    empty = ValidationException(String)
+    root.add_validation_exception('child_1', empty)
+    assert len(root) == 6
+    empty.add_validation_message('now invalid')
+    assert list(root) == root[:] and len(root) == 7
+
+
+def test_validation_exception_without_summaries_is_truthy():
+    assert ValidationException(String)
+    assert ContainerValidationException(Model)
+
+
+def test_validation_exception_summaries_carry_their_path():
+    root = ContainerValidationException(Model)
+    elements = ContainerValidationException(Array)
+    elements.add_validation_exception(3, ValidationException(String, 'invalid element'))
+    root.add_validation_exception('some/array', elements)
+    summary = root.head
+    assert summary.path == ('some/array', 3)
+    assert summary[0] == 'Model.some/array[3]'
+    assert summary.pointer == '/some~1array/3'
+    assert list(root) == [summary]
+
+
+def test_json_pointer_escapes_segments():
+    assert json_pointer(()) == ''
+    assert json_pointer(('a~b', 0)) == '/a~0b/0'
+
+
+def test_container_summary_prefixes_summaries_without_a_path():
+    summary = ContainerValidationExceptionSummary('MySuperModel', 'sub', ValidationExceptionSummary('MyClass.str', []))
+    assert summary[0] == 'MySuperModel.sub.str'
+    with pytest.raises(ValueError):
+        summary.pointer
+    nested = ContainerValidationExceptionSummary('MySuperModel', 'sub', ValidationExceptionSummary.from_path(
+        'MyModel', ('items', 1), ['error']))
+    assert nested[0] == 'MySuperModel.sub.items[1]' and nested.pointer == '/sub/items/1'
+
+
+def test_validation_message_is_rendered_when_converted_to_str(mocker):
+    value = String('spam' * 1000)
+    render = mocker.spy(ValidationMessage, '_render_argument')
+    with pytest.raises(ValidationException) as error:
+        value.validate({'max_length': 10})
+    message = error.value.message_templates[0]
+    assert message.template_id == 'string.max_length'
+    assert message.args[2] is value
+    assert not render.called
+    rendered = str(message)
+    assert rendered.endswith('however len("{}... (3800 more characters)") == 4000'.format('spam' * 50))
+    assert message == rendered and rendered in str(error.value)
+    assert error.value.messages == [rendered] and list(error.value)[0][1] == [rendered]
+    assert json.loads(json.dumps([list(summary) for summary in error.value])) == [['String', [rendered]]]
+
+
+def test_validation_message_argument_limit_is_configurable(mocker):
+    mocker.patch.object(ValidationMessage, 'argument_limit', None)
+    assert str(ValidationMessage('test', '{}!', ('spam' * 100,))) == 'spam' * 100 + '!'
+    assert ValidationMessage('test', '{}', ('spam',)) != ValidationMessage('test', '{}', ('eggs',))
+
+
+def test_index_ranges_compress_indices():
+    ranges = IndexRanges.from_indices([0, 1, 2, 5, 7, 8])
+    assert ranges == ((0, 2), (5, 5), (7, 8))
+    assert str(ranges) == '0-2,5,7-8'
+    assert list(ranges.indices()) == [0, 1, 2, 5, 7, 8] and ranges.count == 6
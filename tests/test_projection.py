@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.test_projection
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+"""
+from collections import OrderedDict
+
+import pytest
+
+from prestans3 import projection as projection_module
+from prestans3.projection import compile_projection, serialize, Projection
+from prestans3.types import Model, String, Integer, Array
+
+
+class Owner(Model):
+    id = Integer.property()
+    name = String.property()
+    email = String.property(required=False)
+
+
+class Item(Model):
+    id = Integer.property()
+    name = String.property()
+    description = String.property(required=False)
+    owner = Owner.property(required=False)
+    tags = Array.property(String, required=False)
+
+
+def _item():
+    return Item(initial_values={
+        'id': 1,
+        'name': 'widget',
+        'description': 'a long description',
+        'owner': {'id': 2, 'name': 'jum', 'email': 'jum@example.com'},
+        'tags': ['a', 'b']
+    })
+
+
+def test_can_compile_projection():
+    projection = compile_projection("id,name,owner(id,name)")
+    assert isinstance(projection, Projection)
+    assert projection['id'] is None
+    assert projection['name'] is None
+    assert set(projection['owner'].keys()) == {'id', 'name'}
+
+
+def test_compiled_projections_are_cached_by_expression():
+    assert compile_projection("id,owner(name)") is compile_projection("id,owner(name)")
+
+
+def test_projection_cache_keeps_most_recently_used_expressions(mocker):
+    mocker.patch.object(projection_module, 'projection_cache_size', 2)
+    mocker.patch.object(projection_module, '_projection_cache', OrderedDict())
+    first = compile_projection("id")
+    evicted = compile_projection("name")
+    assert compile_projection("id") is first
+    compile_projection("owner(id)")
+    assert compile_projection("id") is first
+    assert list(projection_module._projection_cache) == ["owner(id)", "id"]
+    assert compile_projection("name") is not evicted
+
+
+def test_compile_projection_ignores_whitespace():
+    projection = compile_projection(" id , owner ( id , name ) ")
+    assert projection.expression == "id,owner(id,name)"
+
+
+@pytest.mark.parametrize('expression', ["", "id,", "id,,name", "owner(", "owner(id", "owner()", "id)", "id,id"])
+def test_compile_projection_raises_on_malformed_expression(expression):
+    with pytest.raises(ValueError):
+        compile_projection(expression)
+
+
+def test_compile_projection_raises_on_non_str():
+    with pytest.raises(TypeError):
+        compile_projection(123)
+
+
+def test_serialize_without_fields_is_native_value():
+    item = _item()
+    assert serialize(item) == item.native_value
+
+
+def test_serialize_only_selected_fields():
+    assert serialize(_item(), "id,name,owner(id,name)") == {
+        'id': 1,
+        'name': 'widget',
+        'owner': {'id': 2, 'name': 'jum'}
+    }
+
+
+def test_serialize_accepts_compiled_projection():
+    assert serialize(_item(), compile_projection("name")) == {'name': 'widget'}
+
+
+def test_serialize_does_not_compute_native_value_of_excluded_fields(mocker):
+    item = _item()
+    spy = mocker.patch.object(Owner, 'native_value', new_callable=mocker.PropertyMock)
+    assert serialize(item, "id") == {'id': 1}
+    assert not spy.called
+
+
+def test_serialize_skips_unset_attributes():
+    item = Item(initial_values={'id': 1, 'name': 'widget'})
+    assert serialize(item, "id,description,owner(id)") == {'id': 1}
+
+
+def test_serialize_applies_projection_to_each_array_element():
+    items = Array(Item, [_item(), _item()])
+    assert serialize(items, "id,owner(name)") == [{'id': 1, 'owner': {'name': 'jum'}},
+                                                  {'id': 1, 'owner': {'name': 'jum'}}]
+
+
+def test_serialize_raises_on_unknown_attribute():
+    with pytest.raises(ValueError) as error:
+        serialize(_item(), "id,colour")
+    assert "'colour' is not a configured prestans attribute of Item" in str(error.value)
+
+
+def test_serialize_raises_when_projecting_a_scalar():
+    with pytest.raises(ValueError) as error:
+        serialize(_item(), "name(first)")
+    assert "cannot apply projection 'first' to scalar type String" in str(error.value)
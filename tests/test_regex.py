@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.test_regex
+    ~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+"""
+import re
+
+import pytest
+
+from prestans3.regex import LinearRegex, FullMatchRegex, compile_format_regex, _anchored
+
+
+@pytest.mark.parametrize('pattern, string', [
+    (r'[abc][123]', 'a1'),
+    (r'(a|b)*c', 'ababc'),
+    (r'(?:ab|a)+b?', 'aabab'),
+    (r'^\d{2,4}$', '123'),
+    (r'[^0-9]+', 'abc'),
+    (r'\w+@\w+\.com', 'jum@example.com'),
+    (r'[A-Z]{2}(-[0-9]+)*', 'AU-12-3'),
+    (r'(?P<name>ab)*', 'abab'),
+    (r'[\d\s]+', '1 2 3'),
+    (r'a.c', 'abc'),
+    (r'a*?b', 'aaab'),
+    (r'[-a]+', 'a-a'),
+    (r'x{,2}', 'xx'),
+    (r'', ''),
+])
+def test_linear_regex_matches_like_re(pattern, string):
+    regex = LinearRegex(pattern)
+    assert regex.fullmatch(string)
+    for candidate in [string[:-1], string + 'z', 'z' + string, string[1:]]:
+        assert regex.fullmatch(candidate) == bool(re.match(r'(?:{})\Z'.format(pattern), candidate))
+
+
+def test_linear_regex_does_not_match_partial_strings():
+    assert not LinearRegex(r'[abc][123]').fullmatch('a1 and more')
+    assert not LinearRegex(r'a.c').fullmatch('a\nc')
+
+
+def test_linear_regex_is_not_exponential_on_pathological_patterns():
+    assert not LinearRegex(r'(a+)+b').fullmatch('a' * 5000)
+    assert not LinearRegex(r'(a|aa)*c').fullmatch('a' * 5000)
+
+
+@pytest.mark.parametrize('pattern', [r'(', r')', r'[a', r'\1', r'(?=a)', r'(?i)a', r'\b', r'a{2000}', r'[z-a]', r'*a',
+                                     r'a{3,2}'])
+def test_linear_regex_raises_on_unsupported_or_malformed_patterns(pattern):
+    with pytest.raises(ValueError):
+        LinearRegex(pattern)
+
+
+def test_full_match_regex_accepts_inline_global_flags():
+    regex = FullMatchRegex(r'(?i)abc')
+    assert regex.fullmatch('ABC') and not regex.fullmatch('ABCD')
+    assert compile_format_regex(r'(?i)[a-z]+').fullmatch('Spam')
+
+
+def test_full_match_regex():
+    regex = FullMatchRegex(r'[abc][123]')
+    assert regex.fullmatch('a1')
+    assert not regex.fullmatch('a1 and more')
+    assert not FullMatchRegex(r'a|b').fullmatch('ab')
+
+
+@pytest.mark.parametrize("pattern, flags, string, matches", [
+    (r'a|ab', 0, 'ab', True), (r'a|b', 0, 'ab', False), (r'(?i)abc', 0, 'ABC', True), (r'(?i)abc', 0, 'ABCD', False),
+    (r'(?x) a b  # spaced', 0, 'ab', True), (r'ab # spaced', re.VERBOSE, 'abc', False), (r'a$', 0, 'a\n', False)])
+def test_anchored_pattern_matches_as_fullmatch_does(pattern, flags, string, matches):
+    assert bool(re.match(_anchored(pattern, flags), string, flags)) == matches
+    assert bool(re.fullmatch(pattern, string, flags)) == matches
+
+
+def test_compile_format_regex():
+    assert compile_format_regex(r'[a-z]+') is compile_format_regex(r'[a-z]+')
+    assert isinstance(compile_format_regex(r'[a-z]+'), FullMatchRegex)
+    compiled = compile_format_regex(re.compile(r'[a-z]+', re.IGNORECASE))
+    assert compiled.fullmatch('ABC')
+    linear = LinearRegex(r'[a-z]+')
+    assert compile_format_regex(linear) is linear
+    with pytest.raises(TypeError):
+        compile_format_regex(123)
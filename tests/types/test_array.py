@@ -14,7 +14,9 @@ from datetime import time, tzinfo
 import pytest
 
 from prestans3.errors import AccessError, ValidationException
-from prestans3.types.array import Array, _ArrayProperty
+from prestans3.types.array import Array, _ArrayProperty, ALL_FAILURES, ArrayValidationException
+from prestans3.types import _builtin_converters, _builtin_converter_cache, _specialised_builtin_converter_cache, \
+    _has_specialised_builtin_converter
 from prestans3.types.integer import Integer
 from prestans3.types.model import Model
 from prestans3.types.string import String
@@ -299,3 +301,181 @@ def test_from_and_to_invariant():
         'my_array': model.my_array.native_value
     }
     assert _M.from_value(dictionary) == model
+
+
+def test_to_builtin():
+    converted = Array(Integer, [1, 2, 3]).to_builtin()
+    assert converted == [1, 2, 3]
+    assert all(value.__class__ is int for value in converted)
+    converted = Array(String, ['yellow', 'red']).to_builtin()
+    assert converted == ['yellow', 'red']
+    assert all(value.__class__ is str for value in converted)
+    assert Array(Time, [time(1, 2, 3, 4, utc)]).to_builtin()[0].__class__ is time
+
+
+def test_to_builtin_honours_element_subclass_converters(mocker):
+    # the registry and its caches are restored after the test, so the subclass does not affect other tests
+    for registry in (_builtin_converters, _builtin_converter_cache, _specialised_builtin_converter_cache):
+        mocker.patch.dict(registry)
+
+    class _DoubledInteger(Integer):
+        pass
+
+    _DoubledInteger.register_builtin_converter(lambda instance: int(instance) * 2)
+    assert Array(Integer, [Integer(1), _DoubledInteger(2)]).to_builtin() == [1, 4]
+
+
+def test_to_builtin_of_nested_arrays_and_models():
+    class _Model(Model):
+        name = String.property()
+        numbers = Array.property(Integer)
+
+    converted = Array(_Model, [{'name': 'spam', 'numbers': [1, 2]}]).to_builtin()
+    assert converted == [{'name': 'spam', 'numbers': [1, 2]}]
+    assert converted[0].__class__ is dict
+    assert converted[0]['name'].__class__ is str
+    assert converted[0]['numbers'].__class__ is list
+
+
+def test_string_element_rules_are_validated_in_batch(mocker):
+    array = Array(String, ['spam', 'ham', 'eggs'], validate_immediately=False)
+    validate = mocker.spy(String, 'validate')
+    array.validate({'element_rules': {'min_length': 3, 'max_length': 4, 'format_regex': r'[a-z]+',
+                                      'choices': ['spam', 'ham', 'eggs']}})
+    assert not validate.called
+
+
+@pytest.mark.parametrize('element_rules, index, message', [
+    ({'min_length': 4}, 1, 'min_length config is 4'),
+    ({'max_length': 4}, 3, 'max_length config is 4'),
+    ({'min_length': 4, 'max_length': 4}, 1, 'min_length config is 4'),
+    ({'format_regex': r'[a-z]{3,4}'}, 3, 'does not match the format_regex'),
+    ({'choices': ['spam', 'eggs', 'toast']}, 1, 'valid choices are [spam, eggs, toast]'),
+])
+def test_batched_string_element_rules_report_first_failing_element(element_rules, index, message, mocker):
+    array = Array(String, ['spam', 'ham', 'eggs', 'toast'], validate_immediately=False)
+    validate = mocker.spy(String, 'validate')
+    with pytest.raises(ValidationException) as exception:
+        array.validate({'element_rules': element_rules})
+    assert validate.call_count == 1
+    assert 'Array[{}]'.format(index) in str(exception.value)
+    assert message in str(exception.value)
+
+
+def test_batched_element_rules_fall_back_for_element_subclasses(mocker):
+    class _String(String):
+        pass
+
+    array = Array(String, ['spam', _String('ham')], validate_immediately=False)
+    validate = mocker.spy(String, 'validate')
+    array.validate({'element_rules': {'min_length': 3}})
+    assert validate.call_count == 2
+
+
+def test_batched_element_rules_fall_back_for_unhashable_choices():
+    array = Array(String, ['spam', 'ham'], validate_immediately=False)
+    array.validate({'element_rules': {'choices': [['unhashable'], 'spam', 'ham']}})
+    with pytest.raises(ValidationException):
+        array.validate({'element_rules': {'choices': [['unhashable'], 'spam']}})
+
+
+def test_array_try_from_value():
+    assert Array.try_from_value(String, ['spam']).value == ['spam']
+    result = Array.try_from_value(String, ['spam', 'eggs', 'toast'], {'element_rules': {'max_length': 4}})
+    assert [summary.path for summary in result.errors] == [(2,)]
+    assert 'not coercible' in str(Array.try_from_value(Integer, [1, 'two']).errors.head)
+
+
+def test_all_element_failures_are_grouped_by_failing_rules():
+    array = Array(String, ['spam', 'ham', 'eggs', 'toast', 'jam', 'sausage'])
+    errors = array.validate_result({'element_rules': {'max_length': 4, 'min_length': 4},
+                                    'element_failures': ALL_FAILURES}).errors
+    assert [summary[0] for summary in errors] == ['Array[1,4]', 'Array[3,5]']
+    with pytest.raises(ValueError) as error:
+        errors.head.pointer
+    assert 'expand()' in str(error.value)
+    expanded = errors.expand()
+    assert [summary[0] for summary in expanded] == ['Array[1]', 'Array[4]', 'Array[3]', 'Array[5]']
+    assert [summary.pointer for summary in expanded] == ['/1', '/4', '/3', '/5']
+    assert 'len("sausage")' in str(expanded[3])
+
+
+def test_all_element_failures_keeps_container_elements_separate():
+    class _Model(Model):
+        name = String.property(max_length=3)
+
+    array = Array(_Model, [_Model(initial_values={'name': 'spam'}, validate_immediately=False)] * 2,
+                  validate_immediately=False)
+    errors = array.validate_result({'element_failures': ALL_FAILURES}).errors
+    assert isinstance(errors, ArrayValidationException)
+    assert [summary.path for summary in errors] == [(0, 'name'), (1, 'name')]
+
+
+def test_element_failures_property_config():
+    class _Model(Model):
+        words = Array.property(String, element_rules={'max_length': 3}, element_failures=ALL_FAILURES)
+
+    model = _Model.mutable()
+    model.words = ['spam', 'eggs', 'ham']
+    assert [summary.path for summary in model.validate_result().errors] == [('words', ((0, 1),))]
+    with pytest.raises(ValueError):
+        Array.property(String, element_failures='some')
+
+
+def test_array_validate_native():
+    assert Array.validate_native(['spam', 'eggs'], String, {'element_rules': {'max_length': 4}}).ok
+    result = Array.validate_native(['spam', 'toast', 'sausage'], String,
+                                   {'min_length': 4, 'element_rules': {'max_length': 4},
+                                    'element_failures': ALL_FAILURES})
+    assert [summary[0] for summary in result.errors] == ['Array', 'Array[1-2]']
+    assert 'minimum configured length is 4' in str(result.errors.head)
+    assert [summary[0] for summary in result.errors.expand()] == ['Array', 'Array[1]', 'Array[2]']
+    assert not Array.validate_native([1, 'two'], Integer).ok
+
+
+def test_array_validate_native_resolves_rules_once_and_creates_one_element_per_failing_rule(mocker):
+    words = ['spam', 'toast', 'ham', 'sausage', 'eggs', 'ja'] * 100
+    config = {'element_rules': {'max_length': 4, 'min_length': 3}, 'element_failures': ALL_FAILURES}
+    expected = Array.try_from_value(String, words, config).errors
+    configured_rules = mocker.spy(String, '_configured_rules')
+    init = mocker.spy(String, '__init__')
+    errors = Array.validate_native(words, String, config).errors
+    assert configured_rules.call_count == 1
+    assert init.call_count == 2
+    assert [str(summary) for summary in errors] == [str(summary) for summary in expected]
+    assert [summary.path for summary in errors.expand()] == [summary.path for summary in expected.expand()]
+
+
+def test_array_construct_trusted_does_not_coerce_or_validate(mocker):
+    from_value = mocker.spy(String, 'from_value')
+    elements = [String('spam'), String('eggs')]
+    array = Array.construct_trusted(String, elements, check=True)
+    assert array == elements and array._values is not elements
+    assert not from_value.called
+    assert not array.validate_result({'min_length': 3}).ok
+    assert len(Array.construct_trusted(Integer)) == 0
+    mutable = Array.mutable(String).construct_trusted(String, elements)
+    mutable.append('ham')
+    assert len(mutable) == 3 and len(elements) == 2
+    with pytest.raises(AssertionError):
+        Array.construct_trusted(String, ['spam'], check=True)
+
+
+def test_array_of_typed_list_keeps_list_when_handed_over(mocker):
+    elements = [String('spam'), String('eggs')]
+    from_value = mocker.spy(String, 'from_value')
+    copied = Array(String, elements)
+    owned = Array(String, elements, copy_list=False)
+    assert not from_value.called
+    assert copied._values == elements and copied._values is not elements
+    assert owned._values is elements
+    assert Array(String, (value for value in ['spam', String('eggs')])) == ['spam', 'eggs']
+    with pytest.raises(TypeError):
+        Array(String, 5)
+    with pytest.raises(ValueError) as error:
+        Array(String, iter(['spam', object()]))
+    assert 'iterable[1] is <object object' in str(error.value)
+
+
+def test_to_builtin_of_integer_arrays_is_not_specialised_by_other_tests():
+    assert not _has_specialised_builtin_converter(Integer)
@@ -9,12 +9,15 @@
     :license: Apache 2.0, see LICENSE for more details.
 """
 import base64
+import binascii
+import hashlib
+import io
 
 import pytest
 
-from prestans3.errors import ValidationException
+from prestans3.errors import ValidationException, PropertyConfigError
 from prestans3.types import Model
-from prestans3.types.data_url_file import DataURLFile
+from prestans3.types.data_url_file import DataURLFile, _decode_base64_chunks
 
 
 def test_can_create_data_url_file():
@@ -176,3 +179,219 @@ def test_native_value():
 def test_to_from_value_invariant():
     url_file = DataURLFile("data:image/png;base64,abc=")
     assert url_file == DataURLFile.from_value(url_file.native_value)
+
+
+def test_contents_view_references_original_bytes():
+    encoded = b"data:image/png;base64,abc="
+    url_file = DataURLFile(encoded)
+    assert url_file.contents_view.obj is encoded
+    assert url_file.contents_view == b"abc="
+    assert url_file.mime_type == 'image/png'
+    assert url_file.encoding == 'base64'
+    assert url_file.contents == "abc="
+
+
+def test_can_create_from_bytes_like_values():
+    assert DataURLFile(bytearray(b"data:image/png;base64,abc=")) == "data:image/png;base64,abc="
+    assert DataURLFile(memoryview(b"data:image/png;base64,abc=")) == "data:image/png;base64,abc="
+    assert DataURLFile.from_value(b"data:image/png;base64,abc=") == "data:image/png;base64,abc="
+    with pytest.raises(TypeError):
+        DataURLFile(123)
+
+
+def test_decoded_contents_is_cached():
+    url_file = DataURLFile("data:image/png;base64," + base64.b64encode(b'some bytes').decode('ascii'))
+    decoded = url_file.decoded_contents
+    assert decoded == b'some bytes'
+    assert url_file.decoded_contents is decoded
+
+
+def test_decoded_contents_falls_back_to_codec_for_other_encodings():
+    assert DataURLFile("data:text/plain;hex,6869").decoded_contents == b'hi'
+
+
+def _encoded_stream(payload, mime_type='application/octet-stream', line_length=None):
+    encoded = base64.b64encode(payload)
+    if line_length:
+        encoded = b'\n'.join(encoded[i:i + line_length] for i in range(0, len(encoded), line_length))
+    return io.BytesIO(b'data:' + mime_type.encode('ascii') + b';base64,' + encoded)
+
+
+def test_can_create_from_stream():
+    payload = bytes(bytearray(range(256))) * 50
+    url_file = DataURLFile.from_stream(_encoded_stream(payload, 'image/png', line_length=76), chunk_size=7)
+    assert url_file.mime_type == 'image/png'
+    assert url_file.encoding == 'base64'
+    with url_file.open() as decoded_file:
+        assert decoded_file.read() == payload
+    assert url_file.decoded_contents == payload
+    assert url_file == DataURLFile.create(base64.b64encode(payload).decode('ascii'), 'image/png')
+
+
+def test_stream_is_spooled_to_disk_above_threshold(mocker):
+    mocker.patch.object(DataURLFile, 'spool_threshold', 100)
+    url_file = DataURLFile.from_stream(_encoded_stream(b'x' * 1000), chunk_size=64)
+    assert url_file._spool._rolled
+    small_file = DataURLFile.from_stream(_encoded_stream(b'x' * 10), chunk_size=64)
+    assert not small_file._spool._rolled
+    url_file.close()
+    small_file.close()
+
+
+def test_open_returns_independent_readers():
+    url_file = DataURLFile.from_stream(_encoded_stream(b'abcdef'))
+    first = url_file.open()
+    second = url_file.open()
+    assert first.read(3) == b'abc'
+    assert second.read() == b'abcdef'
+    assert first.read() == b'def'
+    first.close()
+    with url_file.open() as third:
+        assert third.read() == b'abcdef'
+
+
+def test_open_spools_large_in_memory_contents(mocker):
+    mocker.patch.object(DataURLFile, 'spool_threshold', 16)
+    payload = b'y' * 100
+    url_file = DataURLFile("data:text/plain;base64," + base64.b64encode(payload).decode('ascii'))
+    with url_file.open() as decoded_file:
+        assert decoded_file.read() == payload
+    assert url_file._spool is not None
+    assert url_file._decoded_contents is None
+    url_file.close()
+    assert url_file._spool is None
+    assert url_file.decoded_size == 100 and url_file.hexdigest('md5') == hashlib.md5(payload).hexdigest()
+    with url_file.open() as decoded_file:
+        assert decoded_file.read() == payload
+
+
+def test_closed_stream_can_not_be_read():
+    url_file = DataURLFile.from_stream(_encoded_stream(b'abcdef'))
+    url_file.close()
+    with pytest.raises(ValueError) as error:
+        url_file.open()
+    assert 'closed' in str(error.value)
+    with pytest.raises(ValueError):
+        url_file.decoded_size
+
+
+def test_decode_base64_chunks_accepts_memoryviews():
+    chunks = [memoryview(b'YWJj\nZGVm'), bytearray(b'Z2hp'), b'']
+    assert b''.join(_decode_base64_chunks(chunks)) == b'abcdefghi'
+
+
+def test_open_small_in_memory_contents():
+    with DataURLFile("data:image/png;base64,abc=").open() as decoded_file:
+        assert decoded_file.read() == b'i\xb7'
+
+
+def test_from_stream_accepts_text_streams():
+    url_file = DataURLFile.from_stream(io.StringIO(u"data:image/png;base64,abc="))
+    assert url_file.decoded_contents == b'i\xb7'
+    assert url_file.native_value == "data:image/png;base64,abc="
+
+
+def test_from_value_accepts_streams():
+    assert DataURLFile.from_value(io.BytesIO(b"data:image/png;base64,abc=")) == "data:image/png;base64,abc="
+
+
+def test_from_stream_raises_on_invalid_data():
+    with pytest.raises(ValueError):
+        DataURLFile.from_stream(io.BytesIO(b"invalid:image/png;base64,abc="))
+    with pytest.raises(ValueError):
+        DataURLFile.from_stream(io.BytesIO(b"data:image/png;base64"))
+    with pytest.raises(ValueError):
+        DataURLFile.from_stream(io.BytesIO(b"data:" + b"a" * 2000 + b";base64,abc="))
+    with pytest.raises(ValueError) as error:
+        DataURLFile.from_stream(io.BytesIO(b"data:text/plain;hex,6869"))
+    assert "only base64 encoded data urls may be streamed" in str(error.value)
+    with pytest.raises(ValueError) as error:
+        DataURLFile.from_stream(io.BytesIO(b"data:text/plain;base64,abcde"))
+    assert "contents are not valid base64" in str(error.value)
+
+
+@pytest.mark.parametrize('payload', [b'', b'a', b'ab', b'abc', b'abcd', bytes(bytearray(range(256))) * 3])
+def test_decoded_size_is_calculated_without_decoding(payload, mocker):
+    url_file = DataURLFile("data:text/plain;base64," + base64.b64encode(payload).decode('ascii'))
+    a2b_base64 = mocker.spy(binascii, 'a2b_base64')
+    assert url_file.decoded_size == len(payload)
+    assert not a2b_base64.called
+    assert url_file._decoded_contents is None
+
+
+def test_decoded_size_ignores_whitespace():
+    encoded = base64.encodebytes(b'z' * 200) if hasattr(base64, 'encodebytes') else base64.encodestring(b'z' * 200)
+    assert DataURLFile(b"data:text/plain;base64," + encoded).decoded_size == 200
+
+
+def test_decoded_size_of_streamed_and_other_encodings():
+    assert DataURLFile.from_stream(_encoded_stream(b'q' * 123)).decoded_size == 123
+    assert DataURLFile("data:text/plain;hex,6869").decoded_size == 2
+
+
+def test_hexdigest_is_calculated_incrementally(mocker):
+    mocker.patch.object(DataURLFile, 'stream_chunk_size', 8)
+    payload = b'some payload to be hashed'
+    url_file = DataURLFile("data:text/plain;base64," + base64.b64encode(payload).decode('ascii'))
+    assert url_file.hexdigest() == hashlib.sha256(payload).hexdigest()
+    assert url_file.hexdigest('md5') == hashlib.md5(payload).hexdigest()
+    assert url_file._decoded_contents is None
+    assert DataURLFile.from_stream(_encoded_stream(payload)).hexdigest() == hashlib.sha256(payload).hexdigest()
+
+
+def test_decoded_size_property_rules():
+    class _M(Model):
+        duf = DataURLFile.property(min_decoded_size=2, max_decoded_size=4)
+
+    instance = _M.mutable()
+    instance.duf = "data:text/plain;base64," + base64.b64encode(b'abc').decode('ascii')
+    instance.validate()
+    instance.duf = "data:text/plain;base64," + base64.b64encode(b'a').decode('ascii')
+    with pytest.raises(ValidationException) as error:
+        instance.validate()
+    assert "DataURLFile min_decoded_size config is 2 however the decoded size is 1" in str(error.value)
+    instance.duf = "data:text/plain;base64," + base64.b64encode(b'abcde').decode('ascii')
+    with pytest.raises(ValidationException) as error:
+        instance.validate()
+    assert "DataURLFile max_decoded_size config is 4 however the decoded size is 5" in str(error.value)
+
+
+def test_checksum_property_rule():
+    payload = b'checked'
+
+    class _M(Model):
+        duf = DataURLFile.property(checksum=('sha256', hashlib.sha256(payload).hexdigest()))
+
+    instance = _M.mutable()
+    instance.duf = "data:text/plain;base64," + base64.b64encode(payload).decode('ascii')
+    instance.validate()
+    instance.duf = "data:text/plain;base64," + base64.b64encode(b'tampered').decode('ascii')
+    with pytest.raises(ValidationException) as error:
+        instance.validate()
+    assert "DataURLFile sha256 checksum is {}, expected {}".format(hashlib.sha256(b'tampered').hexdigest(),
+                                                                   hashlib.sha256(payload).hexdigest()) \
+           in str(error.value)
+
+
+def test_decoded_size_and_checksum_config_check():
+    with pytest.raises(PropertyConfigError):
+        DataURLFile.property(min_decoded_size=5, max_decoded_size=4)
+    with pytest.raises(PropertyConfigError):
+        DataURLFile.property(checksum=('not-an-algorithm', 'abc'))
+    with pytest.raises(PropertyConfigError):
+        DataURLFile.property(checksum='sha256')
+
+
+def test_regex_matches_str_data_urls():
+    match = DataURLFile.regex.match("data:image/png;base64,abc=")
+    assert match.groups() == ('image/png', 'base64', 'abc=')
+
+
+def test_data_urls_are_not_copied_on_construction():
+    encoded = bytearray(b"data:image/png;base64,abc=")
+    assert DataURLFile(encoded).contents_view.obj is encoded
+    text = "data:image/png;base64,abc="
+    url_file = DataURLFile(text)
+    assert url_file._contents is None and url_file.native_value is text
+    assert url_file.contents is url_file.contents == "abc="
+    assert url_file.contents_view == b"abc=" and url_file.decoded_size == 2
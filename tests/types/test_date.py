@@ -65,3 +65,19 @@ def test_native_value():
 def test_to_from_value_invariant():
     my_date = Date(2000, 1, 1)
     assert my_date == Date.from_value(my_date.native_value)
+
+
+def test_from_value_parses_iso_8601_strings():
+    parsed = Date.from_value("2000-02-29")
+    assert isinstance(parsed, Date)
+    assert parsed == date(2000, 2, 29)
+    for value in ["2001-02-29", "2000-2-29", "2000/02/29", "+200-02-29", "2000-02-29T00:00:00"]:
+        with pytest.raises(TypeError):
+            Date.from_value(value)
+
+
+def test_from_ordinals_constructs_many_dates():
+    dates = Date.from_ordinals([date(2000, 1, 1).toordinal(), date(2000, 3, 1).toordinal()])
+    assert dates == [date(2000, 1, 1), date(2000, 3, 1)]
+    assert all(isinstance(each, Date) for each in dates)
+    assert Date.from_ordinals(iter([])) == []
@@ -51,7 +51,7 @@ def test_can_from_value():
     assert DateTime.from_value(datetime(2000, 12, 1, 1, 1, 1, 1, utc)) == datetime(2000, 12, 1, 1, 1, 1, 1, utc)
     with pytest.raises(TypeError) as error:
         DateTime.from_value("no")
-    assert "{} of type {} not coercible to type {}".format("no", str.__name__, DateTime.__name__)
+    assert "{} of type {} not coercible to type {}".format("no", str.__name__, DateTime.__name__) == str(error.value)
 
 
 def test_native_value():
@@ -60,4 +60,34 @@ def test_native_value():
 
 def test_to_from_value_invariant():
     my_datetime = DateTime(2000, 1, 2, 3, 4, 5, 6, utc)
-    assert my_datetime == DateTime.from_value(my_datetime.native_value)
\ No newline at end of file
+    assert my_datetime == DateTime.from_value(my_datetime.native_value)
+
+
+def test_from_value_parses_iso_8601_strings():
+    from datetime import timedelta
+    assert DateTime.from_value("2000-01-02T03:04:05") == datetime(2000, 1, 2, 3, 4, 5)
+    parsed = DateTime.from_value("2000-01-02T03:04:05.25Z")
+    assert isinstance(parsed, DateTime)
+    assert parsed.microsecond == 250000
+    assert parsed.utcoffset() == timedelta(0)
+    offset = DateTime.from_value("2000-01-02 03:04:05.000006-09:30")
+    assert offset.microsecond == 6
+    assert offset.utcoffset() == -timedelta(hours=9, minutes=30)
+    assert offset.tzinfo is DateTime.from_value("2001-01-01T00:00:00-09:30").tzinfo
+
+
+@pytest.mark.parametrize("value", ["2000-01-02", "2000-01-02T03:04", "2000-13-02T03:04:05", "2000-01-02T03:04:05.",
+                                   "2000-01-02T03:04:05.1234567", "2000-01-02T03:04:05+0930", "2000-01-02X03:04:05"])
+def test_from_value_rejects_malformed_iso_8601_strings(value):
+    with pytest.raises(TypeError):
+        DateTime.from_value(value)
+
+
+def test_from_timestamps_constructs_many_datetimes():
+    from datetime import timedelta
+    from prestans3.types.temporal import _tzinfo
+    datetimes = DateTime.from_timestamps([0, 86400.25], _tzinfo(0))
+    assert all(isinstance(each, DateTime) for each in datetimes)
+    assert datetimes[0] == datetime(1970, 1, 1, tzinfo=_tzinfo(0))
+    assert datetimes[1] == datetime(1970, 1, 2, 0, 0, 0, 250000, _tzinfo(0))
+    assert datetimes[1].utcoffset() == timedelta(0)
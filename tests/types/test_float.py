@@ -50,3 +50,29 @@ def test_native_value():
 def test_to_from_value_invariant():
     my_float = Float(1.3)
     assert my_float == Float.from_value(my_float.native_value)
+
+
+def test_int_to_float_coercion_accepts_ints():
+    coerced = Float.coerce(3, 'int_to_float')
+    assert coerced == 3.0
+    assert coerced.__class__ is Float
+    with pytest.raises(TypeError):
+        Float.coerce(3)
+    with pytest.raises(TypeError):
+        Float.coerce(True, 'int_to_float')
+    with pytest.raises(TypeError):
+        Float.coerce('1.5', 'int_to_float')
+
+
+@pytest.mark.parametrize("value, expected", [('1.5', 1.5), (' -2 ', -2.0), ('1.5e3', 1500.0), ('.5', 0.5),
+                                             ('3.', 3.0), (4, 4.0)])
+def test_lenient_coercion_parses_numeric_strings(value, expected):
+    assert Float.coerce(value, 'lenient') == expected
+
+
+@pytest.mark.parametrize("value", ['nan', 'inf', '1,5', '.', 'e3', '1e'])
+def test_lenient_coercion_rejects_non_numeric_strings(value):
+    with pytest.raises(TypeError) as error:
+        Float.coerce(value, 'lenient')
+    assert "{} of type {} not coercible to {}".format(value, value.__class__.__name__, Float.__name__) in \
+           str(error.value)
@@ -63,3 +63,43 @@ def test_can_to_native_value():
 def test_to_from_value_invariant():
     my_int = Integer(42)
     assert my_int == Integer.from_value(my_int.native_value)
+
+
+@pytest.mark.parametrize("value, expected", [(' 42 ', 42), ('-7', -7), ('+3', 3), (5, 5)])
+def test_lenient_coercion_parses_numeric_strings(value, expected):
+    coerced = Integer.coerce(value, 'lenient')
+    assert coerced == expected
+    assert coerced.__class__ is Integer
+
+
+@pytest.mark.parametrize("value", ['1.5', 'abc', '', '4 2', u'٣', 1.0])
+def test_lenient_coercion_rejects_non_integer_values(value):
+    with pytest.raises(ValueError):
+        Integer.coerce(value, 'lenient')
+
+
+def test_coercion_mode_may_be_set_on_subclass():
+    from prestans3.types.number import LENIENT
+
+    class _CsvInteger(Integer):
+        coercion = LENIENT
+
+    assert _CsvInteger.from_value('12').__class__ is _CsvInteger
+    with pytest.raises(ValueError):
+        Integer.from_value('12')
+
+
+def test_coercion_mode_may_be_set_on_property():
+    from prestans3.types import Model
+
+    class _Row(Model):
+        count = Integer.property(coercion='lenient')
+        strict_count = Integer.property()
+
+    row = _Row.mutable()
+    row.count = '42'
+    assert row.count == 42
+    with pytest.raises(ValueError):
+        row.strict_count = '42'
+    with pytest.raises(ValueError):
+        Integer.property(coercion='loose')
@@ -22,6 +22,7 @@ from prestans3.types import Integer, String, Model
 from prestans3.types import Time
 from prestans3.types.data_url_file import DataURLFile
 from prestans3.types.model import ModelValidationException
+from prestans3.types.array import ArrayValidationException
 
 exception_1 = ValidationException(String)
 exception_2 = ValidationException(String)
@@ -597,3 +598,211 @@ def test_from_value_with_non_model_or_dict_raises_type_error():
         _M.from_value(5)
 
     assert "{} of type {} is not coercible to type {}".format(5, int.__name__, _M.__name__) in str(error.value)
+
+
+def test_model_try_from_value_reports_invalid_dicts(mocker):
+    class _Model(Model):
+        name = String.property(max_length=3)
+        count = Integer.property(required=False)
+
+    raise_ = mocker.spy(ModelValidationException, '__init__')
+    assert _Model.try_from_value({'name': 'ham'}).ok
+    result = _Model.try_from_value({'name': 'spam'})
+    assert [summary.path for summary in result.errors] == [('name',)]
+    assert raise_.call_count == 1
+    assert _Model.try_from_value({'count': 1}).errors.messages
+    assert not _Model.try_from_value({'count': 'one'}).ok
+    assert not _Model.try_from_value(['not', 'a', 'dict']).ok
+
+
+def test_model_validate_native_validates_nested_dicts_without_creating_models(mocker):
+    class _Inner(Model):
+        name = String.property(max_length=3)
+        count = Integer.property(required=False, min=0)
+
+    class _Outer(Model):
+        inner = _Inner.property()
+        inners = Array.property(_Inner, max_length=1)
+
+    init = mocker.spy(Model, '__init__')
+    assert _Outer.validate_native({'inner': {'name': 'ham'}, 'inners': [{'name': 'jam', 'count': 1}]}).ok
+    assert not _Outer.validate_native({'inner': {'name': 'spam', 'count': -1}, 'inners': []}).ok
+    assert not init.called
+    result = _Outer.validate_native({'inner': {'name': 'spam', 'count': -1}, 'inners': [{}, {'name': 'egg'}]})
+    assert [(summary.path, len(summary[1])) for summary in result.errors] == [
+        (('inner', 'name'), 1), (('inner', 'count'), 1), (('inners',), 1), (('inners', 0), 1)]
+    assert 'required prestans attribute \'name\'' in str(result.errors[3])
+    assert not _Outer.validate_native({'inner': {'name': 'ham'}, 'inners': [], 'other': 1}).ok
+    assert not _Outer.validate_native({'inners': []}).ok
+    assert not _Outer.validate_native('not a dict').ok
+
+
+def test_model_validate_native_creates_models_with_custom_rules():
+    class _Model(Model):
+        name = String.property()
+
+    def _not_spam(instance, config):
+        if config and instance.name == 'spam':
+            raise ValidationException(instance.__class__, 'spam')
+
+    _Model.register_property_rule(_not_spam, name='not_spam', default=True)
+    assert _Model.validate_native({'name': 'ham'}).ok
+    assert _Model.validate_native({'name': 'spam'}).errors.messages == ['spam']
+
+
+def test_model_validate_native_resolves_attribute_rules_once(mocker):
+    class _Model(Model):
+        name = String.property(max_length=4)
+
+    configured_rules = mocker.spy(String, '_configured_rules')
+    assert all(_Model.validate_native({'name': 'spam'}).ok for _ in range(10))
+    assert not _Model.validate_native({'name': 'toast'}).ok
+    assert configured_rules.call_count == 1
+
+
+def test_model_from_values_creates_models_as_init_does():
+    class _Model(Model):
+        name = String.property(max_length=4)
+        count = Integer.property(default=0)
+        tags = Array.property(String, required=False)
+
+    models = _Model.from_values([{'name': 'spam', 'tags': ['a']}, {'name': 'eggs', 'count': 3}])
+    assert [(model.name, model.count) for model in models] == [('spam', 0), ('eggs', 3)]
+    assert models[0].tags[0] == 'a'
+    assert _Model.from_rows([('ham', None), ('jam', 2)], columns=('name', 'count'))[0].count == 0
+    with pytest.raises(ArrayValidationException) as error:
+        _Model.from_values([{'name': 'spam'}, {'name': 'spam!'}])
+    assert [summary.path for summary in error.value] == [(1, 'name')]
+    assert _Model.from_values([{'name': 'spam!'}], validate=False)[0].name == 'spam!'
+    with pytest.raises(ArrayValidationException) as error:
+        _Model.from_values([{'name': 'spam'}, {'other': 1}])
+    assert [summary.path for summary in error.value] == [(1,)]
+    with pytest.raises(ValueError):
+        _Model.from_rows([(1,)], columns=('other',))
+
+
+def test_model_from_values_keys_creation_errors_by_row():
+    class _Inner(Model):
+        name = String.property(max_length=4)
+        count = Integer.property(required=False)
+
+    class _Model(Model):
+        inner = _Inner.property()
+        count = Integer.property(required=False)
+
+    models = _Model.from_values([{'inner': {'name': 'spam!'}}], validate=False)
+    assert models[0].inner.name == 'spam!'
+    with pytest.raises(ArrayValidationException) as error:
+        _Model.from_values([{'inner': {'name': 'spam'}}, {'inner': {'name': 'spam!'}}])
+    assert [summary.path for summary in error.value] == [(1, 'inner', 'name')]
+    with pytest.raises(ArrayValidationException) as error:
+        _Model.from_values([{'inner': {'name': 'spam'}}, {'inner': {'name': 'eggs', 'count': object()}}],
+                           validate=False)
+    assert [summary.path for summary in error.value] == [(1, 'inner', 'count')]
+    with pytest.raises(ArrayValidationException) as error:
+        _Model.from_rows([({'name': 'spam'}, 1), ({'name': 'eggs'}, object())], columns=('inner', 'count'),
+                         validate=False)
+    assert [summary.path for summary in error.value] == [(1, 'count')]
+
+
+def test_model_from_values_uses_overridden_init():
+    class _Model(Model):
+        name = String.property()
+
+        def __init__(self, initial_values=None, **kwargs):
+            super(_Model, self).__init__(initial_values, **kwargs)
+            self.created = True
+
+    assert _Model.from_values([{'name': 'spam'}])[0].created
+    assert _Model.mutable_class().from_rows([('spam',)], columns=('name',))[0].name == 'spam'
+
+
+def test_model_construct_trusted_stores_values_as_they_are():
+    class _Model(Model):
+        name = String.property(max_length=3, prepare=lambda value: value.upper())
+        count = Integer.property(default=0)
+
+    model = _Model.construct_trusted({'name': String('spam')})
+    assert model.name == 'spam'
+    assert 'count' not in model.prestans_attributes
+    assert not model.validate_result().ok
+    assert _Model.mutable_class().construct_trusted({'count': Integer(1)}, check=True).count == 1
+    with pytest.raises(AssertionError):
+        _Model.construct_trusted({'name': 'spam'}, check=True)
+    with pytest.raises(AssertionError):
+        _Model.construct_trusted({'other': String('spam')}, check=True)
+
+
+def test_lazy_model_creates_container_attributes_on_access(mocker):
+    class _Inner(Model):
+        name = String.property(max_length=3)
+
+    class _Outer(Model):
+        lazy_containers = True
+        title = String.property()
+        inner = _Inner.property()
+        inners = Array.property(_Inner, required=False)
+
+    init = mocker.spy(_Inner, '__init__')
+    outer = _Outer.from_value({'title': 'spam', 'inner': {'name': 'ham'}, 'inners': [{'name': 'jam'}]})
+    assert outer.title == 'spam' and not init.called
+    assert outer.inner.name == 'ham' and init.call_count == 1
+    assert outer.native_value == {'title': 'spam', 'inner': {'name': 'ham'}, 'inners': [{'name': 'jam'}]}
+    assert init.call_count == 2
+
+    invalid = _Outer.from_value({'title': 'spam', 'inner': {'name': 'eggs'}})
+    with pytest.raises(ValidationException) as error:
+        invalid.inner
+    assert [summary.path for summary in error.value] == [('name',)]
+    assert [summary.path for summary in invalid.validate_result().errors] == [('inner', 'name')]
+    with pytest.raises(ValidationException):
+        _Outer.from_value({'inner': {'name': 'ham'}})
+
+
+def test_lazy_model_serializes_only_projected_containers():
+    from prestans3.projection import serialize
+
+    class _Inner(Model):
+        name = String.property(max_length=3)
+
+    class _Outer(Model):
+        lazy_containers = True
+        title = String.property()
+        inner = _Inner.property()
+
+    outer = _Outer.from_value({'title': 'spam', 'inner': {'name': 'eggs'}})
+    assert serialize(outer, 'title') == {'title': 'spam'}
+    assert 'inner' not in outer._prestans_attributes
+
+
+def test_model_try_from_value_locates_nested_errors_from_the_root():
+    class _Inner(Model):
+        name = String.property(max_length=3)
+        count = Integer.property(required=False)
+
+    class _Outer(Model):
+        inner = _Inner.property()
+        inners = Array.property(_Inner, required=False)
+
+    errors = _Outer.try_from_value({'inner': {'name': 'spam'}, 'inners': [{'name': 'ham'}, {'name': 'eggs'}]}).errors
+    assert [summary.path for summary in errors] == [('inner', 'name'), ('inners', 1, 'name')]
+    assert errors.head[0] == '_Outer.inner.name'
+    errors = _Outer.try_from_value({'inner': {'name': 'ham'}, 'inners': [{'name': 'ham', 'count': 'one'}]}).errors
+    assert [summary.path for summary in errors] == [('inners', 0, 'count')]
+    errors = _Outer.try_from_value({'inner': {'name': 'ham', 'other': 1}}).errors
+    assert [summary.path for summary in errors] == [('inner',)]
+
+
+def test_lazy_model_try_from_value_reports_uncoercible_containers():
+    class _Inner(Model):
+        name = String.property(max_length=3)
+
+    class _Outer(Model):
+        lazy_containers = True
+        title = String.property()
+        inner = _Inner.property()
+
+    errors = _Outer.try_from_value({'title': 'spam', 'inner': [1, 2]}).errors
+    assert [summary.path for summary in errors] == [('inner',)]
+    errors = _Outer.try_from_value({'title': 'spam', 'inner': {'name': 'eggs'}}).errors
+    assert [summary.path for summary in errors] == [('inner', 'name')]
@@ -11,6 +11,7 @@
 import pytest
 
 from prestans3.errors import ValidationException
+from prestans3.types import Number
 from prestans3.types import Float
 from prestans3.types import Integer
 from prestans3.types import Model
@@ -51,4 +52,9 @@ def test_max_property_rule_works():
     assert "{} property is {}, however the configured maximum value is {}".format(
         Integer, 2, 1) in str(ex)
     assert "{} property is {}, however the configured maximum value is {}".format(
-        Float, 9.3, 9.26) in str(ex)
\ No newline at end of file
+        Float, 9.3, 9.26) in str(ex)
+
+@pytest.mark.parametrize('value', [5, 1.5, '3'])
+def test_number_from_value_is_not_implemented(value):
+    with pytest.raises(NotImplementedError):
+        Number.from_value(value)
@@ -11,6 +11,8 @@
 import pytest
 
 from prestans3.errors import ValidationException, PropertyConfigError
+from prestans3.regex import FullMatchRegex, LinearRegex
+from prestans3.types import Array
 from prestans3.types import Model
 from prestans3.types import String
 from prestans3.types.string import _prepare_trim, _prepare_normalize_whitespace
@@ -165,3 +167,80 @@ def test_encode_decode_property():
 
 def test_native_value():
     assert String("ok").native_value == "ok"
+
+
+def test_format_regex_is_compiled_when_property_is_created():
+    string_property = String.property(format_regex=r'[abc][123]')
+    assert isinstance(string_property.get_rule_config('format_regex'), FullMatchRegex)
+
+
+def test_format_regex_must_match_whole_string():
+    class _Model(Model):
+        string = String.property(format_regex=r'[abc][123]')
+
+    model = _Model.mutable()
+    model.string = 'a1'
+    model.validate()
+    model.string = 'a12'
+    with pytest.raises(ValidationException) as exception:
+        model.validate()
+    assert 'does not match the format_regex [abc][123]' in str(exception.value)
+
+
+def test_format_regex_can_use_linear_regex():
+    class _Model(Model):
+        string = String.property(format_regex=LinearRegex(r'(a+)+b'))
+
+    model = _Model.mutable()
+    model.string = 'aaab'
+    model.validate()
+    model.string = 'a' * 1000
+    with pytest.raises(ValidationException):
+        model.validate()
+
+
+def test_format_regex_element_rule_is_compiled():
+    array_property = Array.property(String, element_rules={'format_regex': r'[a-z]+'})
+    assert isinstance(array_property._element_rules_config['format_regex'], FullMatchRegex)
+
+
+def test_format_regex_accepts_uncompiled_config_when_validated_directly():
+    String('abc').validate({'format_regex': r'[a-z]+'})
+    with pytest.raises(ValidationException):
+        String('abc1').validate({'format_regex': r'[a-z]+'})
+
+
+def test_trim_before_normalize_whitespace_is_fused():
+    string_property = String.property(prepare=['trim', 'normalize_whitespace'])
+    assert string_property.prepare_process_function is _prepare_normalize_whitespace
+
+    class _M(Model):
+        my_string = String.property(prepare=['trim', 'trim', 'normalize_whitespace'])
+
+    model = _M.mutable()
+    model.my_string = '  hello    world  '
+    assert model.my_string == 'hello world'
+
+
+def test_string_is_a_native_str_subclass_on_python_3():
+    from future.utils import PY3
+    if not PY3:
+        pytest.skip("String is newstr based on Python 2")
+    string = String('spam')
+    assert str in String.__mro__
+    assert string.__class__ is String
+    assert hash(string) == hash('spam')
+    assert String(b'spam', 'utf-8') == 'spam'
+    assert String.from_value(string) is string
+    assert String.from_value('ham').__class__ is String
+    with pytest.raises(TypeError):
+        String.from_value(1)
+
+
+def test_format_regex_accepts_inline_global_flags():
+    class _Model(Model):
+        code = String.property(format_regex=r'(?i)abc')
+
+    assert _Model(initial_values={'code': 'ABC'}).code == 'ABC'
+    with pytest.raises(ValidationException):
+        _Model(initial_values={'code': 'ABCD'})
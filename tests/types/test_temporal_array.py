@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.types.test_temporal_array
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A WSGI compliant REST micro-framework.
+
+    :copyright: (c) 2016 Anomaly Software
+    :license: Apache 2.0, see LICENSE for more details.
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from prestans3.errors import ValidationException
+from prestans3.types import Array, Date, DateTime, Integer, Model, TemporalArray
+from prestans3.types.temporal import _tzinfo
+
+
+def test_temporal_array_stores_dates_as_ordinals():
+    days = TemporalArray(Date, ['2000-01-01', date(2000, 1, 2), datetime(2000, 1, 3, 12)])
+    assert list(days._buffer) == [date(2000, 1, day).toordinal() for day in range(1, 4)]
+    assert days == [date(2000, 1, 1), date(2000, 1, 2), date(2000, 1, 3)]
+    assert days[1].__class__ is Date
+    assert days.last() == date(2000, 1, 3)
+    assert days[0:2] == [date(2000, 1, 1), date(2000, 1, 2)]
+    assert days.tail().__class__ is TemporalArray
+    assert days.drop(2) == [date(2000, 1, 3)]
+    assert days.to_builtin()[0].__class__ is date
+
+
+def test_temporal_array_stores_datetimes_as_epoch_microseconds():
+    times = TemporalArray(DateTime, [datetime(1970, 1, 1, 0, 0, 1, 5), '1969-12-31T23:59:59'])
+    assert list(times._buffer) == [1000005, -1000000]
+    assert times[0] == datetime(1970, 1, 1, 0, 0, 1, 5)
+    assert times[1].__class__ is DateTime
+    aware = TemporalArray(DateTime, ['2000-01-01T10:00:00+10:00', '2000-01-01T11:00:00+10:00'])
+    assert aware[0] == datetime(2000, 1, 1, tzinfo=_tzinfo(0))
+    assert aware[0].utcoffset() == _tzinfo(600).utcoffset(None)
+    assert aware[1].hour == 11
+
+
+def test_temporal_array_rejects_mixed_timezones_and_invalid_values():
+    with pytest.raises(ValueError):
+        TemporalArray(DateTime, ['2000-01-01T10:00:00+10:00', '2000-01-01T10:00:00Z'])
+    with pytest.raises(ValueError):
+        TemporalArray(Date, [date(2000, 1, 1), 'not a date'])
+    with pytest.raises(TypeError):
+        TemporalArray(Integer, [1])
+
+
+@pytest.mark.parametrize("element_rules, failing_index", [
+    ({'after': Date(2000, 1, 1)}, 0),
+    ({'before': Date(2000, 1, 3)}, 2),
+])
+def test_temporal_array_checks_element_rules_over_buffer(mocker, element_rules, failing_index):
+    days = TemporalArray(Date, [date(2000, 1, day) for day in range(1, 4)])
+    decode = mocker.spy(days, '_decode')
+    with pytest.raises(ValidationException) as error:
+        days.validate({'element_rules': element_rules})
+    assert 'TemporalArray[{}]'.format(failing_index) in str(error.value)
+    # only the failing element is created, to build its validation message
+    assert [call[0][0] for call in decode.call_args_list] == [days._buffer[failing_index]]
+
+
+def test_temporal_array_combines_buffer_and_element_batch_rules():
+    days = TemporalArray(Date, [date(2000, 1, day) for day in range(1, 4)])
+    with pytest.raises(ValidationException) as error:
+        days.validate({'element_rules': {'after': Date(2000, 1, 1), 'choices': [date(2000, 1, 1), date(2000, 1, 3)]}})
+    assert 'TemporalArray[0]' in str(error.value)
+
+
+def test_temporal_array_batch_rules_fall_back_for_mismatched_configuration():
+    times = TemporalArray(DateTime, [datetime(2000, 1, 1)])
+    with pytest.raises(TypeError):
+        times.validate({'element_rules': {'after': datetime(1999, 1, 1, tzinfo=_tzinfo(0))}})
+
+
+def test_array_of_temporals_uses_batch_rules():
+    days = Array(Date, [date(2000, 1, day) for day in range(1, 4)])
+    days.validate({'element_rules': {'after': Date(1999, 12, 31), 'before': Date(2000, 1, 4)}})
+    with pytest.raises(ValidationException) as error:
+        days.validate({'element_rules': {'before': Date(2000, 1, 2)}})
+    assert 'Array[1]' in str(error.value)
+
+
+def test_mutable_temporal_array():
+    days = TemporalArray.mutable(Date, [date(2000, 1, 1)])
+    days.append('2000-01-02')
+    days[0] = date(1999, 12, 31)
+    assert days == [date(1999, 12, 31), date(2000, 1, 2)]
+    del days[0]
+    assert days == [date(2000, 1, 2)]
+    with pytest.raises(ValueError):
+        days.append('no')
+
+
+def test_temporal_array_property_wraps_native_lists():
+    class _Model(Model):
+        days = TemporalArray.property(Date, element_rules={'after': Date(2000, 1, 1)})
+
+    model = _Model.mutable()
+    model.days = [date(2000, 1, 2)]
+    assert isinstance(model.days, TemporalArray)
+    model.validate()
+    model.days = [date(2000, 1, 1)]
+    with pytest.raises(ValidationException):
+        model.validate()
+
+
+def test_temporal_array_numpy_round_trip():
+    numpy = pytest.importorskip('numpy')
+    days = TemporalArray(Date, [date(1969, 12, 31), date(2000, 1, 1)])
+    assert days.to_numpy().tolist() == [date(1969, 12, 31), date(2000, 1, 1)]
+    assert TemporalArray.from_numpy(Date, days.to_numpy()) == days
+    times = TemporalArray.from_numpy(DateTime, numpy.array(['2000-01-01T00:00:01'], dtype='datetime64[us]'))
+    assert times == [datetime(2000, 1, 1, 0, 0, 1)]
+
+
+def test_temporal_array_construct_trusted_encodes_without_validating(mocker):
+    from_value = mocker.spy(Date, 'from_value')
+    days = TemporalArray.construct_trusted(Date, [Date(2016, 8, 15), Date(2016, 8, 16)], check=True)
+    assert from_value.call_count == 0
+    assert days[1] == date(2016, 8, 16)
+    assert not days.validate_result({'max_length': 1}).ok
+    with pytest.raises(AssertionError):
+        TemporalArray.construct_trusted(Date, [date(2016, 8, 15)], check=True)
+    aware = timezone(timedelta(hours=10))
+    times = TemporalArray.construct_trusted(DateTime, [DateTime(2000, 1, 1, 10, tzinfo=aware)])
+    assert times == TemporalArray(DateTime, [datetime(2000, 1, 1, tzinfo=timezone.utc)])
+    assert times[0].tzinfo is aware
+
+
+def test_temporal_array_accepts_copy_list():
+    days = [date(2000, 1, 1)]
+    array = TemporalArray(Date, days, copy_list=False)
+    days.append(date(2000, 1, 2))
+    assert array == [date(2000, 1, 1)]
+
+
+def test_temporal_array_accepts_equal_tzinfo_instances():
+    first, second = timezone(timedelta(hours=10)), timezone(timedelta(hours=10))
+    assert first is not second
+    times = TemporalArray(DateTime, [datetime(2000, 1, 1, tzinfo=first), datetime(2000, 1, 2, tzinfo=second)])
+    assert times[1] == datetime(2000, 1, 2, tzinfo=_tzinfo(600))
+    with pytest.raises(ValueError):
+        TemporalArray(DateTime, [datetime(2000, 1, 1, tzinfo=_tzinfo(600)), datetime(2000, 1, 2)])
+
+
+def test_from_numpy_checks_tzinfo():
+    numpy = pytest.importorskip('numpy')
+    with pytest.raises(ValueError):
+        TemporalArray.from_numpy(Date, numpy.array(['2000-01-01'], dtype='datetime64[D]'), tzinfo=_tzinfo(0))
+    with pytest.raises(TypeError):
+        TemporalArray.from_numpy(DateTime, numpy.array(['2000-01-01'], dtype='datetime64[us]'), tzinfo='utc')
@@ -45,3 +45,14 @@ def test_can_from_value_create_time():
 
 def test_native_value():
     assert Time(1, 2, 3, 4, utc).native_value == time(1, 2, 3, 4, utc)
+
+
+def test_from_value_parses_iso_8601_strings():
+    from datetime import timedelta
+    parsed = Time.from_value("23:59:58")
+    assert isinstance(parsed, Time)
+    assert parsed == time(23, 59, 58)
+    assert Time.from_value("01:02:03.4+10:00").utcoffset() == timedelta(hours=10)
+    for value in ["24:00:00", "1:02:03", "01:02", "01:02:03Z1"]:
+        with pytest.raises(TypeError):
+            Time.from_value(value)
@@ -15,6 +15,7 @@ from prestans3.errors import ValidationException
 from prestans3.types import Integer
 from prestans3.types import Model
 from prestans3.types import String, _Property, ImmutableType
+from prestans3.types import _builtin_converters, _builtin_converter_cache, _specialised_builtin_converter_cache
 from prestans3.utils import MergingProxyDictionary
 
 
@@ -219,3 +220,260 @@ def test_resolve_prepare_function_raises_type_error_on_invalid_argument():
 
 def test_no_prepare_argument_does_not_break_code():
     _Property(ImmutableType).prepare_process_function(1)
+
+
+def test_to_builtin_returns_exact_builtin_types():
+    from datetime import date, datetime, time
+    from prestans3.types import Boolean, Float, Date, DateTime, Time
+    for instance, builtin in [(Integer(3), 3), (Float(1.5), 1.5), (String('spam'), 'spam'), (Boolean(True), True),
+                              (Date(2000, 1, 2), date(2000, 1, 2)),
+                              (DateTime(2000, 1, 2, 3, 4, 5, 6), datetime(2000, 1, 2, 3, 4, 5, 6)),
+                              (Time(1, 2, 3, 4), time(1, 2, 3, 4))]:
+        converted = instance.to_builtin()
+        assert converted == builtin
+        assert converted.__class__ is builtin.__class__
+
+
+def test_to_builtin_uses_converter_registered_along_mro(mocker):
+    # the registry and its caches are restored after the test, so the subclass does not affect other tests
+    for registry in (_builtin_converters, _builtin_converter_cache, _specialised_builtin_converter_cache):
+        mocker.patch.dict(registry)
+
+    class __MyInteger(Integer):
+        pass
+
+    assert __MyInteger(5).to_builtin().__class__ is int
+    __MyInteger.register_builtin_converter(lambda instance: int(instance) * 2)
+    assert __MyInteger(5).to_builtin() == 10
+    assert Integer(5).to_builtin() == 5
+
+
+def test_to_builtin_falls_back_to_native_value():
+    class __MyType(ImmutableType):
+        @property
+        def native_value(self):
+            return 'native'
+
+    assert __MyType().to_builtin() == 'native'
+
+
+def test_prepare_process_function_is_composed_once(mocker):
+    class _IM(ImmutableType):
+        pass
+
+    _IM.register_prepare_function(lambda x: x * x, name="square")
+    prop = _IM.property(prepare=['square', lambda x: x + 2])
+    resolve = mocker.spy(prop, '_resolve_prepare_function')
+    assert prop.prepare_process_function is prop.prepare_process_function
+    assert prop.prepare_process_function(3) == 11
+    assert not resolve.called
+
+
+def test_unknown_prepare_function_raises_when_property_is_created():
+    class _IM(ImmutableType):
+        pass
+
+    with pytest.raises(KeyError):
+        _IM.property(prepare=['not here'])
+
+
+def test_repeated_idempotent_prepare_functions_are_fused():
+    class _IM(ImmutableType):
+        pass
+
+    calls = []
+
+    def _absolute(x):
+        calls.append(x)
+        return abs(x)
+
+    _IM.register_prepare_function(_absolute, name="absolute", idempotent=True)
+    prop = _IM.property(prepare=['absolute', 'absolute', _absolute])
+    assert prop.prepare_process_function is _absolute
+    assert prop.prepare_process_function(-2) == 2
+    assert calls == [-2]
+
+
+def test_superseded_prepare_functions_are_fused():
+    class _IM(ImmutableType):
+        pass
+
+    def _floor(x):
+        return x // 1
+
+    def _floor_and_absolute(x):
+        return abs(x // 1)
+
+    _IM.register_prepare_function(_floor, name="floor")
+    _IM.register_prepare_function(_floor_and_absolute, name="floor_and_absolute", supersedes=["floor"])
+    assert _IM.property(prepare=['floor', 'floor_and_absolute']).prepare_process_function is _floor_and_absolute
+    assert _IM.property(prepare=['floor_and_absolute', 'floor']).prepare_process_function(-1.5) == 2
+
+
+def test_register_prepare_function_defaults_name_to_function_name():
+    class _IM(ImmutableType):
+        pass
+
+    def _noop(x):
+        return x
+
+    _IM.register_prepare_function(_noop)
+    assert _IM.prepare_functions['_noop'] is _noop
+
+
+def test_choices_are_indexed_when_property_is_created():
+    from prestans3.choices import Choices
+    prop = Integer.property(choices=list(range(10000)))
+    assert isinstance(prop.rules_config['choices'], Choices)
+    Integer(9999).validate(prop.rules_config)
+    with pytest.raises(ValidationException) as ex:
+        Integer(10000).validate(prop.rules_config)
+    assert "valid choices are [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ... (9990 more)]" in str(ex.value)
+
+
+def test_choices_index_unhashable_choices():
+    from prestans3.choices import Choices
+    sortable = Choices([[2], [1], [3]])
+    assert [1] in sortable
+    assert [4] not in sortable
+    unsortable = Choices([[1], {'a': 1}])
+    assert {'a': 1} in unsortable
+    assert [2] not in unsortable
+    assert unsortable.contains_all([[1], {'a': 1}])
+
+
+def test_choices_may_be_case_folded_and_normalized():
+    from prestans3.choices import Choices
+    prop = String.property(choices=Choices([u'AU', u'Café'], casefold=True, normalize='NFC'))
+    String(u'au').validate(prop.rules_config)
+    String(u'café').validate(prop.rules_config)
+    with pytest.raises(ValidationException):
+        String(u'nz').validate(prop.rules_config)
+    assert Choices([u'AU'], casefold=True).contains_all([u'au', u'Au'])
+
+
+def test_construction_only_validates_when_validation_can_fail():
+    from prestans3.types import Time, _validates_on_construction
+
+    class __MyTime(Time):
+        pass
+
+    assert not _validates_on_construction(__MyTime)
+
+    def _not_midnight(instance, config):
+        if config and instance.hour == 0:
+            raise ValidationException(instance.__class__, "midnight")
+
+    __MyTime.register_property_rule(_not_midnight, name="not_midnight", default=True)
+    assert _validates_on_construction(__MyTime)
+    __MyTime(1)
+    with pytest.raises(ValidationException):
+        __MyTime(0)
+    assert not _validates_on_construction(Time)
+
+
+def test_bulk_temporal_construction_validates_default_rules():
+    from prestans3.types import Date
+
+    class __MyDate(Date):
+        pass
+
+    def _not_epoch(instance, config):
+        if instance.year == 1:
+            raise ValidationException(instance.__class__, "epoch")
+
+    __MyDate.register_property_rule(_not_epoch, name="not_epoch", default=True)
+    assert __MyDate.from_ordinals([800000])[0].__class__ is __MyDate
+    with pytest.raises(ValidationException):
+        __MyDate.from_ordinals([800000, 1])
+
+
+def test_register_coercer_extends_from_value():
+    from decimal import Decimal
+    from prestans3.types import Array, Float
+
+    class __MyFloat(Float):
+        pass
+
+    with pytest.raises(TypeError):
+        __MyFloat.from_value(Decimal('1.5'))
+    __MyFloat.register_coercer(Decimal, lambda of_type, value: of_type(float(value)))
+    coerced = __MyFloat.from_value(Decimal('1.5'))
+    assert coerced == 1.5
+    assert coerced.__class__ is __MyFloat
+    assert Array(__MyFloat, [Decimal('2.5'), 3.5]) == [2.5, 3.5]
+    with pytest.raises(TypeError):
+        Float.from_value(Decimal('1.5'))
+
+
+def test_coercer_is_resolved_along_mro_of_type_and_value():
+    from prestans3.types import _coercer
+
+    class __MyType(ImmutableType):
+        pass
+
+    class __MySubType(__MyType):
+        pass
+
+    class __Source(object):
+        pass
+
+    class __SubSource(__Source):
+        pass
+
+    __MyType.register_coercer(__Source, lambda of_type, value: of_type())
+    assert __MySubType.from_value(__SubSource()).__class__ is __MySubType
+    assert _coercer(__MySubType, __SubSource) is _coercer(__MyType, __Source)
+    __MySubType.register_coercer(__SubSource, lambda of_type, value: None)
+    assert __MyType.from_value(__SubSource()).__class__ is __MyType
+    with pytest.raises(NotImplementedError):
+        __MySubType.from_value(__SubSource())
+
+
+def test_try_from_value_returns_result_instead_of_raising():
+    assert String.try_from_value('spam').unwrap() == 'spam'
+    result = String.try_from_value('spam', {'max_length': 3})
+    assert not result and not result.ok
+    assert result.value == 'spam'
+    assert 'max_length config is 3' in str(result.errors.head)
+    with pytest.raises(ValidationException):
+        result.unwrap()
+    not_coercible = Integer.try_from_value(object())
+    assert not_coercible.value is None and not_coercible.errors.property_type is Integer
+
+
+def test_validate_result_collects_errors_of_overridden_validate():
+    class _String(String):
+        def validate(self, config=None):
+            if config is not None:
+                raise ValidationException(_String, 'invalid when configured')
+
+    class _Model(Model):
+        name = _String.property()
+
+    model = _Model.mutable()
+    model.name = 'spam'
+    result = model.validate_result()
+    assert str(result.errors.head) == '{}.name is invalid: ["invalid when configured"]'.format(model.__class__.__name__)
+
+
+def test_validate_native_checks_rules_without_creating_instances(mocker):
+    new = mocker.spy(String, '__new__')
+    assert String.validate_native('spam', {'max_length': 4}).ok
+    assert not new.called
+    result = String.validate_native('spam', {'max_length': 3})
+    assert result.value == 'spam' and result.value.__class__ is str
+    assert str(result.errors.head) == str(String('spam').validate_result({'max_length': 3}).errors.head)
+    assert not Integer.validate_native('7').ok
+
+
+def test_validate_native_raises_unexpected_rule_errors():
+    class __MyString(String):
+        pass
+
+    def _broken(instance, config):
+        raise KeyError(config)
+
+    __MyString.register_property_rule(_broken, name='broken', default=True)
+    with pytest.raises(KeyError):
+        __MyString.validate_native('spam')